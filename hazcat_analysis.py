@@ -0,0 +1,576 @@
+"""
+Uncertainty and sensitivity studies on the HazCat threshold quantities.
+
+The studies start from the nominal inputs of a HazcatSession (HAZCAT.threshold_quantity_inputs) and evaluate the
+vectorized kernels of hazcat_kernels for many input sets at once, one (samples x radionuclides) array per chunk:
+
+    session = HazcatSession.from_config(config)
+    mc = monte_carlo(session, {'R_HC3': ('lognormal', 1.0, 2.0), 'chi_by_q_hc3': ('uniform', 0.03, 0.1)},
+                     samples=10**6)
+    mc.frame()
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from hazcat_kernels import (hc2_threshold_quantity, hc3_threshold_quantities, sum_of_ratio_category, HC2_CHI_BY_Q,
+                            HC3_CHI_BY_Q, BREATHING_RATE, HC3_PATHWAYS, SOR_CATEGORIES)
+
+# Inputs that can be varied: name -> (per radionuclide, description). Per-radionuclide inputs are given as
+# multiplicative factors of their nominal values (independent for every radionuclide), the others as values.
+UNCERTAIN_INPUTS = {
+    'R_HC2': (True, "HC-2 release fraction (capped at 1)"),
+    'R_HC3': (True, "HC-3 release fraction (capped at 1)"),
+    'BV': (True, "soil-to-plant concentration factor"),
+    'E1': (True, "photon energy per decay"),
+    'dcf_inh': (True, "inhalation dose coefficients (HC-2 public and HC-3 worker)"),
+    'dcf_ing': (True, "ingestion dose coefficient"),
+    'dcf_sub': (True, "submersion dose coefficients"),
+    'chi_by_q_hc2': (False, "HC-2 dispersion coefficient (s/m^3)"),
+    'chi_by_q_hc3': (False, "HC-3 dispersion coefficient (s/m^3)"),
+    'breathing_rate': (False, "respiration rate (m^3/s)"),
+}
+
+# Smallest sampled input, relative to its nominal value: distributions such as 'normal' can draw values <= 0,
+# which have no physical meaning and would give negative or infinite TQs
+MIN_INPUT_FACTOR = 1e-6
+
+# Working memory of one chunk of samples
+CHUNK_BYTES = 256 * 2 ** 20
+
+
+def sample_distribution(spec, size, rng):
+    """
+    Draws samples of a distribution.
+
+    Args:
+        spec (tuple): Distribution and its parameters:
+            ('uniform', low, high), ('loguniform', low, high), ('normal', mean, sd),
+            ('lognormal', median, geometric sd), ('triangular', low, mode, high) or
+            ('choice', values, probabilities), e.g. the ratios between the DCFs of alternative source tables.
+        size (int or tuple): Shape of the samples.
+        rng (np.random.Generator): Random generator.
+
+    Raises:
+        ValueError: For an unknown distribution.
+    """
+    kind, *params = spec
+    if kind == 'uniform':
+        return rng.uniform(params[0], params[1], size)
+    if kind == 'loguniform':
+        return np.exp(rng.uniform(np.log(params[0]), np.log(params[1]), size))
+    if kind == 'normal':
+        return rng.normal(params[0], params[1], size)
+    if kind == 'lognormal':
+        return params[0] * np.exp(np.log(params[1]) * rng.standard_normal(size))
+    if kind == 'triangular':
+        return rng.triangular(params[0], params[1], params[2], size)
+    if kind == 'choice':
+        return rng.choice(np.asarray(params[0], dtype=np.float64), size,
+                          p=params[1] if len(params) > 1 else None)
+    raise ValueError(f"unknown distribution {kind!r}")
+
+
+def check_input_names(names):
+    """
+    Raises:
+        ValueError: If any of `names` is not one of the UNCERTAIN_INPUTS.
+    """
+    unknown = set(names) - set(UNCERTAIN_INPUTS)
+    if unknown:
+        raise ValueError(f"unknown inputs {sorted(unknown)}; choose from {list(UNCERTAIN_INPUTS)}")
+
+
+def threshold_quantities(inputs, values=None):
+    """
+    HC-2 and HC-3 threshold quantities of the nominal inputs with some of the UNCERTAIN_INPUTS replaced.
+
+    Args:
+        inputs (dict): Nominal inputs (HAZCAT.threshold_quantity_inputs) of N radionuclides.
+        values (dict, optional): UNCERTAIN_INPUTS name -> array broadcasting against (S, N): factors for the
+            per-radionuclide inputs, values for the others.
+
+    Returns:
+        tuple: (TQ HC-2 in Ci, TQ HC-3 in Ci), of the broadcast shape.
+
+    Raises:
+        ValueError: For an unknown input name.
+    """
+    tq_hc2_curie, hc3 = threshold_quantity_pathways(inputs, values)
+    return tq_hc2_curie, hc3.tq_hc3_curie
+
+
+def threshold_quantity_pathways(inputs, values=None):
+    """
+    Like threshold_quantities (same arguments), with the HC-3 TQs of every pathway.
+
+    Sampled values are floored at MIN_INPUT_FACTOR times their nominal values, as the release fractions are capped
+    at 1.
+
+    Returns:
+        tuple: (TQ HC-2 in Ci of the broadcast shape, HC3Pathways)
+
+    Raises:
+        ValueError: For an unknown input name.
+    """
+    values = values or {}
+    check_input_names(values)
+    nominal = {'chi_by_q_hc2': HC2_CHI_BY_Q, 'chi_by_q_hc3': HC3_CHI_BY_Q, 'breathing_rate': BREATHING_RATE}
+    values = {name: np.maximum(value, MIN_INPUT_FACTOR * nominal.get(name, 1.0)) for name, value in values.items()}
+
+    def factor(name):
+        return values.get(name, 1.0)
+
+    breathing_rate = values.get('breathing_rate', BREATHING_RATE)
+    tq_hc2_curie, _ = hc2_threshold_quantity(
+        np.minimum(inputs['Rs_HC2'] * factor('R_HC2'), 1.0), inputs['aws'], inputs['half_lives'],
+        inputs['dcf_inh_hc2'] * factor('dcf_inh'), inputs['dcf_sub_hc2'] * factor('dcf_sub'),
+        chi_by_q=values.get('chi_by_q_hc2', HC2_CHI_BY_Q), breathing_rate=breathing_rate)
+    hc3 = hc3_threshold_quantities(
+        np.minimum(inputs['Rs_HC3'] * factor('R_HC3'), 1.0), inputs['aws'], inputs['BVs'] * factor('BV'),
+        inputs['half_lives'], inputs['E1s'] * factor('E1'), inputs['dcf_inh_hc3'] * factor('dcf_inh'),
+        inputs['dcf_ing_hc3'] * factor('dcf_ing'), inputs['dcf_sub_hc3'] * factor('dcf_sub'),
+        chi_by_q=values.get('chi_by_q_hc3', HC3_CHI_BY_Q), breathing_rate=breathing_rate)
+    return tq_hc2_curie, hc3
+
+
+def chunk_length(n_nuclides, chunk_size=None):
+    """Number of samples per chunk: `chunk_size`, or as many as fit in CHUNK_BYTES of kernel temporaries."""
+    if chunk_size is not None:
+        return max(1, int(chunk_size))
+    return max(1, CHUNK_BYTES // (64 * 8 * max(1, n_nuclides)))
+
+
+class LogHistogram:
+    """
+    Streaming percentiles of many columns, from histograms of log10(value / reference).
+
+    With the default 1000 bins per decade, percentiles are resolved to 0.25% of the value; values more than
+    `decades` decades away from the reference fall in under/overflow bins, reported as the smallest/largest value.
+
+    Args:
+        reference (np.ndarray): Typical value of every column (non-positive or non-finite values count as 1).
+    """
+
+    def __init__(self, reference, decades=8, bins_per_decade=1000):
+        reference = np.asarray(reference, dtype=np.float64)
+        self.log_reference = np.log10(np.where(np.isfinite(reference) & (reference > 0), reference, 1.0))
+        self.decades = decades
+        self.bins_per_decade = bins_per_decade
+        self.n_bins = 2 * decades * bins_per_decade
+        self.counts = np.zeros((len(reference), self.n_bins + 2), dtype=np.int64)
+        self.minimum = np.full(len(reference), np.inf)
+        self.maximum = np.full(len(reference), -np.inf)
+
+    def add(self, values):
+        """Adds samples of shape (S, columns); NaN counts as +inf."""
+        values = np.where(np.isnan(values), np.inf, values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            position = (np.log10(values) - self.log_reference + self.decades) * self.bins_per_decade
+        position = np.nan_to_num(np.floor(position), nan=-1, posinf=self.n_bins, neginf=-1)
+        bins = np.clip(position, -1, self.n_bins).astype(np.intp) + 1
+        bins += np.arange(self.counts.shape[0]) * self.counts.shape[1]
+        self.counts += np.bincount(bins.ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+        self.minimum = np.minimum(self.minimum, values.min(axis=0))
+        self.maximum = np.maximum(self.maximum, values.max(axis=0))
+
+    def percentiles(self, q):
+        """Percentiles `q` (0-100) of every column, shape (len(q), columns)."""
+        cumulative = np.cumsum(self.counts, axis=1)
+        rows = np.arange(self.counts.shape[0])
+        out = np.empty((len(q), self.counts.shape[0]))
+        for i, p in enumerate(q):
+            target = np.maximum(p / 100 * cumulative[:, -1], 1e-12)
+            k = np.argmax(cumulative >= target[:, None], axis=1)
+            count = self.counts[rows, k]
+            fraction = (target - (cumulative[rows, k] - count)) / np.maximum(count, 1)
+            log_value = self.log_reference - self.decades + (k - 1 + fraction) / self.bins_per_decade
+            out[i] = np.where(k == 0, self.minimum, np.where(k == self.n_bins + 1, self.maximum, 10 ** log_value))
+        return out
+
+
+@dataclass
+class UncertaintyResult:
+    """
+    Percentiles of the threshold quantities and sums of ratios over the Monte Carlo samples (see monte_carlo).
+
+    Attributes:
+        rads_list (list): Radionuclide names.
+        percentiles (tuple): The percentiles (0-100).
+        samples (int): Number of samples.
+        tq_hc2_curie, tq_hc3_curie (np.ndarray): Shape (percentiles, radionuclides); TQ percentiles (Ci).
+        sor_hc2, sor_hc3 (np.ndarray): Shape (percentiles,); SOR percentiles with the HazCat TQs.
+        category_probability (dict): Fraction of the samples in each SOR category (SOR_CATEGORIES).
+    """
+    rads_list: list
+    percentiles: tuple
+    samples: int
+    tq_hc2_curie: np.ndarray
+    tq_hc3_curie: np.ndarray
+    sor_hc2: np.ndarray
+    sor_hc3: np.ndarray
+    category_probability: dict
+
+    def frame(self):
+        """TQ percentiles, one row per radionuclide."""
+        df = pd.DataFrame({'Radionuclide': self.rads_list})
+        for label, values in (('HC-2', self.tq_hc2_curie), ('HC-3', self.tq_hc3_curie)):
+            for p, row in zip(self.percentiles, values):
+                df[f"TQ {label} P{p:g} (Ci)"] = row
+        return df
+
+    def sor_frame(self):
+        """SOR percentiles, one row per percentile."""
+        return pd.DataFrame({'Percentile': self.percentiles, 'SOR HC-2': self.sor_hc2, 'SOR HC-3': self.sor_hc3})
+
+
+def monte_carlo(session, distributions, inventories=None, samples=10000, percentiles=(5, 50, 95), seed=None,
+                chunk_size=None):
+    """
+    Propagates the uncertainty of the inputs to the HazCat threshold quantities and sums of ratios.
+
+    The samples are evaluated in chunks of (chunk samples x radionuclides) arrays; TQ percentiles are accumulated in
+    log histograms (LogHistogram) and the SOR samples are kept, so memory does not grow with the TQ samples.
+
+    Args:
+        session (HazcatSession): Radionuclides and nominal inputs.
+        distributions (dict): UNCERTAIN_INPUTS name -> distribution spec (see sample_distribution). Per-radionuclide
+            inputs are sampled as factors of the nominal values, independently for every radionuclide.
+        inventories (list, optional): Inventories (Ci) for the sums of ratios. Defaults to the session inventories.
+        samples (int): Number of samples.
+        percentiles (tuple): Percentiles to report (0-100).
+        seed (int, optional): Seed of the random generator.
+        chunk_size (int, optional): Samples per chunk (default: sized by CHUNK_BYTES).
+
+    Returns:
+        UncertaintyResult: The percentiles.
+    """
+    check_input_names(distributions)
+    inputs = session.threshold_quantity_inputs()
+    n = len(session.rads_list)
+    inventories = np.asarray(session.result.inventories if inventories is None else inventories, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    hc2_histogram = LogHistogram(session.result.tq_hc2_curie)
+    hc3_histogram = LogHistogram(session.result.tq_hc3_curie)
+    sor_hc2 = np.empty(samples)
+    sor_hc3 = np.empty(samples)
+
+    chunk = chunk_length(n, chunk_size)
+    for start in range(0, samples, chunk):
+        size = min(chunk, samples - start)
+        values = {name: sample_distribution(spec, (size, n if UNCERTAIN_INPUTS[name][0] else 1), rng)
+                  for name, spec in distributions.items()}
+        # An HC-level whose inputs are not sampled keeps the nominal (radionuclides,) shape
+        tq_hc2_curie, tq_hc3_curie = (np.broadcast_to(tq, (size, n)) for tq in threshold_quantities(inputs, values))
+        hc2_histogram.add(tq_hc2_curie)
+        hc3_histogram.add(tq_hc3_curie)
+        sor_hc2[start:start + size] = (inventories / tq_hc2_curie).sum(axis=1)
+        sor_hc3[start:start + size] = (inventories / tq_hc3_curie).sum(axis=1)
+
+    categories = sum_of_ratio_category(sor_hc2, sor_hc3)
+    return UncertaintyResult(
+        rads_list=list(session.rads_list), percentiles=tuple(percentiles), samples=samples,
+        tq_hc2_curie=hc2_histogram.percentiles(percentiles), tq_hc3_curie=hc3_histogram.percentiles(percentiles),
+        sor_hc2=np.percentile(sor_hc2, percentiles), sor_hc3=np.percentile(sor_hc3, percentiles),
+        category_probability={category: float(np.mean(categories == category)) for category in SOR_CATEGORIES})
+
+
+# Outputs of the sensitivity analyses, per radionuclide
+SENSITIVITY_OUTPUTS = ('TQ HC-2', 'TQ HC-3') + HC3_PATHWAYS
+
+
+def scale_unit_samples(unit, ranges):
+    """
+    Maps samples of the unit hypercube (S, D) to the input ranges.
+
+    Args:
+        unit (np.ndarray): Samples in [0, 1], one column per input of `ranges`.
+        ranges (dict): UNCERTAIN_INPUTS name -> (low, high), ('uniform', low, high) or ('loguniform', low, high);
+            factors for the per-radionuclide inputs, values for the others.
+
+    Returns:
+        dict: Input name -> values of shape (S, 1), shared by all radionuclides.
+
+    Raises:
+        ValueError: For an unknown input or a range that is not uniform or log-uniform.
+    """
+    check_input_names(ranges)
+    values = {}
+    for column, (name, spec) in enumerate(ranges.items()):
+        kind, low, high = spec if len(spec) == 3 else ('uniform',) + tuple(spec)
+        u = unit[:, column:column + 1]
+        if kind == 'uniform':
+            values[name] = low + u * (high - low)
+        elif kind == 'loguniform':
+            values[name] = np.exp(np.log(low) + u * (np.log(high) - np.log(low)))
+        else:
+            raise ValueError(f"sensitivity ranges must be uniform or loguniform, not {kind!r} ({name})")
+    return values
+
+
+def sensitivity_outputs(inputs, ranges, unit, chunk_size=None):
+    """
+    log10 of every SENSITIVITY_OUTPUTS quantity for the design points `unit` (S, D).
+
+    Every input factor is shared by all radionuclides; as the TQs of a radionuclide depend only on its own inputs,
+    the indices per radionuclide are those of independent factors. Each chunk of design points is one batched
+    kernel evaluation.
+
+    Returns:
+        np.ndarray: Shape (S, N, len(SENSITIVITY_OUTPUTS)); inf for pathways that do not apply.
+    """
+    n = len(inputs['aws'])
+    outputs = np.empty((len(unit), n, len(SENSITIVITY_OUTPUTS)))
+    chunk = chunk_length(n * len(SENSITIVITY_OUTPUTS), chunk_size)
+    for start in range(0, len(unit), chunk):
+        block = slice(start, start + chunk)
+        tq_hc2_curie, hc3 = threshold_quantity_pathways(inputs, scale_unit_samples(unit[block], ranges))
+        outputs[block, :, 0] = tq_hc2_curie
+        outputs[block, :, 1] = hc3.tq_hc3_curie
+        outputs[block, :, 2:] = hc3.tq_curie
+    with np.errstate(divide='ignore'):
+        return np.log10(outputs)
+
+
+def saltelli_design(samples, dimensions, rng):
+    """
+    Saltelli design: matrices A and B (samples x dimensions) of the unit hypercube and, for every input i, A with
+    column i taken from B.
+
+    Returns:
+        np.ndarray: Shape (samples * (dimensions + 2), dimensions): A, B, then the dimensions A_B^i blocks.
+    """
+    A = rng.random((samples, dimensions))
+    B = rng.random((samples, dimensions))
+    blocks = [A, B]
+    for i in range(dimensions):
+        AB = A.copy()
+        AB[:, i] = B[:, i]
+        blocks.append(AB)
+    return np.concatenate(blocks)
+
+
+def sensitivity_frame(rads_list, names, columns):
+    """Long table of indices: one row per radionuclide, output and input; `columns` maps to (D, N, outputs) arrays."""
+    d, n, m = len(names), len(rads_list), len(SENSITIVITY_OUTPUTS)
+    frame = pd.DataFrame({
+        'Radionuclide': np.tile(np.repeat(np.asarray(rads_list, dtype=object), m), d),
+        'Output': np.tile(np.asarray(SENSITIVITY_OUTPUTS, dtype=object), d * n),
+        'Input': np.repeat(np.asarray(names, dtype=object), n * m),
+    })
+    for label, values in columns.items():
+        frame[label] = values.reshape(-1)
+    return frame
+
+
+def sobol_indices(session, ranges, samples=1024, seed=None, chunk_size=None):
+    """
+    First-order and total-order Sobol indices of log10 of the threshold quantities, per radionuclide and pathway.
+
+    Uses a Saltelli design of samples * (D + 2) points (random base samples) with the Saltelli (2010) first-order
+    and the Jansen total-order estimators.
+
+    Args:
+        session (HazcatSession): Radionuclides and nominal inputs.
+        ranges (dict): UNCERTAIN_INPUTS name -> range (see scale_unit_samples).
+        samples (int): Base samples.
+        seed (int, optional): Seed of the random generator.
+        chunk_size (int, optional): Design points per kernel evaluation (default: sized by CHUNK_BYTES).
+
+    Returns:
+        pd.DataFrame: One row per radionuclide, output (SENSITIVITY_OUTPUTS) and input with the columns 'S1' and
+        'ST'. Outputs that do not vary or do not apply (infinite pathway TQs) have NaN indices.
+    """
+    names = list(ranges)
+    d = len(names)
+    design = saltelli_design(samples, d, np.random.default_rng(seed))
+    y = sensitivity_outputs(session.threshold_quantity_inputs(), ranges, design, chunk_size)
+    y = y.reshape(d + 2, samples, *y.shape[1:])
+    with np.errstate(invalid='ignore'):
+        # Centered outputs: the estimators are unbiased either way, but far less noisy around a zero mean
+        y = y - np.concatenate([y[0], y[1]]).mean(axis=0)
+    f_A, f_B, f_AB = y[0], y[1], y[2:]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = np.var(np.concatenate([f_A, f_B]), axis=0)
+        variance = np.where(variance > 0, variance, np.nan)
+        first = np.mean(f_B * (f_AB - f_A), axis=1) / variance
+        total = 0.5 * np.mean((f_A - f_AB) ** 2, axis=1) / variance
+    return sensitivity_frame(session.rads_list, names, {'S1': first, 'ST': total})
+
+
+def morris_design(trajectories, dimensions, levels, rng):
+    """
+    Morris one-at-a-time design: every trajectory starts at a random grid point of the `levels`-level grid and
+    moves every input once, in random order, by delta = levels / (2 (levels - 1)).
+
+    Returns:
+        tuple: (points of shape (trajectories * (dimensions + 1), dimensions), input order of shape
+        (trajectories, dimensions), delta)
+    """
+    delta = levels / (2 * (levels - 1))
+    grid = np.arange(levels // 2) / (levels - 1)          # starting levels that stay inside [0, 1] after +delta
+    start = rng.choice(grid, (trajectories, dimensions))
+    order = np.argsort(rng.random((trajectories, dimensions)), axis=1)
+    steps = np.zeros((trajectories, dimensions + 1, dimensions))
+    rows = np.arange(trajectories)
+    for k in range(dimensions):
+        steps[:, k + 1] = steps[:, k]
+        steps[rows, k + 1, order[:, k]] = delta
+    return (start[:, None, :] + steps).reshape(-1, dimensions), order, delta
+
+
+def morris_screening(session, ranges, trajectories=20, levels=4, seed=None, chunk_size=None):
+    """
+    Morris elementary effects of the inputs on log10 of the threshold quantities, per radionuclide and pathway.
+
+    Args:
+        session (HazcatSession): Radionuclides and nominal inputs.
+        ranges (dict): UNCERTAIN_INPUTS name -> range (see scale_unit_samples).
+        trajectories (int): Number of trajectories; the design has trajectories * (D + 1) points.
+        levels (int): Number of grid levels (even).
+        seed (int, optional): Seed of the random generator.
+        chunk_size (int, optional): Design points per kernel evaluation (default: sized by CHUNK_BYTES).
+
+    Returns:
+        pd.DataFrame: One row per radionuclide, output (SENSITIVITY_OUTPUTS) and input with the columns 'mu_star'
+        (mean absolute elementary effect), 'mu' and 'sigma', in log10 units per unit of the scaled input range.
+    """
+    names = list(ranges)
+    d = len(names)
+    design, order, delta = morris_design(trajectories, d, levels, np.random.default_rng(seed))
+    y = sensitivity_outputs(session.threshold_quantity_inputs(), ranges, design, chunk_size)
+    y = y.reshape(trajectories, d + 1, *y.shape[1:])
+
+    with np.errstate(invalid='ignore'):
+        steps = (y[:, 1:] - y[:, :-1]) / delta                     # (trajectories, D, N, outputs), in step order
+    effects = np.empty_like(steps)
+    effects[np.arange(trajectories)[:, None], order] = steps       # back to input order
+    with np.errstate(invalid='ignore'):
+        columns = {'mu_star': np.abs(effects).mean(axis=0), 'mu': effects.mean(axis=0),
+                   'sigma': effects.std(axis=0, ddof=1) if trajectories > 1 else np.full(effects.shape[1:], np.nan)}
+    return sensitivity_frame(session.rads_list, names, columns)
+
+
+@dataclass
+class SweepResult:
+    """
+    Labeled N-D result of parameter_sweep, laid out like an xarray Dataset: every variable has its own dimensions.
+
+    Attributes:
+        coords (dict): Dimension name -> coordinate values (the swept parameters, 'nuclide' and 'pathway').
+        variables (dict): Variable name -> (dimension names, np.ndarray).
+    """
+    coords: dict
+    variables: dict
+
+    def __getitem__(self, name):
+        return self.variables[name][1]
+
+    def dims(self, name):
+        return self.variables[name][0]
+
+    def sel(self, name, **indexers):
+        """
+        Values of a variable at the given coordinates: nearest value for the swept parameters, label for
+        'nuclide' and 'pathway'. Dimensions without an indexer are kept.
+        """
+        dims, values = self.variables[name]
+        index = []
+        for dim in dims:
+            if dim not in indexers:
+                index.append(slice(None))
+            elif dim in ('nuclide', 'pathway'):
+                index.append(list(self.coords[dim]).index(indexers[dim]))
+            else:
+                index.append(int(np.argmin(np.abs(self.coords[dim] - indexers[dim]))))
+        return values[tuple(index)]
+
+    def to_frame(self, name):
+        """A variable as a long DataFrame, one row per combination of its coordinates."""
+        dims, values = self.variables[name]
+        if not dims:
+            return pd.DataFrame({name: [values]})
+        index = pd.MultiIndex.from_product([self.coords[dim] for dim in dims], names=dims)
+        return pd.DataFrame({name: np.asarray(values).ravel()}, index=index).reset_index()
+
+    def to_xarray(self):
+        """The result as an xarray.Dataset (requires xarray)."""
+        import xarray as xr
+
+        return xr.Dataset({name: (dims, values) for name, (dims, values) in self.variables.items()},
+                          coords=self.coords)
+
+
+def parameter_sweep(session, chi_by_q_hc2=None, chi_by_q_hc3=None, breathing_rate=None, R_HC2=None, R_HC3=None,
+                    inventories=None):
+    """
+    Threshold quantities and sums of ratios over the Cartesian product of parameter grids.
+
+    Every grid becomes one dimension of the result and the kernels are evaluated once for HC-2 and once for HC-3 on
+    the broadcast grids. HC-2 variables span the chi_by_q_hc2, breathing_rate and R_HC2 dimensions, HC-3 variables
+    the chi_by_q_hc3, breathing_rate and R_HC3 dimensions. Parameters without a grid keep their nominal values and
+    add no dimension.
+
+    Args:
+        session (HazcatSession): Radionuclides and nominal inputs.
+        chi_by_q_hc2, chi_by_q_hc3 (array-like, optional): Dispersion coefficients (s/m^3).
+        breathing_rate (array-like, optional): Respiration rates (m^3/s).
+        R_HC2, R_HC3 (array-like, optional): Release fractions, applied to every radionuclide.
+        inventories (list, optional): Inventories (Ci) for the sums of ratios. Defaults to the session inventories.
+
+    Returns:
+        SweepResult: Variables 'tq_hc2_curie', 'tq_hc2_gram', 'sor_hc2', 'tq_hc3_curie', 'tq_hc3_gram',
+        'tq_pathway_curie', 'dominant_pathway' and 'sor_hc3'.
+
+    Raises:
+        ValueError: If a release fraction is not in (0, 1].
+    """
+    inputs = session.threshold_quantity_inputs()
+    inventories = np.asarray(session.result.inventories if inventories is None else inventories, dtype=np.float64)
+    grids = {name: np.atleast_1d(np.asarray(values, dtype=np.float64))
+             for name, values in (('chi_by_q_hc2', chi_by_q_hc2), ('chi_by_q_hc3', chi_by_q_hc3),
+                                  ('breathing_rate', breathing_rate), ('R_HC2', R_HC2), ('R_HC3', R_HC3))
+             if values is not None}
+    for name in ('R_HC2', 'R_HC3'):
+        if name in grids and not np.all((grids[name] > 0) & (grids[name] <= 1)):
+            raise ValueError(f"{name} release fractions must be in (0, 1], got {grids[name].tolist()}")
+
+    def layout(parameters):
+        dims = tuple(name for name in parameters if name in grids)
+
+        def grid(name, default):
+            if name not in grids:
+                return default
+            shape = [1] * (len(dims) + 1)
+            shape[dims.index(name)] = -1
+            return grids[name].reshape(shape)
+        return dims, grid
+
+    hc2_dims, grid = layout(('chi_by_q_hc2', 'breathing_rate', 'R_HC2'))
+    tq_hc2_curie, tq_hc2_gram = hc2_threshold_quantity(
+        grid('R_HC2', inputs['Rs_HC2']), inputs['aws'], inputs['half_lives'], inputs['dcf_inh_hc2'],
+        inputs['dcf_sub_hc2'], chi_by_q=grid('chi_by_q_hc2', HC2_CHI_BY_Q),
+        breathing_rate=grid('breathing_rate', BREATHING_RATE))
+
+    hc3_dims, grid = layout(('chi_by_q_hc3', 'breathing_rate', 'R_HC3'))
+    hc3 = hc3_threshold_quantities(
+        grid('R_HC3', inputs['Rs_HC3']), inputs['aws'], inputs['BVs'], inputs['half_lives'], inputs['E1s'],
+        inputs['dcf_inh_hc3'], inputs['dcf_ing_hc3'], inputs['dcf_sub_hc3'],
+        chi_by_q=grid('chi_by_q_hc3', HC3_CHI_BY_Q), breathing_rate=grid('breathing_rate', BREATHING_RATE))
+
+    coords = {**grids, 'nuclide': np.asarray(session.rads_list, dtype=object),
+              'pathway': np.asarray(HC3_PATHWAYS, dtype=object)}
+    variables = {
+        'tq_hc2_curie': (hc2_dims + ('nuclide',), tq_hc2_curie),
+        'tq_hc2_gram': (hc2_dims + ('nuclide',), tq_hc2_gram),
+        'sor_hc2': (hc2_dims, (inventories / tq_hc2_curie).sum(axis=-1)),
+        'tq_hc3_curie': (hc3_dims + ('nuclide',), hc3.tq_hc3_curie),
+        'tq_hc3_gram': (hc3_dims + ('nuclide',), hc3.tq_hc3_gram),
+        'tq_pathway_curie': (hc3_dims + ('nuclide', 'pathway'), hc3.tq_curie),
+        'dominant_pathway': (hc3_dims + ('nuclide',), np.asarray(HC3_PATHWAYS, dtype=object)[hc3.dominant]),
+        'sor_hc3': (hc3_dims, (inventories / hc3.tq_hc3_curie).sum(axis=-1)),
+    }
+    return SweepResult(coords=coords, variables=variables)
@@ -0,0 +1,408 @@
+"""
+Regression benchmark on the DOE-STD-1027-2018 Attachment 1 table.
+
+Every radionuclide of the `thresholds` sheet of library/doe_haz_cat_excel.xlsx is recomputed with HazCat. The
+benchmark records wall time, the time of every pipeline stage and peak memory, together with statistics of the
+HazCat to DOE threshold ratios per limiting pathway, and writes them as JSON so that throughput and accuracy can be
+tracked across releases:
+
+    python hazcat_benchmark.py --output benchmark.json
+    python hazcat_benchmark.py --baseline benchmark.json     # compare with an earlier run
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+BENCHMARK_FORMAT = 1
+
+# DOE-STD-1027-2018 limiting pathway codes -> HazCat HC-3 pathway
+DOE_PATHWAYS = {
+    'Inhalation': 'Inhalation',
+    'Inhalation-D': 'Inhalation',
+    'Food': 'Food ingestion',
+    'Water': 'Water ingestion',
+    'Direct Exposure': 'Direct exposure',
+    'Submersion': 'Submersion',
+}
+
+
+@contextlib.contextmanager
+def timed(stages, name):
+    """Adds the wall time (s) of the block to stages[name]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
+
+
+def doe_radionuclides():
+    """Radionuclides of the DOE-STD-1027-2018 thresholds sheet, in table order."""
+    from hazcat_library import library_cache, DOE_TQ_WORKBOOK
+
+    df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='thresholds').dropna(axis=0, how='all')
+    return list(dict.fromkeys(df_tq['Radionuclide'].astype(str)))
+
+
+def load_library(stages):
+    """Loads the process-wide library data, timing every part."""
+    from hazcat_class import HAZCAT
+    from hazcat_library import (library_cache, load_dcf_library, load_nuclide_table, load_mass_table,
+                                load_decay_graph, DOE_TQ_WORKBOOK)
+
+    with timed(stages, 'load_dcf_library'):
+        load_dcf_library()
+    with timed(stages, 'load_nuclide_table'):
+        load_nuclide_table(HAZCAT({'inventories': [], 'rads_list': [], 'output_filename': None}).build_nuclide_records)
+    with timed(stages, 'load_mass_table'):
+        load_mass_table()
+    with timed(stages, 'load_decay_graph'):
+        load_decay_graph()
+    with timed(stages, 'load_doe_workbook'):
+        for sheet_name in ('thresholds', 'r_bv'):
+            library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name=sheet_name)
+
+
+def staged_run(rads_list, stages):
+    """
+    The steps of HAZCAT.compute_nuclide_records and compute_hazcat_result for `rads_list`, each timed.
+    """
+    from hazcat_class import HAZCAT
+
+    hazcat = HAZCAT({'inventories': [0.0] * len(rads_list), 'rads_list': rads_list, 'output_filename': None})
+    with timed(stages, 'dcf_screening'):
+        dcfs = hazcat.compute_max_dcf_batch(rads_list)
+    with timed(stages, 'dcf_provenance'):
+        hazcat.get_dcf_provenance(rads_list)
+    with timed(stages, 'nuclide_properties'):
+        half_lives = hazcat.halflives_lambda_rads_from_rads_list()[0]
+        aws = hazcat.find_aws()
+        E1s = hazcat.get_E1_from_TableA1_ICRP_107()
+        BVs = hazcat.get_bv()
+    with timed(stages, 'release_fractions'):
+        Rs_HC2 = hazcat.get_R_HC2()
+        Rs_HC3 = hazcat.get_R_HC3()
+    with timed(stages, 'tq_hc2'):
+        hazcat.compute_threshold_quantity_HC2_in_gram_and_curie(Rs_HC2, aws, half_lives, dcfs)
+    with timed(stages, 'tq_hc3'):
+        hazcat.compute_hc3_pathways(Rs_HC3, aws, BVs, half_lives, E1s, dcfs)
+    with timed(stages, 'doe_thresholds'):
+        hazcat.read_us_doe_std_1027_2018_thresholds(rads_list)
+
+
+def ratio_statistics(ratios):
+    """
+    Summary of HazCat / DOE ratios; only finite positive ratios are compared.
+    """
+    ratios = np.asarray(ratios, dtype=np.float64)
+    compared = ratios[np.isfinite(ratios) & (ratios > 0)]
+    stats = {'count': int(ratios.size), 'compared': int(compared.size)}
+    if compared.size:
+        log_ratio = np.log10(compared)
+        stats.update({
+            'median': float(np.median(compared)),
+            'geometric_mean': float(10 ** log_ratio.mean()),
+            'p5': float(np.percentile(compared, 5)),
+            'p95': float(np.percentile(compared, 95)),
+            'min': float(compared.min()),
+            'max': float(compared.max()),
+            'within_10_percent': float(np.mean(np.abs(compared - 1) <= 0.1)),
+            'within_factor_2': float(np.mean(np.abs(log_ratio) <= np.log10(2))),
+        })
+    return stats
+
+
+def accuracy(result):
+    """Ratio statistics of a HazcatResult against its DOE thresholds, overall and per DOE limiting pathway."""
+    from hazcat_kernels import HC3_PATHWAYS
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hc2_ratio = result.tq_hc2_curie / result.doe_hc2_curie
+        hc3_ratio = result.tq_hc3_curie / result.doe_hc3_curie
+    doe_pathway = pd.Series(result.doe_pathway).fillna('').astype(str).to_numpy()
+    dominant = result.dominant_pathway
+    expected = np.array([DOE_PATHWAYS.get(p, '') for p in doe_pathway], dtype=object)
+    comparable = expected != ''
+
+    pathways = {}
+    for label in sorted(set(doe_pathway) - {''}):
+        rows = doe_pathway == label
+        entry = {'count': int(rows.sum()), 'hc3': ratio_statistics(hc3_ratio[rows])}
+        if label in DOE_PATHWAYS:
+            # The HazCat TQ of the same pathway against the DOE HC-3 TQ
+            column = HC3_PATHWAYS.index(DOE_PATHWAYS[label])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                entry['pathway'] = ratio_statistics(result.hc3.tq_curie[rows, column] / result.doe_hc3_curie[rows])
+            entry['dominant_pathway_agreement'] = float(np.mean(dominant[rows] == DOE_PATHWAYS[label]))
+        pathways[label] = entry
+
+    return {
+        'hc2': ratio_statistics(hc2_ratio),
+        'hc3': ratio_statistics(hc3_ratio),
+        'dominant_pathway_agreement': float(np.mean(dominant[comparable] == expected[comparable])),
+        'pathways': pathways,
+    }
+
+
+def nuclide_details(result):
+    """Per-radionuclide TQs and DOE values (for the JSON with --details)."""
+    return [{'nuclide': rad, 'tq_hc2_curie': float(hc2), 'doe_hc2_curie': float(doe_hc2),
+             'tq_hc3_curie': float(hc3), 'doe_hc3_curie': float(doe_hc3), 'dominant_pathway': str(dominant),
+             'doe_pathway': str(doe_pathway)}
+            for rad, hc2, doe_hc2, hc3, doe_hc3, dominant, doe_pathway in zip(
+                result.rads_list, result.tq_hc2_curie, result.doe_hc2_curie, result.tq_hc3_curie,
+                result.doe_hc3_curie, result.dominant_pathway, result.doe_pathway)]
+
+
+def logging_benchmark(nuclides=200):
+    """
+    Time of the per-nuclide DCF screening (HAZCAT.compute_max_dcf) of the first `nuclides` radionuclides of the
+    table at DEBUG, which formats the diagnostic dumps as the former print calls did, and at INFO. The log output is
+    captured and discarded; the logging configuration is reset to the default afterwards.
+
+    Returns:
+        dict: 'nuclides', 'skipped' (nuclides the single-nuclide screening fails on), 'debug_s', 'info_s',
+        'saved_fraction' and 'debug_output_bytes'.
+    """
+    from hazcat_class import HAZCAT
+    from hazcat_logging import configure_logging
+
+    rads_list = doe_radionuclides()[:nuclides]
+    hazcat = HAZCAT({'inventories': [0.0] * len(rads_list), 'rads_list': rads_list, 'output_filename': None})
+
+    # Warm-up pass, which also finds the nuclides to time
+    screened = []
+    configure_logging('INFO')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for rad in rads_list:
+            try:
+                hazcat.compute_max_dcf(rad)
+                screened.append(rad)
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    seconds, output_bytes = {}, {}
+    try:
+        for level in ('DEBUG', 'INFO'):
+            configure_logging(level)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                start = time.perf_counter()
+                for rad in screened:
+                    hazcat.compute_max_dcf(rad)
+                seconds[level] = time.perf_counter() - start
+            output_bytes[level] = len(output.getvalue())
+    finally:
+        configure_logging()
+    return {'nuclides': len(screened), 'skipped': len(rads_list) - len(screened), 'debug_s': seconds['DEBUG'],
+            'info_s': seconds['INFO'], 'saved_fraction': 1 - seconds['INFO'] / seconds['DEBUG'],
+            'debug_output_bytes': output_bytes['DEBUG']}
+
+
+def json_value(value):
+    """Strict JSON: non-finite floats become None."""
+    if isinstance(value, dict):
+        return {k: json_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [json_value(v) for v in value]
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def run_benchmark(nuclides=None, trace_memory=True, details=False):
+    """
+    Recomputes the HazCat TQs of the DOE-STD-1027-2018 table and measures time, memory and accuracy.
+
+    The nuclide memo is bypassed, so every run pays the full computation. Diagnostic output of the pipeline is
+    discarded.
+
+    Args:
+        nuclides (int, optional): Only the first `nuclides` radionuclides of the table (for quick runs).
+        trace_memory (bool): Repeat the computation under tracemalloc to record the peak traced memory.
+        details (bool): Include the per-radionuclide values.
+
+    Returns:
+        dict: The benchmark record (see the module docstring).
+    """
+    from hazcat_cache import library_fingerprint
+    from hazcat_class import HAZCAT
+    from hazcat_profile import profiler
+
+    library_stages, stages = {}, {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        with timed(library_stages, 'total'):
+            load_library(library_stages)
+        rads_list = doe_radionuclides()[:nuclides]
+        config = {'inventories': [0.0] * len(rads_list), 'rads_list': rads_list, 'output_filename': None}
+
+        with profiler.profiling():
+            start = time.perf_counter()
+            result = HAZCAT(config).compute_hazcat_result(use_memo=False)
+            end_to_end = time.perf_counter() - start
+        pipeline_stages = {path: entry['total_s'] for path, entry in profiler.to_dict()['stages'].items()}
+
+        staged_run(rads_list, stages)
+
+        peak_traced = None
+        if trace_memory:
+            tracemalloc.start()
+            HAZCAT(config).compute_hazcat_result(use_memo=False)
+            peak_traced = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    record = {
+        'format': BENCHMARK_FORMAT,
+        'benchmark': 'DOE-STD-1027-2018 Attachment 1',
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'library_fingerprint': library_fingerprint(),
+        'nuclides': len(rads_list),
+        'timing': {
+            'library_load_s': library_stages.pop('total'),
+            'library_stages_s': library_stages,
+            'end_to_end_s': end_to_end,
+            'nuclides_per_s': len(rads_list) / end_to_end,
+            'stages_s': stages,
+            'pipeline_stages_s': pipeline_stages,
+        },
+        'memory': {
+            'peak_traced_mb': None if peak_traced is None else peak_traced / 2 ** 20,
+            # ru_maxrss is in kB on Linux, in bytes on macOS
+            'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2 ** 20 if sys.platform == 'darwin'
+                                                                                 else 2 ** 10),
+        },
+        'accuracy': accuracy(result),
+    }
+    if details:
+        record['details'] = nuclide_details(result)
+    return json_value(record)
+
+
+def compare(baseline, current, time_tolerance=0.25, ratio_tolerance=0.01):
+    """
+    Differences of a benchmark record from a baseline beyond the tolerances.
+
+    Args:
+        time_tolerance (float): Allowed relative slowdown of the end-to-end time.
+        ratio_tolerance (float): Allowed relative change of the median and geometric mean ratios and of the
+            fraction of ratios within 10%.
+
+    Returns:
+        list: Messages, one per regression (empty when within the tolerances).
+    """
+    messages = []
+    before, after = baseline['timing']['end_to_end_s'], current['timing']['end_to_end_s']
+    if after > before * (1 + time_tolerance):
+        messages.append(f"end-to-end time {before:.2f} s -> {after:.2f} s")
+    if baseline['nuclides'] != current['nuclides']:
+        messages.append(f"nuclides {baseline['nuclides']} -> {current['nuclides']}")
+
+    def stats_of(record):
+        acc = record['accuracy']
+        yield 'hc2', acc['hc2']
+        yield 'hc3', acc['hc3']
+        for label, entry in acc['pathways'].items():
+            yield f"{label} hc3", entry['hc3']
+            if 'pathway' in entry:
+                yield f"{label} pathway", entry['pathway']
+
+    current_stats = dict(stats_of(current))
+    for name, old in stats_of(baseline):
+        new = current_stats.get(name)
+        if new is None:
+            messages.append(f"{name}: missing")
+            continue
+        for key in ('median', 'geometric_mean', 'within_10_percent'):
+            a, b = old.get(key), new.get(key)
+            if a is None or b is None:
+                if a != b:
+                    messages.append(f"{name} {key}: {a} -> {b}")
+            elif abs(b - a) > ratio_tolerance * max(abs(a), 1e-12):
+                messages.append(f"{name} {key}: {a:.6g} -> {b:.6g}")
+    return messages
+
+
+def summary(record):
+    timing, acc = record['timing'], record['accuracy']
+    lines = [f"{record['nuclides']} nuclides in {timing['end_to_end_s']:.2f} s "
+             f"({timing['nuclides_per_s']:.0f} nuclides/s), library load {timing['library_load_s']:.2f} s",
+             "Stages: " + ", ".join(f"{name} {seconds:.3f} s" for name, seconds in timing['stages_s'].items())]
+    memory = record['memory']
+    lines.append(f"Peak memory: {memory['peak_rss_mb']:.0f} MB RSS"
+                 + (f", {memory['peak_traced_mb']:.0f} MB traced" if memory['peak_traced_mb'] is not None else ""))
+    for name in ('hc2', 'hc3'):
+        s = acc[name]
+        lines.append(f"{name.upper()} HazCat/DOE: median {s.get('median', float('nan')):.4g}, "
+                     f"within 10% {s.get('within_10_percent', float('nan')):.1%} of {s['compared']}")
+    lines.append(f"Dominant pathway agrees with DOE for {acc['dominant_pathway_agreement']:.1%}")
+    if 'logging' in record:
+        log = record['logging']
+        lines.append(f"Per-nuclide DCF screening of {log['nuclides']} nuclides: {log['debug_s']:.2f} s at DEBUG, "
+                     f"{log['info_s']:.2f} s at INFO ({log['saved_fraction']:.0%} saved)")
+    for label, entry in acc['pathways'].items():
+        s = entry['hc3']
+        lines.append(f"  {label} ({entry['count']}): HC-3 median {s.get('median', float('nan')):.4g}, "
+                     f"within 10% {s.get('within_10_percent', float('nan')):.1%}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HazCat regression benchmark on the DOE-STD-1027-2018 table.")
+    parser.add_argument('--output', default=None, help="JSON file for the benchmark record.")
+    parser.add_argument('--baseline', default=None, help="Earlier benchmark JSON to compare with.")
+    parser.add_argument('--nuclides', type=int, default=None, help="Only the first N radionuclides of the table.")
+    parser.add_argument('--details', action='store_true', help="Include the per-radionuclide values in the JSON.")
+    parser.add_argument('--no-trace-memory', action='store_true', help="Skip the tracemalloc pass.")
+    parser.add_argument('--logging', action='store_true',
+                        help="Also time the per-nuclide DCF screening at DEBUG and INFO logging levels.")
+    parser.add_argument('--logging-nuclides', type=int, default=200,
+                        help="Radionuclides of the logging benchmark (default: 200).")
+    parser.add_argument('--time-tolerance', type=float, default=0.25,
+                        help="Allowed relative slowdown against the baseline (default: 0.25).")
+    parser.add_argument('--ratio-tolerance', type=float, default=0.01,
+                        help="Allowed relative change of the ratio statistics (default: 0.01).")
+    args = parser.parse_args(argv)
+    from hazcat_logging import configure_logging
+    configure_logging()
+    output = args.output and os.path.abspath(args.output)
+    baseline_path = args.baseline and os.path.abspath(args.baseline)
+
+    record = run_benchmark(args.nuclides, trace_memory=not args.no_trace_memory, details=args.details)
+    if args.logging:
+        record['logging'] = logging_benchmark(args.logging_nuclides)
+    print(summary(record))
+    if output:
+        with open(output, 'w') as f:
+            json.dump(record, f, indent=2)
+        print(f"Benchmark saved to {output}")
+    if baseline_path:
+        with open(baseline_path) as f:
+            messages = compare(json.load(f), record, args.time_tolerance, args.ratio_tolerance)
+        for message in messages:
+            print(f"REGRESSION: {message}")
+        print(f"{len(messages)} regressions against {baseline_path}")
+        return 1 if messages else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,356 @@
+"""
+Content-addressed on-disk cache of HazCat results.
+
+A result is stored under the hash of the normalized configuration together with a fingerprint of the library
+(every source data file under ``library/`` and the HazCat modules). Editing any library file or module changes the
+fingerprint, so stale results are never returned; they simply stop being used and are evicted in LRU order once
+the cache exceeds its size limit.
+
+The nuclide memo applies the same versioning to the inventory-independent inputs of every nuclide, so a new
+configuration only pays for the nuclides that were never computed before.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+from hazcat_library import LIBRARY_DIR, DCF_LIBRARY_FILE, NUCLIDE_TABLE_FILE
+from hazcat_profile import profiler
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+LIBRARY_CODE = ("hazcat_library.py", "hazcat_class.py", "hazcat_kernels.py", "hazcat_report.py", "hazcat_cache.py",
+                "hazcat_session.py")
+
+LIBRARY_PATH = LIBRARY_DIR
+RESULT_CACHE_DIR = os.path.join(LIBRARY_PATH, "result_cache")
+RESULT_CACHE_FORMAT = 1
+NUCLIDE_MEMO_FILE = os.path.join(LIBRARY_PATH, "nuclide_memo.pkl")
+NUCLIDE_MEMO_FORMAT = 1
+
+# Compiled files are derived from the source tables, which are fingerprinted themselves
+_GENERATED = {os.path.abspath(p) for p in (DCF_LIBRARY_FILE, NUCLIDE_TABLE_FILE,
+                                          os.path.splitext(NUCLIDE_TABLE_FILE)[0] + ".json")}
+_GENERATED.add(NUCLIDE_MEMO_FILE)
+
+_file_digests = {}
+
+
+def file_digest(path):
+    """sha256 of a file, memoized per process on (path, size, mtime)."""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    if key not in _file_digests:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        _file_digests[key] = h.hexdigest()
+    return _file_digests[key]
+
+
+def library_files(library_dir=LIBRARY_PATH):
+    """Source data files of the library (compiled stores, caches, bytecode and temporary files excluded), sorted."""
+    cache_dir = os.path.abspath(RESULT_CACHE_DIR) + os.sep
+    files = []
+    for path in glob.glob(os.path.join(library_dir, "**", "*"), recursive=True):
+        path = os.path.abspath(path)
+        if (os.path.isfile(path) and path not in _GENERATED and not path.startswith(cache_dir)
+                and "__pycache__" not in path.split(os.sep) and not path.endswith((".tmp", ".pyc"))):
+            files.append(path)
+    return sorted(files)
+
+
+def library_fingerprint(library_dir=LIBRARY_PATH):
+    """Hash of every library data file (by relative path and content) and of the HazCat modules."""
+    h = hashlib.sha256(f"format={RESULT_CACHE_FORMAT}".encode())
+    for path in library_files(library_dir):
+        h.update(os.path.relpath(path, library_dir).encode() + b"\0" + file_digest(path).encode())
+    for name in LIBRARY_CODE:
+        h.update(name.encode() + b"\0" + file_digest(os.path.join(PACKAGE_DIR, name)).encode())
+    return h.hexdigest()
+
+
+def normalize_config(config):
+    """The fields of a config that determine the result, in canonical form."""
+    def floats(values):
+        return None if values is None else [float(v) for v in values]
+
+    ignore_half_life = config.get('ignore_half_life')
+    return {
+        'rads_list': [str(r) for r in config['rads_list']],
+        'inventories': floats(config['inventories']),
+        'Rs_HC2': floats(config.get('Rs_HC2')),
+        'Rs_HC3': floats(config.get('Rs_HC3')),
+        'consider_progeny': bool(config.get('consider_progeny')),
+        'ignore_half_life': None if ignore_half_life is None else float(ignore_half_life),
+    }
+
+
+def config_digest(config):
+    return hashlib.sha256(json.dumps(normalize_config(config), sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk LRU cache of HazcatResult objects.
+
+    Args:
+        cache_dir (str): Directory of the cache files. Defaults to library/result_cache.
+        max_bytes (int): Size limit of the cache directory. Defaults to 256 MiB.
+    """
+
+    def __init__(self, cache_dir=RESULT_CACHE_DIR, max_bytes=256 * 2 ** 20):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self):
+        """Library fingerprint, computed once per cache object (see refresh)."""
+        if self._fingerprint is None:
+            self._fingerprint = library_fingerprint()
+        return self._fingerprint
+
+    def refresh(self):
+        """Re-read the library fingerprint (after editing library files in a long-running process)."""
+        self._fingerprint = None
+
+    def key(self, config):
+        return hashlib.sha256((config_digest(config) + self.fingerprint).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".pkl")
+
+    def get(self, config):
+        """The cached result of `config`, or None."""
+        path = self._path(self.key(config))
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self.misses += 1
+            profiler.count('result_cache.miss')
+            return None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        profiler.count('result_cache.hit')
+        return result
+
+    def put(self, config, result):
+        """Stores the result of `config`, then evicts least recently used entries beyond max_bytes."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(self.key(config)))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self._evict()
+
+    def _entries(self):
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, "*.pkl")):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        return sorted(entries)
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        for _, _, path in self._entries():
+            os.remove(path)
+
+    def stats(self):
+        entries = self._entries()
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(entries), 'bytes': sum(size for _, size, _ in entries)}
+
+    def __repr__(self):
+        s = self.stats()
+        return (f"ResultCache(hits={s['hits']}, misses={s['misses']}, evictions={s['evictions']}, "
+                f"entries={s['entries']}, bytes={s['bytes']})")
+
+
+result_cache = ResultCache()
+
+
+class NuclideMemo:
+    """
+    Persistent memo of the nuclide-intrinsic HazCat inputs (see HAZCAT.compute_nuclide_records).
+
+    DCFs, their provenance, half-life, atomic weight, E1, Bv and the default release fractions depend only on the
+    nuclide and the library, so they are computed once per nuclide and kept on disk. The memo file carries the
+    library fingerprint; when any library file or HazCat module changes, the stored records are dropped.
+
+    Args:
+        path (str): Location of the memo file. Defaults to library/nuclide_memo.pkl.
+    """
+
+    def __init__(self, path=NUCLIDE_MEMO_FILE):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._records = None
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self):
+        if self._fingerprint is None:
+            self._fingerprint = library_fingerprint()
+        return self._fingerprint
+
+    def _read(self):
+        fingerprint = self.fingerprint
+        try:
+            with open(self.path, "rb") as f:
+                stored = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return {}
+        if stored.get('format') != NUCLIDE_MEMO_FORMAT or stored.get('fingerprint') != fingerprint:
+            return {}
+        return stored['records']
+
+    @property
+    def records(self):
+        if self._records is None:
+            self._records = self._read()
+        return self._records
+
+    def lookup(self, nuclides):
+        """
+        Returns:
+            tuple: (records of the memoized nuclides as a dict, list of the nuclides still to compute)
+        """
+        records = self.records
+        found = {n: records[n] for n in nuclides if n in records}
+        missing = list(dict.fromkeys(n for n in nuclides if n not in records))
+        self.hits += len(found)
+        self.misses += len(missing)
+        profiler.count('nuclide_memo.hit', len(found))
+        profiler.count('nuclide_memo.miss', len(missing))
+        return found, missing
+
+    def store(self, new_records):
+        """Adds records and writes the memo (merged with records stored meanwhile by other processes)."""
+        if not new_records:
+            return
+        merged = self._read()
+        merged.update(self.records)
+        merged.update(new_records)
+        self._records = merged
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({'format': NUCLIDE_MEMO_FORMAT, 'fingerprint': self.fingerprint, 'records': merged},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def records_for(self, nuclides, hazcat=None):
+        """
+        Records of `nuclides`, computing (and storing) only those not memoized yet.
+
+        Args:
+            nuclides (list): Nuclide names.
+            hazcat (HAZCAT, optional): Instance used for the computation (its config is reused).
+
+        Returns:
+            dict: Nuclide name -> record.
+        """
+        found, missing = self.lookup(nuclides)
+        if missing:
+            if hazcat is None:
+                from hazcat_class import HAZCAT
+                hazcat = HAZCAT({'inventories': [], 'rads_list': [], 'output_filename': None})
+            computed = hazcat.compute_nuclide_records(missing)
+            self.store(computed)
+            found.update(computed)
+        return found
+
+    def warm(self, nuclides=None):
+        """
+        Precomputes the records of `nuclides` (default: every radionuclide of the DOE-STD-1027-2018 thresholds).
+
+        Returns:
+            int: Number of nuclides that had to be computed.
+        """
+        if nuclides is None:
+            from hazcat_library import library_cache, DOE_TQ_WORKBOOK
+            df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='thresholds').dropna(axis=0, how='all')
+            nuclides = df_tq['Radionuclide'].tolist()
+        missing = list(dict.fromkeys(n for n in nuclides if n not in self.records))
+        self.records_for(missing)
+        return len(missing)
+
+    def refresh(self):
+        """Re-read the library fingerprint and the memo file."""
+        self._fingerprint = None
+        self._records = None
+
+    def clear(self):
+        self._records = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.records)}
+
+    def __repr__(self):
+        s = self.stats()
+        return f"NuclideMemo(hits={s['hits']}, misses={s['misses']}, entries={s['entries']})"
+
+
+nuclide_memo = NuclideMemo()
+
+
+def compute_hazcat_result_cached(config, cache=result_cache, use_memo=True):
+    """
+    HAZCAT(config).compute_hazcat_result() through the result cache: a hit skips the computation entirely.
+
+    Args:
+        config (dict): HazCat config (your_input.json schema).
+        cache (ResultCache, optional): Cache to use; None computes without caching.
+        use_memo (bool): Take the nuclide-intrinsic inputs from the nuclide memo; False recomputes them all.
+
+    Returns:
+        HazcatResult: The result.
+    """
+    if cache is not None:
+        result = cache.get(config)
+        if result is not None:
+            return result
+
+    from hazcat_class import HAZCAT
+    result = HAZCAT(config).compute_hazcat_result(Rs_HC2=config.get('Rs_HC2'), Rs_HC3=config.get('Rs_HC3'),
+                                                  use_memo=use_memo)
+    if cache is not None:
+        cache.put(config, result)
+    return result
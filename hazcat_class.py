@@ -1,22 +1,56 @@
+import dataclasses
+import logging
 import numpy as np
 import os
 import pandas as pd
 import re
 import warnings
+from hazcat_library import (library_cache, load_dcf_library, dcf_table_path, load_nuclide_table, NUCLIDE_DTYPE,
+                            load_mass_table, load_decay_graph, convert_half_life_to_seconds, HALF_LIFE_TABLE, NOMENCLATURE_TABLE, JAERI_HALF_LIFE_TABLE,
+                            DOE_TQ_WORKBOOK, ECKERMAN_WORKBOOK, RADIOTOXICITY_WORKBOOK, WORKER_ICRP119_WORKBOOK,
+                            ATOMIC_WEIGHT_WORKBOOK,
+                            read_annex_g_icrp119_dcf_inh_public,
+                            read_annex_h_icrp119_dcf_inhal_reactive_soluble_gases_public,
+                            read_table_a2_doe_std_1196_2011_dcf_inhal,
+                            read_table_5_jaeri_dcf_inh_particulates_public,
+                            read_table_7_jaeri_dcf_inh_public_soluble_reactive_gases_vapours,
+                            read_table_4_6_fgr_15_dcf_ecerman_submersion,
+                            read_table_a3_doe_std_1196_2011_dcf_submersion,
+                            read_annex_a_icrp119_dcf_inhal_worker,
+                            read_annex_b_icrp119_dcf_inhal_reactive_soluble_gases_worker,
+                            read_table_3_jaeri_dcf_inh_ing_particulates_worker,
+                            read_table_6_jaeri_dcf_soluble_reactive_gases_worker)
+from hazcat_kernels import hc2_threshold_quantity, hc3_threshold_quantities, HC3_CHI_BY_Q
+from hazcat_report import HazcatResult
+from hazcat_profile import profiler
+from hazcat_logging import get_logger
 warnings.simplefilter(action='ignore', category=pd.errors.ParserWarning)
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
 os.getcwd()
-import logging
 
 pd.reset_option('display.float_format')
 
+dcf_log = get_logger('dcf')
+nuclide_log = get_logger('nuclide')
+hc3_log = get_logger('hc3')
+classification_log = get_logger('classification')
+
+
+# Priority tiers used to pick a DCF among the source tables (lower tier wins)
+DCF_REFERENCE_PRIORITY = (
+    (1, ("ICRP_119", "FGR")),
+    (2, ("DOE_STD",)),
+    (3, ("JAERI",)),
+)
+
 
 class HAZCAT():
     def __init__(self, config):
         super().__init__()
 
         self.lambda_of_rads = None
+        self.dcf_provenance = None
         self.config = config
         self.inventories = config['inventories']
         self.rads_list = config['rads_list']
@@ -32,7 +66,7 @@ class HAZCAT():
         Returns:
         dict: Dictionary with radionuclides as keys and their DCF dictionaries as values.
         """
-        return {rad: self.compute_max_dcf(rad) for rad in self.rads_list}
+        return self.compute_max_dcf_batch(self.rads_list)
 
         # Example usage:
         # rads_list = ['Cs-137', 'Co-60', 'Sr-90']
@@ -40,23 +74,22 @@ class HAZCAT():
 
         # print(dcfs_dicts_rads_list)
 
-    def screen_Annex_G_ICRP119_dcf_inh_public_for_radionuclide(self, file_path, radionuclide):
+    def screen_Annex_G_ICRP119_dcf_inh_public_for_radionuclide(self, file_path, radionuclide, df=None, index=None):
         """
         Reads an Excel file and returns rows that match the given radionuclide.
 
         Parameters:
             file_path (str): Path to the Excel file.
             radionuclide (str): Radionuclide name (e.g., "Cs-137").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame: Filtered rows containing the specified radionuclide.
         """
         try:
-            df = pd.read_excel(file_path, engine="openpyxl")
-            # df.columns = df.columns.str.strip()
-            df.columns = ['Nuclide', 'Half-life', 'Type', 'f1', 'inh_infant', 'f1_age_g_gt_1a',
-                          'inh_1_year', 'inh_5_years', 'inh_10_years', 'inh_15_years',
-                          'inh_adult']
+            if df is None:
+                df = read_annex_g_icrp119_dcf_inh_public(file_path)
 
             if "Nuclide" in df.columns:
                 # df_filtered = df[df["Nuclide"].astype(str).str.strip().str.upper() == radionuclide.upper()]
@@ -66,10 +99,13 @@ class HAZCAT():
                 #        rf"^{radionuclide.upper()}|{radionuclide.upper()}", na=False)
                 # ]
 
-                df_filtered = df[
-                    df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
-                        rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
-                ]
+                if index is not None:
+                    df_filtered = index.take(df, radionuclide)
+                else:
+                    df_filtered = df[
+                        df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
+                            rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
+                    ]
                 return df_filtered if not df_filtered.empty else "No data found"
             else:
                 return "No 'Nuclide' column found"
@@ -77,24 +113,23 @@ class HAZCAT():
         except Exception as e:
             return f"Error: {e}"
 
-    def screen_Annex_H_ICRP119_dcf_inhal_reactive_soluble_gases_public_for_radionuclide(self, file_path, radionuclide):
+    def screen_Annex_H_ICRP119_dcf_inhal_reactive_soluble_gases_public_for_radionuclide(self, file_path, radionuclide,
+                                                                                         df=None, index=None):
         """
         Reads a CSV file, ignores the first column (index), and returns rows matching the given radionuclide.
 
         Parameters:
             file_path (str): Path to the CSV file.
             radionuclide (str): Radionuclide name (e.g., "H-3").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame: Filtered rows containing the specified radionuclide.
         """
         try:
-            df = pd.read_csv(self, file_path, skiprows=1, index_col=0)
-            df.columns = ['Nuclide', 'Half-life', 'Type', 'f1', 'inh_infant', 'f1_age_g_gt_1a',
-                          'inh_1_year', 'inh_5_years', 'inh_10_years', 'inh_15_years', 'inh_adult',
-                          'VAPOUR_FORM']
-
-            df.columns = df.columns.str.strip()
+            if df is None:
+                df = read_annex_h_icrp119_dcf_inhal_reactive_soluble_gases_public(file_path)
 
             if "Nuclide" in df.columns:
                 # df_filtered = df[df["Nuclide"].astype(str).str.strip().str.upper() == radionuclide.upper()]
@@ -103,10 +138,13 @@ class HAZCAT():
                 #        rf"^{radionuclide.upper()}|{radionuclide.upper()}", na=False)
                 # ]
 
-                df_filtered = df[
-                    df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
-                        rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
-                ]
+                if index is not None:
+                    df_filtered = index.take(df, radionuclide)
+                else:
+                    df_filtered = df[
+                        df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
+                            rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
+                    ]
                 return df_filtered if not df_filtered.empty else "No data found"
             else:
                 return "No 'Nuclide' column found"
@@ -114,24 +152,24 @@ class HAZCAT():
         except Exception as e:
             return f"Error: {e}"
 
-    def screen_Table_A2_DOE_STD_1196_2011_dcf_inhal_by_radionuclide(self, file_path, radionuclide):
+    def screen_Table_A2_DOE_STD_1196_2011_dcf_inhal_by_radionuclide(self, file_path, radionuclide,
+                                                                    df=None, index=None):
         """
         Reads a cleaned CSV file and extracts rows containing the specified radionuclide.
 
         Parameters:
             file_path (str): Path to the cleaned CSV file.
             radionuclide (str): Radionuclide name (e.g., "Cs-137").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame: Filtered rows containing the specified radionuclide.
         """
         try:
-            # Read CSV, treating the first row as the header
-            df = pd.read_csv(file_path, skiprows=0)
-            df.columns = ['Index', 'Nuclide', 'Type', 'f1', 'inh_infant', 'inh_1_year',
-                          'inh_5_year', 'inh_10_year', 'inh_15_year', 'inh_adult', 'Reference Person']
-            # first column index is removed
-            df = df.iloc[:, 1:]
+            if df is None:
+                # Read CSV, treating the first row as the header
+                df = read_table_a2_doe_std_1196_2011_dcf_inhal(file_path)
 
             # Ensure "Nuclide" column exists
             if "Nuclide" in df.columns:
@@ -142,10 +180,13 @@ class HAZCAT():
                 #        rf"^{radionuclide.upper()}|{radionuclide.upper()}", na=False)
                 # ]
 
-                df_filtered = df[
-                    df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
-                        rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
-                ]
+                if index is not None:
+                    df_filtered = index.take(df, radionuclide)
+                else:
+                    df_filtered = df[
+                        df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
+                            rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
+                    ]
 
                 return df_filtered if not df_filtered.empty else "No data found for the given radionuclide."
             else:
@@ -169,7 +210,7 @@ class HAZCAT():
         """
         try:
             # Read CSV, treating the first row as the header
-            df = pd.read_csv(file_path, header=0)
+            df = library_cache.read_csv(file_path, header=0)
 
             df.columns = ['Nuclide', 'Half-life', 'f1', 'inh_infant', 'f1_age_g_gt_1a',
                           'inh_1_year', 'inh_5_years', 'inh_10_years', 'inh_15_years',
@@ -182,7 +223,7 @@ class HAZCAT():
                     df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
                         rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
                 ]
-                print(df_filtered)
+                dcf_log.debug("Table 4 JAERI rows of %s:\n%s", radionuclide, df_filtered)
                 return df_filtered if not df_filtered.empty else "No data found for the given radionuclide."
             else:
                 return "No 'Nuclide' column found in the file."
@@ -190,24 +231,24 @@ class HAZCAT():
         except Exception as e:
             return f"Error: {e}"
 
-    def screen_Table_5_JAERI_dcf_inh_particulates_public_by_radionuclide(self, file_path, radionuclide):
+    def screen_Table_5_JAERI_dcf_inh_particulates_public_by_radionuclide(self, file_path, radionuclide,
+                                                                         df=None, index=None):
         """
         Reads a cleaned CSV file and extracts rows containing the specified radionuclide.
 
         Parameters:
             file_path (str): Path to the cleaned CSV file.
             radionuclide (str): Radionuclide name (e.g., "Cs-137").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame: Filtered rows containing the specified radionuclide.
         """
         try:
-            # Read CSV, treating the first row as the header
-            df = pd.read_csv(file_path, skiprows=0)
-            df.columns = ['Index', 'Nuclide', 'Half-life', 'Type', 'f1', 'inh_infant', 'f1_age_g_gt_1a',
-                          'inh_1_year', 'inh_5_years', 'inh_10_years', 'inh_15_years', 'inh_adult']
-
-            df = df.iloc[:, 1:]
+            if df is None:
+                # Read CSV, treating the first row as the header
+                df = read_table_5_jaeri_dcf_inh_particulates_public(file_path)
             # Ensure "Nuclide" column exists
             if "Nuclide" in df.columns:
                 # Filter rows where Nuclide matches the input (case insensitive)
@@ -217,10 +258,13 @@ class HAZCAT():
                 #        rf"^{radionuclide.upper()}|{radionuclide.upper()}", na=False)
                 # ]
 
-                df_filtered = df[
-                    df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
-                        rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
-                ]
+                if index is not None:
+                    df_filtered = index.take(df, radionuclide)
+                else:
+                    df_filtered = df[
+                        df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
+                            rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
+                    ]
 
                 return df_filtered if not df_filtered.empty else "No data found for the given radionuclide."
             else:
@@ -230,28 +274,24 @@ class HAZCAT():
             return f"Error: {e}"
 
     def screen_Table_7_JAERI_dcf_inh_Public_Soluble_Reactive_Gases_Vapours_public_by_radionuclide(self, file_path,
-                                                                                                  radionuclide):
+                                                                                                  radionuclide,
+                                                                                                  df=None, index=None):
         """
         Reads a cleaned CSV file and extracts rows containing the specified radionuclide.
 
         Parameters:
             file_path (str): Path to the cleaned CSV file.
             radionuclide (str): Radionuclide name (e.g., "Cs-137").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame: Filtered rows containing the specified radionuclide.
         """
         try:
-            # Read CSV, treating the first row as the header
-            df = pd.read_csv(file_path, header=0)
-            # df.columns = ['Index', 'Nuclide', 'Type', 'f1',  'Newborn', '1-year' ,'5-year', '10-year',
-            #      '15-year', 'Adult','Reference Person']
-            df.columns = ['Index', 'Nuclide', 'Chemical Form', 'Half-life', 'Type', 'percent_deposit', 'f1',
-                          'inh_infant', 'f1_age_g_gt_1a', 'inh_1_year', 'inh_5_years',
-                          'inh_10_years', 'inh_15_years', 'inh_adult']
-
-            # first column index is removed
-            df = df.iloc[:, 1:]
+            if df is None:
+                # Read CSV, treating the first row as the header
+                df = read_table_7_jaeri_dcf_inh_public_soluble_reactive_gases_vapours(file_path)
             # Ensure "Nuclide" column exists
             if "Nuclide" in df.columns:
                 # Filter rows where Nuclide matches the input (case insensitive)
@@ -261,10 +301,13 @@ class HAZCAT():
                 #        rf"^{radionuclide.upper()}|{radionuclide.upper()}", na=False)
                 # ]
 
-                df_filtered = df[
-                    df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
-                        rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
-                ]
+                if index is not None:
+                    df_filtered = index.take(df, radionuclide)
+                else:
+                    df_filtered = df[
+                        df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
+                            rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
+                    ]
 
                 return df_filtered if not df_filtered.empty else "No data found for the given radionuclide."
             else:
@@ -274,7 +317,7 @@ class HAZCAT():
             return f"Error: {e}"
 
     def screen_Table_4_6_FGR_15_dcf_ecerman_submersion(self, file_path, radionuclide,
-                                                       sheet_name='submersion_dose'):
+                                                       sheet_name='submersion_dose', df=None, index=None):
         """
         Return Dose Conversion Factors (Submersion) specific to radionuclide.
 
@@ -285,6 +328,8 @@ class HAZCAT():
             file_path (str): The path to the Excel file containing submersion DCF data.
             radionuclide (str): The name of the radionuclide to filter data for.
             sheet_name (str, optional): The sheet name in the Excel file containing the data. Defaults to 'submersion_dose'.
+            df (pd.DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             pd.DataFrame: A DataFrame containing DCF values for the specified radionuclide.
@@ -294,21 +339,15 @@ class HAZCAT():
             ValueError: If the radionuclide is not found in the dataset.
         """
         try:
-            # Load Excel sheet
-            df = pd.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
-
-            # Drop fully empty rows
-            df.dropna(axis=0, how='all', inplace=True)
-
-            # Rename columns (ensure they exist before renaming)
-            expected_columns = ['Nuclide', 'sub_infant', 'sub_1_year', 'sub_5_years',
-                                'sub_10_years', 'sub_15_years', 'sub_adult']
-
-            if len(df.columns) >= len(expected_columns):
-                df.columns = expected_columns  # Assign column names if they match expected structure
+            if df is None:
+                # Load Excel sheet, drop fully empty rows and rename columns
+                df = read_table_4_6_fgr_15_dcf_ecerman_submersion(file_path, sheet_name=sheet_name)
 
             # Filter rows based on the radionuclide
-            df_filtered = df[df['Nuclide'] == radionuclide]
+            if index is not None:
+                df_filtered = index.take(df, radionuclide)
+            else:
+                df_filtered = df[df['Nuclide'] == radionuclide]
 
             if df_filtered.empty:
                 raise ValueError(f"No data found for radionuclide in Table:4.6 (FGR_15, submersion): {radionuclide}")
@@ -316,16 +355,16 @@ class HAZCAT():
             return df_filtered
 
         except FileNotFoundError:
-            print(f"Error: The file '{file_path}' was not found.")
+            dcf_log.error("The file '%s' was not found.", file_path)
             return None
         except ValueError as e:
-            print(f"Error: {e}")
+            dcf_log.debug("%s", e)
             return None
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            dcf_log.error("An unexpected error occurred: %s", e)
             return None
 
-    def screen_Table_A3_DOE_STD_1196_2011_dcf_submersion(self, file_path, radionuclide):
+    def screen_Table_A3_DOE_STD_1196_2011_dcf_submersion(self, file_path, radionuclide, df=None, index=None):
         """
         Return Dose Conversion Factors (Submersion) for a specific radionuclide from the DOE-STD-1196-2011 dataset.
 
@@ -335,7 +374,8 @@ class HAZCAT():
         Args:
             file_path (str): The path to the Excel file containing the submersion DCF data.
             radionuclide (str): The name of the radionuclide to filter data for.
-            sheet_name (str, optional): The sheet name in the Excel file. Defaults to the first sheet if None.
+            df (pd.DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             pd.DataFrame: A DataFrame containing DCF values for the specified radionuclide.
@@ -345,25 +385,19 @@ class HAZCAT():
             ValueError: If the radionuclide is not found in the dataset.
         """
         try:
-            # Load Excel file
-            df = pd.read_excel(file_path, engine="openpyxl")
-
-            # Merge 2nd and 3rd columns (Col2 and Col3) with a space separator
-            df["Merged_Col2_Col3"] = df.iloc[:, 1].astype(str) + " " + df.iloc[:, 2].astype(str)
-
-            # Drop the original columns if needed
-            df.drop(df.columns[[1, 2]], axis=1, inplace=True)
-
-            # Drop fully empty rows
-            # df.dropna(axis=0, how='all', inplace=True)
-            df.columns = ["Nuclide", "sub_adult", "Half-life"]
+            if df is None:
+                # Load Excel file, merging the half-life value and unit columns
+                df = read_table_a3_doe_std_1196_2011_dcf_submersion(file_path)
 
             # Ensure "Nuclide" column exists before filtering
             if 'Nuclide' not in df.columns:
                 raise ValueError("Expected column 'Nuclide' not found in dataset.")
 
             # Filter rows for the specified radionuclide
-            df_filtered = df[df['Nuclide'] == radionuclide]
+            if index is not None:
+                df_filtered = index.take(df, radionuclide)
+            else:
+                df_filtered = df[df['Nuclide'] == radionuclide]
 
             if df_filtered.empty:
                 raise ValueError(f"No data found for radionuclide in Table_A3_DOE_STD_1196_2011: {radionuclide}")
@@ -371,16 +405,16 @@ class HAZCAT():
             return df_filtered
 
         except FileNotFoundError:
-            print(f"Error: The file '{file_path}' was not found.")
+            dcf_log.error("The file '%s' was not found.", file_path)
             return None
         except ValueError as e:
-            print(f"Error: {e}")
+            dcf_log.debug("%s", e)
             return None
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            dcf_log.error("An unexpected error occurred: %s", e)
             return None
 
-    def screen_annex_a_icrp119_dcf_inhal_worker(self, file_path, radionuclide, sheet_name=0):
+    def screen_annex_a_icrp119_dcf_inhal_worker(self, file_path, radionuclide, sheet_name=0, df=None, index=None):
         """
         Reads the given Excel file, filters rows based on the radionuclide,
         merges the 2nd and 3rd columns with space separation, and returns the result.
@@ -389,28 +423,16 @@ class HAZCAT():
             file_path (str): Path to the Excel file.
             radionuclide (str): Radionuclide name to filter (e.g., "Cs-137").
             sheet_name (str or int): Name or index of the sheet to read.
+            df (pd.DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             pd.DataFrame or str: Filtered DataFrame with merged columns, or an error message.
         """
         try:
-            # Load the Excel file
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-
-            # Drop fully empty rows
-            df.dropna(axis=0, how='all', inplace=True)
-
-            # Ensure we have the expected number of columns before renaming
-            expected_cols = 9  # Adjust this if needed
-            if df.shape[1] < expected_cols:
-                return f"Error: Expected at least {expected_cols} columns, found {df.shape[1]}."
-
-            # Rename columns
-            df.columns = ['Element', 'Nuclide', 'Half-life', 'Type', 'inh_f1', 'inh_adult_1mu_m',
-                          'inh_adult_5mu_m', 'ing_f1', 'ing_adult']
-
-            # Drop the first column (Element)
-            df.drop(columns=['Element'], axis=1, inplace=True)
+            if df is None:
+                # Load the Excel file, drop empty rows, rename columns and drop the first column (Element)
+                df = read_annex_a_icrp119_dcf_inhal_worker(file_path, sheet_name=sheet_name)
 
             # Filter based on the radionuclide
             # df_filtered = df[df['Nuclide'].fillna('').astype(str).str.startswith(radionuclide)]
@@ -423,86 +445,75 @@ class HAZCAT():
 
             # Regex pattern to match exact nuclide name or name followed by _anytext
             pattern = rf"^{re.escape(radionuclide)}(_\w+)?$"
-            print("pattern:", pattern,radionuclide )
-            df_filtered = df[df["Nuclide"].str.match(pattern, na=False)]
+            dcf_log.debug("pattern: %s %s", pattern, radionuclide)
+            if index is not None:
+                df_filtered = index.take(df, radionuclide)
+            else:
+                df_filtered = df[df["Nuclide"].str.match(pattern, na=False)]
 
             #df_filtered = df[
             #    df['Nuclide'].fillna('').astype(str).str.strip().str.fullmatch(
             #        rf"{re.escape(radionuclide)}(?:_.*)?", na=False
             #    )
             #]
-            print('f:', df_filtered)
+            dcf_log.debug("f: %s", df_filtered)
             # If no rows match, return a message
             return df_filtered if not df_filtered.empty else "No matching data found for the given radionuclide."
 
         except Exception as e:
             return f"Error: {e}"
 
-    def screen_Annex_B_ICRP119_dcf_inhal_reactive_soluble_gases_worker(self, file_path, radionuclide):
+    def screen_Annex_B_ICRP119_dcf_inhal_reactive_soluble_gases_worker(self, file_path, radionuclide,
+                                                                       df=None, index=None):
         """
         Reads a CSV file, ignores the first column (index), and returns rows matching the given radionuclide.
 
         Parameters:
             file_path (str): Path to the CSV file.
             radionuclide (str): Radionuclide name (e.g., "H-3").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame or str: Filtered rows containing the specified radionuclide, or an error message.
         """
         try:
-            # Read the CSV, skipping the first row and detecting delimiter
-            df = pd.read_csv(file_path, skiprows=1, sep=None, engine="python")
-
-            # Ensure the correct number of columns before renaming
-            expected_cols = 4  # Adjust if the actual file has a different structure
-            if df.shape[1] < expected_cols:
-                return f"Error: Expected at least {expected_cols} columns, found {df.shape[1]}."
-
-            # Rename columns appropriately
-            df.columns = ['Nuclide', 'Chemical Form', 'Half-life', 'inh_adult']
-
-            # Drop rows where Nuclide is NaN
-            df.dropna(subset=["Nuclide"], inplace=True)
+            if df is None:
+                # Read the CSV (skipping the first row), rename columns and drop rows without a nuclide
+                df = read_annex_b_icrp119_dcf_inhal_reactive_soluble_gases_worker(file_path)
 
             # Standardize radionuclide search (strip spaces and convert to uppercase)
-            df_filtered = df[df["Nuclide"].astype(str).str.strip().str.upper() == radionuclide.upper()]
-
-            df_filtered = df[
-                df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
-                    rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
-            ]
+            if index is not None:
+                df_filtered = index.take(df, radionuclide)
+            else:
+                df_filtered = df[
+                    df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
+                        rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
+                ]
 
             return df_filtered if not df_filtered.empty else "No data found for the given radionuclide."
 
         except Exception as e:
             return f"Error: {e}"
 
-    def screen_Table_3_JAERI_dcf_inh_ing_particulates_worker_by_radionuclide(self, file_path, radionuclide):
+    def screen_Table_3_JAERI_dcf_inh_ing_particulates_worker_by_radionuclide(self, file_path, radionuclide,
+                                                                             df=None, index=None):
         """
         Reads a cleaned CSV file and extracts rows containing the specified radionuclide.
 
         Parameters:
             file_path (str): Path to the cleaned CSV file.
             radionuclide (str): Radionuclide name (e.g., "Cs-137").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame or str: Filtered rows containing the specified radionuclide, or an error message.
         """
         try:
-            # Read CSV
-            df = pd.read_csv(file_path, skiprows=0)
-
-            # Check if at least 9 columns exist
-            expected_cols = 9  # Adjust if necessary
-            if df.shape[1] < expected_cols:
-                return f"Error: Expected at least {expected_cols} columns, found {df.shape[1]}."
-
-            # Rename columns
-            df.columns = ['Element', 'Nuclide', 'Half-life', 'Type', 'inh_f1', 'inh_adult_1mu_m',
-                          'inh_adult_5mu_m', 'ing_f1', 'ing_adult']
-
-            # Drop the first column ("Element")
-            df = df.iloc[:, 1:]
+            if df is None:
+                # Read CSV, rename columns and drop the first column ("Element")
+                df = read_table_3_jaeri_dcf_inh_ing_particulates_worker(file_path)
 
             # Ensure "Nuclide" column exists
             if "Nuclide" not in df.columns:
@@ -510,9 +521,12 @@ class HAZCAT():
 
             # Filter rows where Nuclide starts with the input (case insensitive)
             #df_filtered = df[df["Nuclide"].str.startswith(radionuclide, na=False)]
-            df_filtered = df[df["Nuclide"].str.contains(
-                rf"(?:^|_)(?:{radionuclide})(?:_|$)", regex=True, na=False)
-            ]
+            if index is not None:
+                df_filtered = index.take(df, radionuclide)
+            else:
+                df_filtered = df[df["Nuclide"].str.contains(
+                    rf"(?:^|_)(?:{radionuclide})(?:_|$)", regex=True, na=False)
+                ]
             # If no rows match, return a message
             return df_filtered if not df_filtered.empty else "No data found for the given radionuclide."
 
@@ -520,31 +534,24 @@ class HAZCAT():
             return f"Error: {e}"
 
     def screen_Table_6_JAERI_dcf_inh_public_soluble_reactive_gases_vapours_workers_by_radionuclide(self, file_path,
-                                                                                                   radionuclide):
+                                                                                                   radionuclide,
+                                                                                                   df=None, index=None):
         """
         Reads a cleaned CSV file and extracts rows containing the specified radionuclide.
 
         Parameters:
             file_path (str): Path to the cleaned CSV file.
             radionuclide (str): Radionuclide name (e.g., "Cs-137").
+            df (DataFrame, optional): Preloaded table from the compiled DCF library; file_path is not read if given.
+            index (NuclideIndex, optional): Hash index of df; replaces the regex scan of the "Nuclide" column.
 
         Returns:
             DataFrame or str: Filtered rows containing the specified radionuclide, or an error message.
         """
         try:
-            # Read CSV with the first row as header
-            df = pd.read_csv(file_path, header=0)
-
-            # Ensure we have enough columns before renaming
-            expected_cols = 5  # Adjust this if necessary
-            if df.shape[1] < expected_cols:
-                return f"Error: Expected at least {expected_cols} columns, but found {df.shape[1]}."
-
-            # Rename columns
-            df.columns = ['Index', 'Nuclide', 'Chemical Form', 'Half-life', 'inh_adult']
-
-            # Drop the first column ("Index")
-            df.drop(columns=['Index'], inplace=True, errors='ignore')
+            if df is None:
+                # Read CSV with the first row as header, rename columns and drop the first column ("Index")
+                df = read_table_6_jaeri_dcf_soluble_reactive_gases_worker(file_path)
 
             # Ensure "Nuclide" column exists
             if "Nuclide" not in df.columns:
@@ -554,10 +561,13 @@ class HAZCAT():
             # df_filtered = df[df["Nuclide"].astype(str).str.strip().str.upper() == radionuclide.upper()]
 
             # also looks for substring if matches with nuclide name
-            df_filtered = df[
-                df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
-                    rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
-            ]
+            if index is not None:
+                df_filtered = index.take(df, radionuclide)
+            else:
+                df_filtered = df[
+                    df["Nuclide"].astype(str).str.strip().str.upper().str.contains(
+                        rf"(?:^|_)(?:{radionuclide.upper()})(?:_|$)", regex=True, na=False)
+                ]
 
             return df_filtered if not df_filtered.empty else "No data found for the given radionuclide."
 
@@ -636,50 +646,91 @@ class HAZCAT():
             if col not in df.columns:
                 raise ValueError(f"Error: Column '{col}' not found in dataframe.")
 
-        # Convert relevant columns to appropriate types
-        df[nuclide_col] = df[nuclide_col].astype(str).str.strip().str.upper()
-        df[reference_col] = df[reference_col].astype(str)
-        df[value_col] = pd.to_numeric(df[value_col], errors='coerce')
+        # The whole frame belongs to one radionuclide
+        selection = self.reduce_by_reference_priority(df.assign(_group=0), "_group", nuclide_col, value_col,
+                                                      reference_col)
+        if selection.empty or pd.isna(selection["tier"].iloc[0]):
+            return None
+        return selection["value"].iloc[0]
+
+    def reduce_by_reference_priority(self, df, group_col, nuclide_col, value_col, reference_col):
+        """
+        Selects one DCF per group (radionuclide) following the reference priority order.
 
-        # Function to check if reference contains specific keywords
-        def contains_keyword(df, keywords):
-            return df[df[reference_col].str.contains('|'.join(keywords), case=False, na=False)]
+        Every reference is mapped to an integer tier once (1: 'ICRP119'/'FGR', 2: 'DOE-STD', 3: 'JAERI'); the value
+        of a group is the maximum within its best available tier, found with a single sort/groupby.
 
-        results = []
+        As in the original per-nuclide loop, only the rows whose (upper-cased) nuclide name contains the last
+        distinct name of the group take part, so multi-nuclide rows are judged like before.
 
-        # Iterate over unique nuclides in the dataframe
-        unique_nuclides = df[nuclide_col].unique()
+        Args:
+            df (pd.DataFrame): Merged DCF rows of one or more radionuclides.
+            group_col (str): Column identifying the radionuclide each row was screened for.
+            nuclide_col (str): Column name for the nuclide name in the source table.
+            value_col (str): Column name for values (e.g., "inh_adult").
+            reference_col (str): Column name for reference.
 
-        for radionuclide in unique_nuclides:
-            # Filter dataframe for rows where 'Nuclide' contains the radionuclide substring
-            subset_df = df[df[nuclide_col].str.contains(rf"^{radionuclide}|{radionuclide}", na=False, case=False)]
+        Returns:
+            pd.DataFrame: Indexed by group, with columns 'value' (NaN if no data), 'tier' (nullable int, missing if
+            no reference qualifies) and 'source' (the reference the value was taken from).
+        """
+        df = df.reset_index(drop=True)
+        groups = df[group_col]
+        names = df[nuclide_col].astype(str).str.strip().str.upper()
+        reference = df[reference_col].astype(str)
+
+        firsts = pd.DataFrame({"group": groups, "name": names}).drop_duplicates()
+        last_name = groups.map(firsts.groupby("group", sort=False)["name"].last())
+
+        def contains(name, pattern):
+            # Both sides are upper-cased; without metacharacters the regex search is a substring test
+            if not set(pattern) & set(".^$*+?{}[]\\|()"):
+                return pattern in name
+            try:
+                return re.search(rf"^{pattern}|{pattern}", name, flags=re.IGNORECASE) is not None
+            except re.error:
+                return name == pattern
+
+        in_subset = np.fromiter((contains(n, p) for n, p in zip(names, last_name)), dtype=bool, count=len(df))
+
+        # Tier of every distinct reference, looked up once
+        tier_of = {}
+        for ref in reference.unique():
+            tier_of[ref] = next((tier for tier, keywords in DCF_REFERENCE_PRIORITY
+                                 if any(k.lower() in ref.lower() for k in keywords)), np.nan)
+
+        ranked = pd.DataFrame({
+            "group": groups,
+            "tier": reference.map(tier_of),
+            "value": pd.to_numeric(df[value_col], errors='coerce'),
+            "source": reference,
+        })[in_subset]
+        ranked = ranked[ranked["tier"].notna()]
+        ranked = ranked[ranked["tier"] == ranked.groupby("group", sort=False)["tier"].transform("min")]
+
+        selection = ranked.groupby("group", sort=False).agg(
+            value=("value", "max"), tier=("tier", "first"), source=("source", "first"))
+        selection = selection.reindex(pd.unique(groups))
+        selection.index.name = group_col
+        selection["tier"] = selection["tier"].astype("Int64")
+        selection.loc[selection["tier"] == 3, "source"] = "JAERI-Data/Code 2002-013"
+        selection["source"] = selection["source"].fillna("No data available")
+        return selection
 
-            if subset_df.empty:
-                continue
+    @staticmethod
+    def get_corrected_nuclide(file_path, radionuclide, alternate_names):
+        """Determine the correct nuclide name based on substring matching in file name."""
+        file_name = os.path.basename(file_path).lower()  # Extract and lowercase file name
 
-            # Step 1: Look for 'ICRP119' or 'FGR' and get max value
-            df_priority1 = contains_keyword(subset_df, ["ICRP_119", "FGR"])
-            if not df_priority1.empty:
-                max_value = df_priority1[value_col].max()
-                source = df_priority1[reference_col].iloc[0]
-            else:
-                # Step 2: If no 'ICRP119' or 'FGR', look for 'DOE-STD'
-                df_priority2 = contains_keyword(subset_df, ["DOE_STD"])
-                if not df_priority2.empty:
-                    max_value = df_priority2[value_col].max()
-                    source = df_priority2[reference_col].iloc[0]
-                else:
-                    # Step 3: If no 'DOE-STD', look for 'JAERI'
-                    df_priority3 = contains_keyword(subset_df, ["JAERI"])
-                    if not df_priority3.empty:
-                        max_value = df_priority3[value_col].max()
-                        source = "JAERI-Data/Code 2002-013"
-                    else:
-                        max_value = None
-                        source = "No data available"
+        for key, alt_name in alternate_names.items():
+            if key and alt_name:  # Ensure key and alt_name are valid
+                key_lower = key.lower()
 
-            results.append({nuclide_col: radionuclide, value_col: max_value, reference_col: source})
-        return max_value
+                # Check if any word from the key exists in the file name
+                if any(word in file_name for word in key_lower.split("_")):
+                    return alt_name  # Use the alternate name if a partial match is found
+
+        return radionuclide  # Default to original name if no match is found
 
     def compute_max_dcf(self, radionuclide):
         """
@@ -696,91 +747,63 @@ class HAZCAT():
 
         # first get the nuclide info for getting altername names, if any
         nuclide_info = self.get_nuclide_info(radionuclide)
-        print('nuclide_info:', nuclide_info)
+        dcf_log.debug("nuclide_info: %s", nuclide_info)
 
         # Ensure "alternate names" key exists in the dictionary
         if "alternate names" not in nuclide_info or not isinstance(nuclide_info["alternate names"], dict):
-            print("No alternate names found. Using default radionuclide.")
+            dcf_log.debug("No alternate names found. Using default radionuclide.")
             alternate_names = {}
         else:
             alternate_names = nuclide_info["alternate names"]
 
-        def get_corrected_nuclide(file_path, radionuclide, alternate_names):
-            """Determine the correct nuclide name based on substring matching in file name."""
-            file_name = os.path.basename(file_path).lower()  # Extract and lowercase file name
-
-            for key, alt_name in alternate_names.items():
-                if key and alt_name:  # Ensure key and alt_name are valid
-                    key_lower = key.lower()
+        get_corrected_nuclide = self.get_corrected_nuclide
 
-                    # Check if any word from the key exists in the file name
-                    if any(word in file_name for word in key_lower.split("_")):
-                        return alt_name  # Use the alternate name if a partial match is found
+        dict_dcf = {}
 
-            return radionuclide  # Default to original name if no match is found
+        # All source tables come from the compiled DCF library (built once, see hazcat_library.py)
+        library = load_dcf_library()
 
-        dict_dcf = {}
+        def screen(screen_function, name):
+            """Screen one library table for the radionuclide (or its file-specific alternate name) via its index."""
+            file_path = dcf_table_path(name)
+            nuclide = get_corrected_nuclide(os.path.basename(file_path), radionuclide, alternate_names)
+            return screen_function(file_path, nuclide, df=library.get(name), index=library.index(name))
 
         # INH_HC2
-        result_annexg = self.screen_Annex_G_ICRP119_dcf_inh_public_for_radionuclide(
-            "library/inhalation_HC2/Annex_G_ICRP119_dcf_inh_public.xlsx",
-            get_corrected_nuclide("Annex_G_ICRP119_dcf_inh_public.xlsx", radionuclide, alternate_names)
-        )
+        result_annexg = screen(self.screen_Annex_G_ICRP119_dcf_inh_public_for_radionuclide,
+                               'Annex_G_ICRP_119')
 
-        result_annexh = self.screen_Annex_H_ICRP119_dcf_inhal_reactive_soluble_gases_public_for_radionuclide(
-            "library/inhalation_HC2/Annex_H_ICRP119_dcf_inhal_reactive_soluble_gases_public.csv",
-            get_corrected_nuclide("Annex_H_ICRP119_dcf_inhal_reactive_soluble_gases_public.csv", radionuclide,
-                                  alternate_names)
-        )
+        result_annexh = screen(self.screen_Annex_H_ICRP119_dcf_inhal_reactive_soluble_gases_public_for_radionuclide,
+                               'Annex_H_ICRP_119')
 
-        result_tab_a2 = self.screen_Table_A2_DOE_STD_1196_2011_dcf_inhal_by_radionuclide(
-            "library/inhalation_HC2/Table_A2-DOE-STD-1196-2011_dcf_inhal.csv",
-            get_corrected_nuclide("Table_A2-DOE-STD-1196-2011_dcf_inhal.csv", radionuclide, alternate_names)
-        )
+        result_tab_a2 = screen(self.screen_Table_A2_DOE_STD_1196_2011_dcf_inhal_by_radionuclide,
+                               'Table_A2_DOE_STD_1196_2011')
 
-        result_tab5 = self.screen_Table_5_JAERI_dcf_inh_particulates_public_by_radionuclide(
-            "library/inhalation_HC2/Table_5_JAERI_dcf_inh_particulates_public.csv",
-            get_corrected_nuclide("Table_5_JAERI_dcf_inh_particulates_public.csv", radionuclide, alternate_names)
-        )
+        result_tab5 = screen(self.screen_Table_5_JAERI_dcf_inh_particulates_public_by_radionuclide,
+                             'Table_5_JAERI_DATA_CODE_2002_013')
 
-        result_tab7 = self.screen_Table_7_JAERI_dcf_inh_Public_Soluble_Reactive_Gases_Vapours_public_by_radionuclide(
-            "library/inhalation_HC2/Table_7_JAERI_dcf_inh_Public_Soluble_Reactive_Gases_Vapours.csv",
-            get_corrected_nuclide("Table_7_JAERI_dcf_inh_Public_Soluble_Reactive_Gases_Vapours.csv", radionuclide,
-                                  alternate_names)
-        )
+        result_tab7 = screen(self.screen_Table_7_JAERI_dcf_inh_Public_Soluble_Reactive_Gases_Vapours_public_by_radionuclide,
+                             'Table_7_JAERI_DATA_CODE_2002_013')
 
         # SUB HC2
-        result_sub_fgr15_hc2 = self.screen_Table_4_6_FGR_15_dcf_ecerman_submersion(
-            "library/submersion_HC2/Dose_Table_4_6_ecerman_final_FGR15.xlsx",
-            get_corrected_nuclide("Dose_Table_4_6_ecerman_final_FGR15.xlsx", radionuclide, alternate_names)
-        )
+        result_sub_fgr15_hc2 = screen(self.screen_Table_4_6_FGR_15_dcf_ecerman_submersion,
+                                      'Table_4_6_FGR15')
 
-        result_sub_dcf_doe_std = self.screen_Table_A3_DOE_STD_1196_2011_dcf_submersion(
-            "library/submersion_HC2/Table_A3_DOE_STD_1196_2011_dcf_submersion.xlsx",
-            get_corrected_nuclide("Table_A3_DOE_STD_1196_2011_dcf_submersion.xlsx", radionuclide, alternate_names)
-        )
+        result_sub_dcf_doe_std = screen(self.screen_Table_A3_DOE_STD_1196_2011_dcf_submersion,
+                                        'Table_A3_DOE_STD_1196_2011')
 
         # INH_HC3
-        result_annexa = self.screen_annex_a_icrp119_dcf_inhal_worker(
-            "library/inhalation_HC3/AnnexA_ICRP119_dcf_inhal_Worker.xlsx",
-            get_corrected_nuclide("AnnexA_ICRP119_dcf_inhal_Worker.xlsx", radionuclide, alternate_names)
-        )
+        result_annexa = screen(self.screen_annex_a_icrp119_dcf_inhal_worker,
+                               'Annex_A_ICRP_119')
 
-        result_annexb = self.screen_Annex_B_ICRP119_dcf_inhal_reactive_soluble_gases_worker(
-            "library/inhalation_HC3/AnnexB_ICRP119_dcf_inh_soluble_reactive_gas_worker.csv",
-            get_corrected_nuclide("AnnexB_ICRP119_dcf_inh_soluble_reactive_gas_worker.csv", radionuclide,
-                                  alternate_names)
-        )
+        result_annexb = screen(self.screen_Annex_B_ICRP119_dcf_inhal_reactive_soluble_gases_worker,
+                               'Annex_B_ICRP_119')
 
-        result_tab3 = self.screen_Table_3_JAERI_dcf_inh_ing_particulates_worker_by_radionuclide(
-            "library/inhalation_HC3/Table3_JAERI_dcf_ing_inh_PARTICULATES_Worker.csv",
-            get_corrected_nuclide("Table3_JAERI_dcf_ing_inh_PARTICULATES_Worker.csv", radionuclide, alternate_names)
-        )
+        result_tab3 = screen(self.screen_Table_3_JAERI_dcf_inh_ing_particulates_worker_by_radionuclide,
+                             'Table_3_JAERI_DATA_CODE_2002_013')
 
-        result_tab6 = self.screen_Table_6_JAERI_dcf_inh_public_soluble_reactive_gases_vapours_workers_by_radionuclide(
-            "library/inhalation_HC3/Table6_JAERI_dcf_Soluble_Reactive_Gases_Worker.csv",
-            get_corrected_nuclide("Table6_JAERI_dcf_Soluble_Reactive_Gases_Worker.csv", radionuclide, alternate_names)
-        )
+        result_tab6 = screen(self.screen_Table_6_JAERI_dcf_inh_public_soluble_reactive_gases_vapours_workers_by_radionuclide,
+                             'Table_6_JAERI_DATA_CODE_2002_013')
 
         # Merge dataframes
         merged_df_inh_hc2 = self.merge_dataframes_with_source_hc2(
@@ -833,23 +856,22 @@ class HAZCAT():
             "ing_adult": "HC3"
         }
 
-        # Iterate through each dataframe and column pair
-        for df, col_name in fields:
-            hc_category = hc_category_map.get(col_name, "Unknown HC")  # Get HC category
-
-            if isinstance(df, pd.DataFrame) and not df.empty:
-                # Print complete dataframe
-                print(f"\n========== COMPLETE DATA for {col_name} ({hc_category}) ==========\n")
-                print(df.to_string(index=False))  # Print entire dataframe
-                print(f"\nTotal Rows: {len(df)} | Columns: {list(df.columns)}\n")
-
-                # Print selected column preview
-                print(f"\n========== FINAL SCREENED DATA PREVIEW for {col_name} ({hc_category}) ==========\n")
-                print(df[["Nuclide", col_name, "Reference"]].head(10).to_string(index=False))  # Show first 10 rows
-                print(f"\nTotal Rows: {len(df)} | Selected Columns: ['Nuclide', '{col_name}', 'Reference']\n")
-
-            else:
-                print(f"\n========== No Data Available for {col_name} ({hc_category}) ==========\n")
+        # Dump each dataframe and column pair; formatting whole frames is expensive, so only at DEBUG
+        if dcf_log.isEnabledFor(logging.DEBUG):
+            for df, col_name in fields:
+                hc_category = hc_category_map.get(col_name, "Unknown HC")  # Get HC category
+
+                if isinstance(df, pd.DataFrame) and not df.empty:
+                    dcf_log.debug("\n========== COMPLETE DATA for %s (%s) ==========\n\n%s\n\n"
+                                  "Total Rows: %d | Columns: %s\n",
+                                  col_name, hc_category, df.to_string(index=False), len(df), list(df.columns))
+                    dcf_log.debug("\n========== FINAL SCREENED DATA PREVIEW for %s (%s) ==========\n\n%s\n\n"
+                                  "Total Rows: %d | Selected Columns: ['Nuclide', '%s', 'Reference']\n",
+                                  col_name, hc_category,
+                                  df[["Nuclide", col_name, "Reference"]].head(10).to_string(index=False), len(df),
+                                  col_name)
+                else:
+                    dcf_log.debug("\n========== No Data Available for %s (%s) ==========\n", col_name, hc_category)
 
         max_dcf_inh_hc2, max_dcf_sub_hc2, max_dcf_inh_hc3, max_dcf_ing_hc3 = [
             self.filter_max_value_by_reference(df, "Nuclide", col, "Reference") if isinstance(df,
@@ -864,72 +886,177 @@ class HAZCAT():
         # print('max_dcf_inh_hc3:', max_dcf_inh_hc3)
         return dict_dcf
 
-    # Define function to get atomic mass from CSV
-    def get_atomic_mass(self, nuclide_name, csv_file_path='library/MASS/massround_data_final.csv'):
+    def get_alternate_names(self, rads_list,
+                            fallback_file=NOMENCLATURE_TABLE):
         """
-        Reads a CSV file and returns the atomic mass for a given nuclide.
+        Alternate names of several radionuclides at once, as compute_max_dcf gets them from get_nuclide_info.
+
+        A nuclide only has alternate names when the nomenclature table lists it with at least one valid half-life.
 
         Parameters:
-            csv_file_path (str): Path to the CSV file.
-            nuclide_name (str): Nuclide identifier (e.g., "Cs-137").
+            rads_list (list): Radionuclide names.
+            fallback_file (str): Path to the nomenclature table.
 
         Returns:
-            str: Atomic mass of the nuclide, or None if not found.
+            dict: Radionuclide -> dictionary of alternate names (empty if there are none).
         """
-        try:
-            # Load the CSV file
-            df = pd.read_csv(csv_file_path)
-
-            def clean_nuclide_name(nuclide_name):
-                """
-                Removes any trailing lowercase letters from the nuclide name.
-
-                Parameters:
-                    nuclide_name (str): Original nuclide name.
-
-                Returns:
-                    str: Cleaned nuclide name.
-                """
-                return re.sub(r'[a-z]+$', '', nuclide_name)
-
-            nuclide_name = clean_nuclide_name(nuclide_name)
-            # print('mass_:', nuclide_name)
-            # if len(nuclide_name.split('m')) > 1:
-            #    nuclide_name = nuclide_name.split('m')[0]
-            # else:
-            #    nuclide_name = nuclide_name
-
-            # Ensure 'Nuclide' and 'Atomic Mass' columns exist
-            if "Nuclide" not in df.columns or "Atomic Mass" not in df.columns:
-                raise ValueError("CSV file does not contain required columns.")
-
-            # Search for the nuclide
-            result = df.loc[df["Nuclide"] == nuclide_name, "Atomic Mass"]
-
-            atomic_mass = result.iloc[0]
-            if len(atomic_mass.split('.')) > 2:
-                am = float(atomic_mass.split('.')[0] + '.' + atomic_mass.split('.')[1])
-                # print(am)
+        fallback_df = library_cache.read_csv(fallback_file)
+        rows = fallback_df[fallback_df["Fixed_nuclide_name"].isin(list(rads_list))]
+
+        names = {rad: {} for rad in rads_list}
+        for rad, fallback_data in rows.groupby("Fixed_nuclide_name", sort=False):
+            alternate_names, half_life_values = self._nomenclature_entry(fallback_data)
+            if half_life_values:
+                names[rad] = alternate_names
+        return names
+
+    def compute_max_dcf_batch(self, rads_list=None):
+        """
+        Computes the maximum dose conversion factors for a whole list of radionuclides in one pass.
+
+        Gives the same values as calling compute_max_dcf for every radionuclide, but alternate names are resolved
+        for all nuclides at once, every DCF table is gathered once through its nuclide index, each category is
+        merged once and the ICRP119/FGR -> DOE-STD -> JAERI selection runs as a single groupby.
+
+        Parameters:
+            rads_list (list, optional): Radionuclide names. Defaults to the configured rads_list.
+
+        Returns:
+            dict: Radionuclide -> dictionary with the same DCF keys as compute_max_dcf.
+        """
+        rads = list(dict.fromkeys(self.rads_list if rads_list is None else rads_list))
+        with profiler.stage('name_resolution'):
+            alternate_names = self.get_alternate_names(rads)
+        library = load_dcf_library()
+
+        def gather(name, valid_for):
+            """Rows of one library table matching any radionuclide, tagged with the radionuclide and source."""
+            df = library.get(name)
+            if df is None or "Nuclide" not in df.columns:
+                return None
+            file_name = os.path.basename(dcf_table_path(name))
+            queries = [self.get_corrected_nuclide(file_name, rad, alternate_names[rad]) for rad in rads]
+            positions, owner = library.index(name).rows_many(queries, errors='ignore')
+            rows = df.iloc[positions].reset_index(drop=True)
+            rows["Radionuclide"] = np.asarray(rads, dtype=object)[owner]
+            rows["Reference"] = name
+            rows["Valid for"] = valid_for
+            return rows
+
+        def merge(*frames):
+            frames = [df for df in frames if df is not None and not df.empty]
+            return pd.concat(frames, ignore_index=True, sort=False) if frames else None
+
+        # Same tables and merge order as compute_max_dcf
+        annexa = gather('Annex_A_ICRP_119', 'Worker')
+        tab3 = gather('Table_3_JAERI_DATA_CODE_2002_013', 'Worker')
+
+        merged_df_inh_hc2 = merge(gather('Table_7_JAERI_DATA_CODE_2002_013', 'Public'),
+                                  gather('Table_5_JAERI_DATA_CODE_2002_013', 'Public'),
+                                  gather('Table_A2_DOE_STD_1196_2011', 'Public'),
+                                  gather('Annex_G_ICRP_119', 'Public'),
+                                  gather('Annex_H_ICRP_119', 'Public'))
+        merged_df_sub_hc2 = merge(gather('Table_4_6_FGR15', 'Public'),
+                                  gather('Table_A3_DOE_STD_1196_2011', 'Public'))
+        merged_df_inh_hc3 = merge(annexa,
+                                  gather('Annex_B_ICRP_119', 'Worker'),
+                                  tab3,
+                                  gather('Table_6_JAERI_DATA_CODE_2002_013', 'Worker'))
+        merged_df_ing_hc3 = merge(annexa, tab3)
+
+        # Take the maximum comparing both the inhalation columns (1 and 5 micron AMAD)
+        if merged_df_inh_hc3 is not None:
+            # Unparseable entries become NaN here instead of aborting the whole batch
+            merged_df_inh_hc3["max_inh_adult_hc3"] = merged_df_inh_hc3[
+                ["inh_adult_1mu_m", "inh_adult_5mu_m"]].apply(pd.to_numeric, errors='coerce').max(axis=1, skipna=True)
+
+        fields = {
+            'max_dcf_inh_hc2': (merged_df_inh_hc2, "inh_adult"),
+            'max_dcf_sub_hc2': (merged_df_sub_hc2, "sub_adult"),
+            'max_dcf_inh_hc3': (merged_df_inh_hc3, "max_inh_adult_hc3"),
+            'max_dcf_ing_hc3': (merged_df_ing_hc3, "ing_adult"),
+        }
+
+        dcfs = {rad: {} for rad in rads}
+        selections = []
+        for key, (df, col_name) in fields.items():
+            if df is None:
+                selection = pd.DataFrame(columns=["value", "tier", "source"])
             else:
-                am = float(atomic_mass)
+                selection = self.reduce_by_reference_priority(df, "Radionuclide", "Nuclide", col_name, "Reference")
+            max_values = dict(zip(selection.index, selection["value"].to_numpy(dtype=float)))
+            for rad in rads:
+                dcfs[rad][key] = max_values.get(rad, np.nan)
+            selection = selection.reindex(rads)
+            selection["source"] = selection["source"].fillna("No data available")
+            selections.append(selection.assign(DCF=key))
+
+        # Which table every selected DCF came from, for reports and the CSV output
+        self.dcf_provenance = pd.concat(selections).rename_axis("Radionuclide").reset_index()[
+            ["Radionuclide", "DCF", "value", "tier", "source"]]
+
+        dcf_log.info("Screened %d radionuclides against %d DCF tables", len(rads), len(library.tables),
+                     extra={'nuclides': len(rads), 'tables': len(library.tables)})
+        return dcfs
+
+    def get_dcf_provenance(self, rads_list=None):
+        """
+        One-line description of the source table of every DCF selected by compute_max_dcf_batch.
 
-            # Return the atomic mass if found
-            return am
+        Parameters:
+            rads_list (list, optional): Radionuclide names. Defaults to the configured rads_list.
 
-        except Exception as e:
-            return str(e)
+        Returns:
+            list: Strings such as "inh_hc2: Annex_G_ICRP_119; sub_hc2: Table_4_6_FGR15; ...", one per radionuclide.
+        """
+        rads_list = self.rads_list if rads_list is None else rads_list
+        if getattr(self, "dcf_provenance", None) is None:
+            self.compute_max_dcf_batch(rads_list)
+
+        labels = {}
+        for row in self.dcf_provenance.itertuples(index=False):
+            labels.setdefault(row.Radionuclide, []).append(f"{row.DCF.replace('max_dcf_', '')}: {row.source}")
+        return ["; ".join(labels.get(rad, [])) for rad in rads_list]
+
+    # Define function to get atomic mass from CSV
+    def get_atomic_masses(self, rads_list=None):
+        """
+        Atomic masses of several nuclides in one call, from the pre-parsed (Z, A, isomer) mass array.
+
+        Metastable states (e.g. "Ba-137m") get the ground-state mass.
+
+        Parameters:
+            rads_list (list, optional): Nuclide names. Defaults to the configured rads_list.
+
+        Returns:
+            tuple: (masses, error) NumPy arrays; masses (u, float64) is NaN where error is True.
+        """
+        rads_list = list(self.rads_list if rads_list is None else rads_list)
+        return load_mass_table().masses(rads_list)
+
+    def get_atomic_mass(self, nuclide_name):
+        """
+        Returns the atomic mass for a given nuclide.
+
+        Parameters:
+            nuclide_name (str): Nuclide identifier (e.g., "Cs-137").
+
+        Returns:
+            float: Atomic mass of the nuclide (u), NaN if not found (see get_atomic_masses).
+        """
+        masses, _ = self.get_atomic_masses([nuclide_name])
+        return float(masses[0])
 
     def find_aws(self):
         # rads_list = ['Ir-192', 'Co-60']
-        AWS = []
-        for rad in self.rads_list:
-            am = self.get_atomic_mass(rad)
-            AWS.append(np.float32(am))
-        return AWS
+        masses = self.nuclide_properties()['atomic_mass']
+        for rad in np.asarray(self.rads_list, dtype=object)[np.isnan(masses)]:
+            nuclide_log.warning("atomic mass of %s not found", rad, extra={'nuclide': rad})
+        return [np.float32(am) for am in masses]
 
     '''
     def find_aws(self):
-        xls = pd.ExcelFile("library/AWS.xls")
+        xls = pd.ExcelFile(ATOMIC_WEIGHT_WORKBOOK)
         df_tq = pd.read_excel(xls)
         df_tq.dropna(axis=0, how='all', inplace=True)
         # rads_list = ['Ir-192', 'Co-60']
@@ -946,8 +1073,7 @@ class HAZCAT():
     '''
 
     def get_bv(self):
-        xls = pd.ExcelFile("library/doe_haz_cat_excel.xlsx")
-        df_tq = pd.read_excel(xls, sheet_name='r_bv')
+        df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='r_bv')
         df_tq.dropna(axis=0, how='all', inplace=True)
         BV = []
         for rad in self.rads_list:
@@ -957,8 +1083,7 @@ class HAZCAT():
         return BV
 
     def get_R_HC3(self):
-        xls = pd.ExcelFile("library/doe_haz_cat_excel.xlsx")
-        df_tq = pd.read_excel(xls, sheet_name='r_bv')
+        df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='r_bv')
         df_tq.dropna(axis=0, how='all', inplace=True)
         R = []
         for rad in self.rads_list:
@@ -985,73 +1110,68 @@ class HAZCAT():
                 Rs.append(R)
         return Rs
 
-    def get_nuclide_info(self, nuclide_name,
-                         primary_file="library/half_life/radionuclides_halflife_complete.csv",
-                         jaeri_file="library/half_life/Table1_2_JAERI_half_life.csv",
-                         fallback_file="library/half_life/formatted_nuclide_nomenclature.csv"):
-        """Retrieve nuclide information from fallback, primary, and JAERI datasets, and merge additional info."""
+    def _nomenclature_entry(self, fallback_data):
+        """
+        Alternate names and half-lives (s) of one nuclide from its rows of the nomenclature table.
 
-        def convert_half_life_to_seconds(half_life):
-            """Convert half-life string with unit to seconds."""
-            units = {"ls": 1e-6, "ms": 1e-3, "s": 1, "m": 60, "h": 3600, "d": 86400, "y": 31556952}
+        Args:
+            fallback_data (pd.DataFrame): Rows of formatted_nuclide_nomenclature.csv for the nuclide.
+
+        Returns:
+            tuple: (alternate names dict without missing values, list of half-lives in seconds)
+        """
+        # Extract alternate names
+        alternate_names = {
+            "DOE_STD_1196_name": fallback_data["DOE_STD_1196_name"].values[
+                0] if "DOE_STD_1196_name" in fallback_data.columns else None,
+            "FGR_12_name": fallback_data["FGR_12_name"].values[
+                0] if "FGR_12_name" in fallback_data.columns else None,
+            "ICRP119_107_name": fallback_data["ICRP119_107_name"].values[
+                0] if "ICRP119_107_name" in fallback_data.columns else None,
+            "ICRP_38_name": fallback_data["ICRP_38_name"].values[
+                0] if "ICRP_38_name" in fallback_data.columns else None,
+        }
 
-            if isinstance(half_life, (int, float)):  # If already numeric, return as is
-                return half_life
+        # Remove None/NaN values from alternate names
+        alternate_names = {key: value for key, value in alternate_names.items() if
+                           pd.notna(value) and value is not None}
+
+        # Extract and convert half-life values
+        half_life_values = []
+        for i in range(5):  # Check multiple half-life columns
+            half_life_col = f"Half-life{'' if i == 0 else '.' + str(i)}"
+            unit_col = f"unit{'' if i == 0 else '.' + str(i)}"
+
+            if half_life_col in fallback_data.columns and unit_col in fallback_data.columns:
+                half_life_list = fallback_data[half_life_col].dropna().tolist()
+                unit_list = fallback_data[unit_col].dropna().tolist()
+
+                # Convert using list comprehension
+                converted_values = [
+                    convert_half_life_to_seconds(f"{hl} {unit}")
+                    for hl, unit in zip(half_life_list, unit_list)
+                    if pd.notna(hl) and pd.notna(unit)  # Ensure valid values
+                ]
 
-            if isinstance(half_life, str):
-                half_life = half_life.strip()
-                for unit, factor in units.items():
-                    if half_life.endswith(unit):
-                        try:
-                            value = float(half_life.replace(unit, "").strip())
-                            return value * factor
-                        except ValueError:
-                            return None  # If conversion fails
+                half_life_values.extend(filter(None, converted_values))  # Remove None values
 
-            return None  # If no match
+        return alternate_names, half_life_values
+
+    def get_nuclide_info(self, nuclide_name,
+                         primary_file=HALF_LIFE_TABLE,
+                         jaeri_file=JAERI_HALF_LIFE_TABLE,
+                         fallback_file=NOMENCLATURE_TABLE):
+        """Retrieve nuclide information from fallback, primary, and JAERI datasets, and merge additional info."""
 
         # Load fallback dataset first
-        fallback_df = pd.read_csv(fallback_file)
+        fallback_df = library_cache.read_csv(fallback_file)
         fallback_data = fallback_df[fallback_df["Fixed_nuclide_name"] == nuclide_name]
 
         dict_info = {}
         alternate_names = {}
 
         if not fallback_data.empty:
-            # Extract alternate names
-            alternate_names = {
-                "DOE_STD_1196_name": fallback_data["DOE_STD_1196_name"].values[
-                    0] if "DOE_STD_1196_name" in fallback_data.columns else None,
-                "FGR_12_name": fallback_data["FGR_12_name"].values[
-                    0] if "FGR_12_name" in fallback_data.columns else None,
-                "ICRP119_107_name": fallback_data["ICRP119_107_name"].values[
-                    0] if "ICRP119_107_name" in fallback_data.columns else None,
-                "ICRP_38_name": fallback_data["ICRP_38_name"].values[
-                    0] if "ICRP_38_name" in fallback_data.columns else None,
-            }
-
-            # Remove None/NaN values from alternate names
-            alternate_names = {key: value for key, value in alternate_names.items() if
-                               pd.notna(value) and value is not None}
-
-            # Extract and convert half-life values
-            half_life_values = []
-            for i in range(5):  # Check multiple half-life columns
-                half_life_col = f"Half-life{'' if i == 0 else '.' + str(i)}"
-                unit_col = f"unit{'' if i == 0 else '.' + str(i)}"
-
-                if half_life_col in fallback_data.columns and unit_col in fallback_data.columns:
-                    half_life_list = fallback_data[half_life_col].dropna().tolist()
-                    unit_list = fallback_data[unit_col].dropna().tolist()
-
-                    # Convert using list comprehension
-                    converted_values = [
-                        convert_half_life_to_seconds(f"{hl} {unit}")
-                        for hl, unit in zip(half_life_list, unit_list)
-                        if pd.notna(hl) and pd.notna(unit)  # Ensure valid values
-                    ]
-
-                    half_life_values.extend(filter(None, converted_values))  # Remove None values
+            alternate_names, half_life_values = self._nomenclature_entry(fallback_data)
 
             # If valid half-life found, compute decay constant
             if half_life_values:
@@ -1061,7 +1181,7 @@ class HAZCAT():
                              "Half-life (s)": max_half_life, "Decay Constant (s^-1)": decay_constant}
 
         # Search primary dataset and populate dict_info with missing values
-        df = pd.read_csv(primary_file)
+        df = library_cache.read_csv(primary_file)
         # USING ICRP-107 nomenclature to find photon data, half life
         if alternate_names and 'ICRP119_107_name' in alternate_names:
             nuclide_name = alternate_names['ICRP119_107_name']
@@ -1087,7 +1207,7 @@ class HAZCAT():
 
         # If nuclide still not found, search JAERI dataset
         if not dict_info:
-            jaeri_df = pd.read_csv(jaeri_file).dropna()
+            jaeri_df = library_cache.read_csv(jaeri_file).dropna()
             nuclide_data = jaeri_df[jaeri_df["Nuclide"] == nuclide_name]
 
             if not nuclide_data.empty:
@@ -1110,16 +1230,81 @@ class HAZCAT():
     # Example usage:
     # print(get_nuclide_info("Ir-179"))
 
-    def halflives_lambda_rads_from_rads_list(self):
-        half_lives = []
-        lambda_of_rads = []
-        for nuclide_name in self.rads_list:
-            nuclide_info = self.get_nuclide_info(nuclide_name)
-            print(nuclide_info)
-            half_lives.append(nuclide_info['Half-life (s)'])
-            lambda_of_rads.append(nuclide_info['Decay Constant (s^-1)'])
+    def _nuclide_record(self, nuclide_name, z_of_symbol, atomic_mass):
+        """One NUCLIDE_DTYPE record, taking every other value from get_nuclide_info."""
+        info = self.get_nuclide_info(nuclide_name)
+        if not isinstance(info, dict):
+            info = {}
+
+        def as_float(value):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return np.nan
+
+        symbol, _, rest = nuclide_name.partition('-')
+        mass_number = re.match(r'\d+', rest)
+        decay_mode = info.get('Decay mode')
+
+        return (nuclide_name,
+                z_of_symbol.get(symbol, -1),
+                int(mass_number.group()) if mass_number else -1,
+                as_float(info.get('Half-life (s)')),
+                as_float(info.get('Decay Constant (s^-1)')),
+                atomic_mass,
+                as_float(info.get('Photon')),
+                decay_mode if isinstance(decay_mode, str) else '')
+
+    def build_nuclide_records(self, names=None):
+        """
+        Records of the consolidated nuclide property table (see hazcat_library.NUCLIDE_DTYPE).
 
-        half_lives = np.array(half_lives)
+        Parameters:
+            names (iterable, optional): Nuclides to include. Defaults to every nuclide of the half-life,
+                nomenclature, JAERI and DOE threshold tables.
+
+        Returns:
+            np.ndarray: Structured array, one record per nuclide.
+        """
+        if names is None:
+            names = set(library_cache.read_csv(HALF_LIFE_TABLE)["Nuclide"].dropna())
+            names.update(library_cache.read_csv(NOMENCLATURE_TABLE)["Fixed_nuclide_name"].dropna())
+            names.update(library_cache.read_csv(JAERI_HALF_LIFE_TABLE)["Nuclide"].dropna())
+            names.update(library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='thresholds')["Radionuclide"].dropna())
+            names = sorted(str(n) for n in names)
+
+        z_of_symbol = load_mass_table().z_of_symbol
+        masses = self.get_atomic_masses(names)[0]
+        return np.array([self._nuclide_record(name, z_of_symbol, mass) for name, mass in zip(names, masses)],
+                        dtype=NUCLIDE_DTYPE)
+
+    def nuclide_properties(self, rads_list=None):
+        """
+        Property records of several nuclides from the memory-mapped nuclide table.
+
+        Nuclides that are not in the table are resolved from the source tables directly.
+
+        Parameters:
+            rads_list (list, optional): Radionuclide names. Defaults to the configured rads_list.
+
+        Returns:
+            np.ndarray: Structured array (NUCLIDE_DTYPE) in the order of rads_list.
+        """
+        rads_list = list(self.rads_list if rads_list is None else rads_list)
+        table = load_nuclide_table(self.build_nuclide_records)
+        records = table.take(rads_list)
+        missing = [rad for rad in rads_list if rad not in table]
+        if missing:
+            extra = dict(zip(missing, self.build_nuclide_records(missing)))
+            for ndx, rad in enumerate(rads_list):
+                if rad in extra:
+                    records[ndx] = extra[rad]
+        return records
+
+    def halflives_lambda_rads_from_rads_list(self):
+        properties = self.nuclide_properties()
+        half_lives = properties['half_life_s'].copy()
+        lambda_of_rads = properties['decay_constant'].tolist()
 
         # unit: /second
         self.lambda_of_rads = lambda_of_rads
@@ -1129,7 +1314,7 @@ class HAZCAT():
 
         return self.list_half_life, self.lambda_of_rads
 
-    def inhalation_dcf_list(self, master_file='library/RadioToxicityMaster.xls',
+    def inhalation_dcf_list(self, master_file=RADIOTOXICITY_WORKBOOK,
                             sheet_name='Inhalation CED Sv per Bq Public',
                             age=18):
         """
@@ -1149,8 +1334,7 @@ class HAZCAT():
         Raises:
             ValueError: If the age of the recipient is not a number.
         """
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name)
+        name = library_cache.read_excel(master_file, sheet_name)
         name.dropna(axis=0, how='all', inplace=True)
         dcfs = []
 
@@ -1181,7 +1365,7 @@ class HAZCAT():
         self.inhalation_dcf = np.array(dcfs)
         return self.inhalation_dcf
 
-    def inhalation_dcf_list_worker(self, master_file='library/worker_icrp119.xlsx',
+    def inhalation_dcf_list_worker(self, master_file=WORKER_ICRP119_WORKBOOK,
                                    sheet_name='Sheet1'):
         """
         Return Dose conversion Factors (Inhalation) specific to age and radionuclide.
@@ -1202,8 +1386,7 @@ class HAZCAT():
             
         # DO NOT ACCURATELY WORK FOR H-3, C-11, C-14, S-35 as these are having many chemical forms. Its in TO-DO tasks
         """
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name)
+        name = library_cache.read_excel(master_file, sheet_name)
         name.dropna(axis=0, how='all', inplace=True)
         dcfs = []
 
@@ -1220,7 +1403,7 @@ class HAZCAT():
         inhalation_dcf = np.array(dcfs)
         return inhalation_dcf
 
-    def ingestion_dcf_list_worker(self, master_file='library/worker_icrp119.xlsx',
+    def ingestion_dcf_list_worker(self, master_file=WORKER_ICRP119_WORKBOOK,
                                   sheet_name='Sheet1'):
         """
         Return Dose conversion Factors (ingestion) specific to age and radionuclide.
@@ -1241,8 +1424,7 @@ class HAZCAT():
 
         # DO NOT ACCURATELY WORK FOR H-3, C-11, C-14, S-35 as these are having many chemical forms. Its in TO-DO tasks
         """
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name)
+        name = library_cache.read_excel(master_file, sheet_name)
         name.dropna(axis=0, how='all', inplace=True)
         dcfs = []
 
@@ -1258,83 +1440,128 @@ class HAZCAT():
         ingestion_dcf = np.array(dcfs)
         return ingestion_dcf
 
-    def find_progeny_name_and_yield_f(self, rad, master_file="library/dcf_corr.xlsx"):
+    def progeny_half_life_cutoff(self):
+        """
+        Longest half-life (s) of the progeny whose dose is added to that of the parent.
+
+        This is `ignore_half_life` when `consider_progeny` is set and 0 otherwise, so that only the short-lived
+        progeny are considered; a missing `ignore_half_life` is treated as 0.
+        """
+        # 30 minute (default)
+        if self.config.get('consider_progeny'):
+            return self.config.get('ignore_half_life') or 0
+        return 0
+
+    def get_progeny(self, rad):
+        """
+        Return the progeny of a radionuclide from the compiled decay graph.
+
+        Progeny are only returned when `consider_progeny` is set, and only those whose half-life does not exceed
+        `ignore_half_life` (seconds), as in find_progeny_name_and_yield_f; the chain is still followed through
+        the longer-lived ones.
+
+        Args:
+            rad (str): The name of the radionuclide.
+
+        Returns:
+            tuple: (names, branching) numpy arrays in decay order; branching is the fraction of decays of `rad`
+            that lead to each progeny.
+        """
+        if not self.config.get('consider_progeny'):
+            return np.array([], dtype=str), np.array([])
+        return load_decay_graph().descendants(rad, max_half_life=self.progeny_half_life_cutoff())
+
+    def find_progeny_name_and_yield_f(self, rad):
         """
             Return the names and fractional yields of progeny radionuclides for a given radionuclide.
 
-            This method reads data from the specified Excel file to find the names and fractional yields of progeny radionuclides
-            for a given radionuclide. It allows users to specify a threshold (in seconds) to ignore progeny with half-lives
-            shorter than the threshold.
+            The direct daughters are taken from the compiled decay graph ("Daughter Products" column of
+            radionuclides_halflife_complete.csv). Only daughters whose half-life does not exceed `ignore_half_life`
+            (seconds) are returned, i.e. the short-lived progeny whose dose is added to that of the parent.
 
             Args:
                 rad (str): The name of the radionuclide.
-                master_file (str): The path to the Excel file containing data with progeny radionuclides and fractional yields.
 
             Returns:
                 tuple: A tuple containing two numpy arrays:
                     - An array of strings representing the names of progeny radionuclides.
                     - An array of floats representing the fractional yields of progeny radionuclides.
+        """
+        ignore_half_life = self.progeny_half_life_cutoff()
+        graph = load_decay_graph()
+        if rad not in graph.ids:
+            return np.array([], dtype=str), np.array([])
+        daughters, frac_yield = graph.children(graph.ids[rad])
+        keep = graph.half_life[daughters] <= ignore_half_life
+        return graph.names[daughters[keep]], frac_yield[keep]
+
+    def progeny_activities(self, times, rads_list=None):
+        """
+        Activities of the decay chains of the radionuclides after ingrowth, from a vectorized Bateman solution.
 
-            Raises:
-                ValueError: If the unit of half-life for radionuclides is not recognized.
+        Args:
+            times (float or array-like): Times since the parent was pure (s).
+            rads_list (list, optional): Parent radionuclides. Defaults to self.rads_list.
+
+        Returns:
+            tuple: (nodes, activities) as returned by hazcat_kernels.bateman_activities; activities has shape
+            (len(rads_list), len(nodes), len(times)) in Bq per Bq of parent at t = 0.
         """
+        from hazcat_kernels import bateman_activities
 
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name=0,
-                             names=['Element', 'Nuclide', 'halflife_and_daughters', 'decaymode_and_yield',
-                                    'alpha_energy', 'electron_energy', 'photon_energy', 'total_mev_per_nt'], skiprows=0)
-        name.dropna(axis=0, how='all', inplace=True)
-        # 30 minute (default)
-        if self.config['consider_progeny']:
-            ignore_half_life = self.config['ignore_half_life']
-        else:
-            ignore_half_life = 0
-        daughter_list = []
-        frac_yield = []
-        lambda_of_rads = []
-        search_string = '|'.join([rad])
-        df = name[name['Nuclide'] == search_string]
-        index = df.index[0]
-        i = 1
-        while name.iloc[[index + i]].isnull().any()['Nuclide']:
-            search_string = '|'.join(name.iloc[[index + i]]['halflife_and_daughters'])
-            df1 = name[name['Nuclide'].str.contains(search_string, na=False)]
-            for _, ndx in zip(df1['Nuclide'].values, df1['Nuclide'].index):
-                if str(_) == search_string:
-                    hlf = name.iloc[[ndx]]['halflife_and_daughters'].values[0]
-                    if str('s') in hlf:
-                        x = float(hlf[:-1])
-
-                    elif str('m') in hlf:
-                        x = float(hlf[:-1])
-                        x = x * 60
-
-                    elif str('d') in hlf:
-                        x = float(hlf[:-1])
-                        x = x * 3600 * 24
-
-                    elif str('a') in hlf or str('y') in hlf:
-                        x = float(hlf[:-1])
-                        x = x * 3600 * 24 * 365
-
-                    elif str('h') in hlf:
-                        x = float(hlf[:-1])
-                        x = x * 3600
-                        lambda_of_rad = (0.693 / x)
-                        lambda_of_rads.append(lambda_of_rad)
+        rads_list = self.rads_list if rads_list is None else rads_list
+        return bateman_activities(load_decay_graph(), rads_list, times)
 
-                    else:
-                        raise ValueError('the unit of half-life for radionuclides should be in format a (annual),'
-                                         'd (day), h (hour), m (minute), s (second)')
+    def progeny_weighted_dcfs(self, dcfs_dicts_rads_list, ingrowth_time, rads_list=None):
+        """
+        Fold the DCFs of the ingrown progeny into the DCFs of their parents.
 
-                    if x <= ignore_half_life:
-                        daughter_list.append(name.iloc[[ndx]]['Nuclide'].values)
-                        frac_yield.append(name.iloc[[index + i]]['decaymode_and_yield'].values)
-            i += 1
+        For every DCF the effective value per Bq of parent is
+            DCF_parent + sum_d (A_d(t) / A_parent(t)) * DCF_d
+        with the activity ratios from the Bateman solution at `ingrowth_time`, over every radioactive descendant
+        of the parent. The `consider_progeny`/`ignore_half_life` settings do not apply here: they select the progeny
+        of the yield-based path (find_progeny_name_and_yield_f), whereas the activity ratios already weigh the
+        long-lived progeny by how far they have grown in. Progeny without a DCF contribute nothing.
 
-        daughter_list = np.array(daughter_list).flatten()
-        frac_yield = np.array(frac_yield).flatten()
-        return daughter_list, frac_yield
+        Args:
+            dcfs_dicts_rads_list (dict): DCF dictionaries per radionuclide (see compute_max_dcf_batch).
+            ingrowth_time (float): Time since the parent was pure (s).
+            rads_list (list, optional): Radionuclides to fold. Defaults to self.rads_list.
+
+        Returns:
+            dict: New DCF dictionaries with the progeny contributions added.
+        """
+        rads_list = self.rads_list if rads_list is None else rads_list
+        nodes, activities = self.progeny_activities([ingrowth_time], rads_list)
+        activities = activities[:, :, 0]
+
+        graph = load_decay_graph()
+        # DCFs of the chain members that are not parents themselves, without touching the provenance recorded for
+        # the parents
+        progeny = activities.any(axis=0) & ~np.isin(nodes, list(rads_list))
+        provenance = self.dcf_provenance
+        progeny_dcfs = self.compute_max_dcf_batch(list(nodes[progeny])) if progeny.any() else {}
+        self.dcf_provenance = provenance
+        progeny_dcfs.update((rad, dcfs_dicts_rads_list[rad]) for rad in rads_list)
+
+        folded = {}
+        for p, rad in enumerate(rads_list):
+            dcfs = dict(dcfs_dicts_rads_list[rad])
+            folded[rad] = dcfs
+            if rad not in graph.ids:
+                continue
+            parent_activity = activities[p, nodes == rad]
+            if not parent_activity.size or parent_activity[0] <= 0:
+                continue
+            with np.errstate(over='ignore'):
+                ratios = activities[p] / parent_activity[0]
+            for d in np.flatnonzero(np.isfinite(ratios) & (ratios > 0) & (nodes != rad)):
+                for key, value in progeny_dcfs[nodes[d]].items():
+                    value = self._convert_to_float(value)
+                    if np.isfinite(value):
+                        base = self._convert_to_float(dcfs.get(key, 0))
+                        dcfs[key] = np.float64((0.0 if np.isnan(base) else base) + ratios[d] * value)
+        return folded
 
     def get_dcf_sub_inert_gas_same_for_worker_and_public(self):
         """
@@ -1394,7 +1621,7 @@ class HAZCAT():
         df["dcf_sub (Sv/sec per Bq/m^3)"] = df["dcf_sub (Sv/day per Bq/m^3)"].astype(float) / 86400
         return df
 
-    def dcf_list_ecerman_submersion_include_progeny(self, master_file="library/Dose_ecerman_final.xlsx",
+    def dcf_list_ecerman_submersion_include_progeny(self, master_file=ECKERMAN_WORKBOOK,
                                                     sheet_name="submersion_dose",
                                                     age=18):
 
@@ -1422,8 +1649,7 @@ class HAZCAT():
 
         # consider_progeny = self.config['consider_progeny']
         consider_progeny = False
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name)
+        name = library_cache.read_excel(master_file, sheet_name)
         name.dropna(axis=0, how='all', inplace=True)
         dcfs = []
         dcf_corr_list = []
@@ -1448,7 +1674,7 @@ class HAZCAT():
 
             dcf_corr = dcf
             if consider_progeny:
-                daughter_list, frac_yield = self.find_progeny_name_and_yield_f(rad, master_file="library/dcf_corr.xlsx")
+                daughter_list, frac_yield = self.find_progeny_name_and_yield_f(rad)
                 for d, y in zip(daughter_list, frac_yield):
                     search_string = '|'.join([d])
                     df = name[name['Nuclide'].str.contains(search_string, na=False)]
@@ -1487,7 +1713,7 @@ class HAZCAT():
                 dcfs_combo.append(t)
             return dcfs_combo
 
-    def dcf_list_ecerman_ground_shine(self, master_file="library/Dose_ecerman_final.xlsx", sheet_name="surface_dose",
+    def dcf_list_ecerman_ground_shine(self, master_file=ECKERMAN_WORKBOOK, sheet_name="surface_dose",
                                       age=18):
         """
         Return Dose conversion Factors (Ground Shine) specific to age and radionuclide.
@@ -1506,8 +1732,7 @@ class HAZCAT():
         Raises:
             ValueError: If the age of the recipient is not a number.
         """
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name)
+        name = library_cache.read_excel(master_file, sheet_name)
         name.dropna(axis=0, how='all', inplace=True)
         dcfs = []
 
@@ -1535,7 +1760,7 @@ class HAZCAT():
 
         return self.dcfs_gs
 
-    def dcf_list_ecerman_ground_shine_include_progeny(self, master_file="library/Dose_ecerman_final.xlsx",
+    def dcf_list_ecerman_ground_shine_include_progeny(self, master_file=ECKERMAN_WORKBOOK,
                                                       sheet_name='surface_dose',
                                                       age=18, consider_progeny=True):
         """
@@ -1560,8 +1785,7 @@ class HAZCAT():
             Raises:
                 ValueError: If the age of the recipient is not a number.
         """
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name)
+        name = library_cache.read_excel(master_file, sheet_name)
         name.dropna(axis=0, how='all', inplace=True)
 
         dcfs = []
@@ -1585,7 +1809,7 @@ class HAZCAT():
             else:
                 raise ValueError('The age of recipient must be a number.')
             dcf_corr = dcf_
-            daughter_list, frac_yield = self.find_progeny_name_and_yield_f(rad, master_file='library/dcf_corr.xlsx')
+            daughter_list, frac_yield = self.find_progeny_name_and_yield_f(rad)
 
             if consider_progeny:
                 for d, y in zip(daughter_list, frac_yield):
@@ -1626,7 +1850,7 @@ class HAZCAT():
                 dcfs_combo.append(t)
             return dcfs_combo
 
-    def dcf_list_ingestion(self, master_file="library/Dose_ecerman_final.xlsx", sheet_name="ingestion_gsr3", age=18):
+    def dcf_list_ingestion(self, master_file=ECKERMAN_WORKBOOK, sheet_name="ingestion_gsr3", age=18):
         """
         Return Dose Conversion Factors (Ingestion) specific to age and radionuclide.
 
@@ -1646,8 +1870,7 @@ class HAZCAT():
         Raises:
             ValueError: If the age of the recipient is not a valid number.
         """
-        xls = pd.ExcelFile(master_file)
-        name = pd.read_excel(xls, sheet_name)
+        name = library_cache.read_excel(master_file, sheet_name)
         name.dropna(axis=0, how='all', inplace=True)
         dcfs = []
         for rad in self.rads_list:
@@ -1695,44 +1918,159 @@ class HAZCAT():
         return self.dcfs_ingestion
 
     def read_us_doe_std_1027_2018(self, rad):
-        xls = pd.ExcelFile("library/doe_haz_cat_excel.xlsx")
-        df_tq = pd.read_excel(xls, sheet_name='thresholds')
+        df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='thresholds')
         df_tq.dropna(axis=0, how='all', inplace=True)
         search_string = '|'.join([str(rad)])
         df_tq = df_tq[df_tq['Radionuclide'] == search_string]
         return df_tq
 
+    def read_us_doe_std_1027_2018_thresholds(self, rads_list=None):
+        """
+        DOE-STD-1027-2018 threshold rows of the radionuclides, in the order of rads_list (NaN where not tabulated).
+        """
+        rads_list = self.rads_list if rads_list is None else rads_list
+        df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='thresholds')
+        df_tq = df_tq.dropna(axis=0, how='all').drop_duplicates('Radionuclide').set_index('Radionuclide')
+        return df_tq.reindex(pd.Index(rads_list, name='Radionuclide')).reset_index()
+
+    def compute_nuclide_records(self, rads_list=None):
+        """
+        Inputs of the HazCat computation that depend only on the nuclide and the library.
+
+        Parameters:
+            rads_list (list, optional): Radionuclide names. Defaults to the configured rads_list.
+
+        Returns:
+            dict: Nuclide name -> record with the DCF dictionary ('dcfs'), its provenance ('dcf_provenance') and
+            the properties 'half_life', 'aw', 'E1', 'BV', 'R_HC2' and 'R_HC3'.
+        """
+        rads_list = list(self.rads_list if rads_list is None else rads_list)
+        hazcat = HAZCAT({**self.config, 'rads_list': rads_list, 'inventories': [0.0] * len(rads_list)})
+
+        profiler.count('nuclides.computed', len(rads_list))
+        with profiler.stage('dcf_screening'):
+            dcfs = hazcat.compute_max_dcf_batch(rads_list)
+            provenance = hazcat.get_dcf_provenance(rads_list)
+        with profiler.stage('nuclide_properties'):
+            half_lives = hazcat.halflives_lambda_rads_from_rads_list()[0]
+            columns = list(zip(provenance, half_lives, hazcat.find_aws(), hazcat.get_E1_from_TableA1_ICRP_107(),
+                               hazcat.get_bv(), hazcat.get_R_HC2(), hazcat.get_R_HC3()))
+        return {rad: {'dcfs': dcfs[rad], 'dcf_provenance': prov, 'half_life': half_life, 'aw': aw, 'E1': E1,
+                      'BV': BV, 'R_HC2': R_HC2, 'R_HC3': R_HC3}
+                for rad, (prov, half_life, aw, E1, BV, R_HC2, R_HC3) in zip(rads_list, columns)}
+
+    def compute_hazcat_result(self, Rs_HC2=None, Rs_HC3=None, progeny_ingrowth_time=None, use_memo=True):
+        """
+        Runs the complete HazCat computation for self.rads_list and self.inventories.
+
+        Args:
+            Rs_HC2 (list, optional): Release fractions for HC-2. Defaults to the DOE table values (get_R_HC2).
+            Rs_HC3 (list, optional): Release fractions for HC-3. Defaults to the DOE table values (get_R_HC3).
+            progeny_ingrowth_time (float, optional): When given (s), the DCFs include the ingrown progeny.
+            use_memo (bool): Take the nuclide-intrinsic inputs from the persistent nuclide memo (hazcat_cache).
+
+        Returns:
+            HazcatResult: HazCat and DOE threshold quantities and the hazard categorization.
+        """
+        rads_list = list(self.rads_list)
+        with profiler.stage('nuclide_records'):
+            if use_memo:
+                from hazcat_cache import nuclide_memo
+                records = nuclide_memo.records_for(rads_list, hazcat=self)
+            else:
+                records = self.compute_nuclide_records(rads_list)
+
+        def column(key):
+            return [records[rad][key] for rad in rads_list]
+
+        half_lives = np.asarray(column('half_life'), dtype=np.float64)
+        dcfs_dicts_rads_list = {rad: records[rad]['dcfs'] for rad in rads_list}
+        aws = column('aw')
+        Rs_HC2 = column('R_HC2') if Rs_HC2 is None else Rs_HC2
+        Rs_HC3 = column('R_HC3') if Rs_HC3 is None else Rs_HC3
+        BVs = column('BV')
+        E1s = column('E1')
+
+        with profiler.stage('hc2'):
+            tq_hc2_curie, tq_hc2_gram = self.compute_threshold_quantity_HC2_in_gram_and_curie(
+                Rs_HC2, aws, half_lives, dcfs_dicts_rads_list, progeny_ingrowth_time=progeny_ingrowth_time)
+        with profiler.stage('hc3'):
+            hc3 = self.compute_hc3_pathways(Rs_HC3, aws, BVs, half_lives, E1s, dcfs_dicts_rads_list,
+                                            progeny_ingrowth_time=progeny_ingrowth_time)
+
+        with profiler.stage('doe_lookup'):
+            doe = self.read_us_doe_std_1027_2018_thresholds(rads_list)
+        result = HazcatResult(
+            rads_list=rads_list, inventories=None,
+            half_lives=list(half_lives), aws=list(aws), Rs_HC2=list(Rs_HC2), Rs_HC3=list(Rs_HC3), BVs=list(BVs),
+            E1s=list(E1s), dcfs=dcfs_dicts_rads_list,
+            tq_hc2_curie=np.asarray(tq_hc2_curie), tq_hc2_gram=np.asarray(tq_hc2_gram), hc3=hc3,
+            doe_hc2_curie=doe['HC2_Curies'].to_numpy(dtype=np.float64),
+            doe_hc2_gram=doe['HC2_Grams'].to_numpy(dtype=np.float64),
+            doe_hc3_curie=doe['HC3_Curies'].to_numpy(dtype=np.float64),
+            doe_hc3_gram=doe['HC3_Grams'].to_numpy(dtype=np.float64),
+            doe_pathway=doe['Limiting_Pathway'].to_numpy(dtype=object),
+            classification=None, classification_notes=None,
+            dcf_provenance=column('dcf_provenance'))
+        return self.classify_inventories(result, self.inventories)
+
+    def classify_inventories(self, result, inventories, verbose=True):
+        """
+        Applies an inventory to the threshold quantities of a HazcatResult.
+
+        The threshold quantities do not depend on the inventory; only the classification and the sums of ratios
+        do, and these are recomputed here from the values held by `result` (no library access).
+
+        Args:
+            result (HazcatResult): Threshold quantities of the radionuclides.
+            inventories (list): Inventory (Ci) of every radionuclide of result.rads_list.
+            verbose (bool): Print the sum-of-ratio categorizations.
+
+        Returns:
+            HazcatResult: Copy of `result` with the inventory, classification and sums of ratios replaced.
+
+        Raises:
+            ValueError: If the number of inventories differs from the number of radionuclides.
+        """
+        rads_list = result.rads_list
+        if len(inventories) != len(rads_list):
+            raise ValueError(f"{len(inventories)} inventories given for {len(rads_list)} radionuclides")
+        doe_hc2, doe_hc3 = result.doe_hc2_curie.tolist(), result.doe_hc3_curie.tolist()
+
+        def sum_of_ratio(hc2_curies, hc3_curies, doe):
+            sor_hc2 = 0
+            sor_hc3 = 0
+            for inv, hc2, hc3 in zip(inventories, hc2_curies, hc3_curies):
+                sor_hc2 += inv / hc2
+                sor_hc3 += inv / hc3
+            return sor_hc2, sor_hc3, self.sum_of_ratio_text(sor_hc2, sor_hc3, doe=doe, verbose=verbose)
+
+        with profiler.stage('classification'):
+            # US-DOE-table based classification
+            classification, classification_notes = [], []
+            for inv, rad, hc2, hc3, pathway in zip(inventories, rads_list, doe_hc2, doe_hc3, result.doe_pathway):
+                notes, short_note = self.classification_note(inv, rad, hc2, hc3, pathway)
+                classification_notes.append(notes)
+                classification.append(short_note)
+
+            multiple = len(rads_list) > 1
+            return dataclasses.replace(
+                result, inventories=np.asarray(inventories, dtype=np.float64),
+                classification=np.asarray(classification, dtype=object), classification_notes=classification_notes,
+                sor_doe=sum_of_ratio(doe_hc2, doe_hc3, True) if multiple else None,
+                sor_hazcat=sum_of_ratio(result.tq_hc2_curie, result.tq_hc3_curie, False) if multiple else None)
+
     def sum_of_ratio(self):
 
         if len(self.rads_list) > 1:
             sor_hc2 = 0
             sor_hc3 = 0
-            text = ''
             # DOE STANDARD HAZARD CATEGORIZATION OF DOE NUCLEAR FACILITIES; 
-            text += 'Following Table 1-1: THRESHOLDS FOR RADIONUCLIDES (ref. DOE-STD-1027-2018 (Jan 2019)):\n'
-            for inv, rad in zip(self.inventories, self.rads_list):
-                xls = pd.ExcelFile("library/doe_haz_cat_excel.xlsx")
-                df_tq = pd.read_excel(xls, sheet_name='thresholds')
-                df_tq.dropna(axis=0, how='all', inplace=True)
-                search_string = '|'.join([str(rad)])
-                df_tq = df_tq[df_tq['Radionuclide'] == search_string]
-                sor_hc2 += inv / df_tq.HC2_Curies.item()
-                sor_hc3 += inv / df_tq.HC3_Curies.item()
-            if sor_hc2 > 1:
-                print("Based on Sum of Ratio Method The facility is categorized as HC-2")
-                text += '\n'
-                text += f"SOR (HC2): {sor_hc2}\n"
-                text += "Based on Sum of Ratio Method The facility is categorized as HC-2"
-            elif sor_hc3 > 1:
-                text += '\n'
-                text += f"SOR (HC2): {sor_hc2} and SOR (HC3): {sor_hc3}\n"
-                print("Based on Sum of Ratio Method The facility is categorized as HC-3")
-                text += "Based on Sum of Ratio Method The facility is categorized as HC-3"
-            elif min(sor_hc2, sor_hc3) < 1:
-                text += '\n'
-                text += f"SOR (HC2): {sor_hc2} and SOR (HC3): {sor_hc3}\n"
-                print("Based on Sum of Ratio Method The facility maybe categorized as BELOW HC-3")
-                text += "Based on Sum of Ratio Method The facility is categorized as BELOW HC-3"
+            thresholds = self.read_us_doe_std_1027_2018_thresholds()
+            for inv, hc2, hc3 in zip(self.inventories, thresholds.HC2_Curies, thresholds.HC3_Curies):
+                sor_hc2 += inv / hc2
+                sor_hc3 += inv / hc3
+            text = self.sum_of_ratio_text(sor_hc2, sor_hc3, doe=True)
 
             return sor_hc2, sor_hc3, text
 
@@ -1741,30 +2079,55 @@ class HAZCAT():
         if len(self.rads_list) > 1:
             sor_hc2 = 0
             sor_hc3 = 0
-            text = ''
-            # DOE STANDARD HAZARD CATEGORIZATION OF DOE NUCLEAR FACILITIES; 
-            text += '\n\nUsing HazCat Computed TQ:\n'
             for ndx, (inv, rad) in enumerate(zip(self.inventories, self.rads_list)):
                 sor_hc2 += inv / HC2_Curies[ndx]
                 sor_hc3 += inv / HC3_Curies[ndx]
-            if sor_hc2 > 1:
-                print("Based on Sum of Ratio Method The facility is categorized as HC-2.")
-                text += '\n'
-                text += f"SOR (HC2): {sor_hc2}\n"
-                text += "Based on Sum of Ratio Method The facility is categorized as HC-2."
-            elif sor_hc3 > 1:
-                text += '\n'
-                text += f"SOR (HC2): {sor_hc2} and SOR (HC3): {sor_hc3}\n"
-                print("Based on Sum of Ratio Method The facility is categorized as HC-3.")
-                text += "Based on Sum of Ratio Method The facility is categorized as HC-3."
-            elif min(sor_hc2, sor_hc3) < 1:
-                text += '\n'
-                text += f"SOR (HC2): {sor_hc2} and SOR (HC3): {sor_hc3}\n"
-                print("Based on Sum of Ratio Method The facility maybe categorized as BELOW HC-3.")
-                text += "Based on Sum of Ratio Method The facility is categorized as BELOW HC-3."
+            text = self.sum_of_ratio_text(sor_hc2, sor_hc3, doe=False)
 
             return sor_hc2, sor_hc3, text
 
+    @staticmethod
+    def sum_of_ratio_text(sor_hc2, sor_hc3, doe=True, verbose=True):
+        """
+        Sum-of-ratio summary of the report.
+
+        Args:
+            sor_hc2, sor_hc3 (float): Sums of the inventory to HC-2 and HC-3 threshold ratios.
+            doe (bool): The ratios use the DOE-STD-1027-2018 thresholds (otherwise the HazCat computed TQs).
+            verbose (bool): Print the resulting categorization.
+
+        Returns:
+            str: The summary text.
+        """
+        if doe:
+            text = 'Following Table 1-1: THRESHOLDS FOR RADIONUCLIDES (ref. DOE-STD-1027-2018 (Jan 2019)):\n'
+            end = ''
+        else:
+            text = '\n\nUsing HazCat Computed TQ:\n'
+            end = '.'
+        if sor_hc2 > 1:
+            if verbose:
+                classification_log.info("Based on Sum of Ratio Method The facility is categorized as HC-2%s", end,
+                                        extra={'sor_hc2': sor_hc2, 'sor_hc3': sor_hc3, 'doe': doe})
+            text += '\n'
+            text += f"SOR (HC2): {sor_hc2}\n"
+            text += f"Based on Sum of Ratio Method The facility is categorized as HC-2{end}"
+        elif sor_hc3 > 1:
+            text += '\n'
+            text += f"SOR (HC2): {sor_hc2} and SOR (HC3): {sor_hc3}\n"
+            if verbose:
+                classification_log.info("Based on Sum of Ratio Method The facility is categorized as HC-3%s", end,
+                                        extra={'sor_hc2': sor_hc2, 'sor_hc3': sor_hc3, 'doe': doe})
+            text += f"Based on Sum of Ratio Method The facility is categorized as HC-3{end}"
+        elif min(sor_hc2, sor_hc3) < 1:
+            text += '\n'
+            text += f"SOR (HC2): {sor_hc2} and SOR (HC3): {sor_hc3}\n"
+            if verbose:
+                classification_log.info("Based on Sum of Ratio Method The facility maybe categorized as BELOW HC-3%s", end,
+                                        extra={'sor_hc2': sor_hc2, 'sor_hc3': sor_hc3, 'doe': doe})
+            text += f"Based on Sum of Ratio Method The facility is categorized as BELOW HC-3{end}"
+        return text
+
     # On-site consequence analysis
     def point_source_dose(self, gamma_energy=None, g_yield=None, activity_curie=None, \
                           dist_list=[10, 20, 40, 50, 100, 200, 400, 600, 800, 1000], \
@@ -1823,7 +2186,7 @@ class HAZCAT():
         df_dose = pd.DataFrame([dose_dict])
         return dose_dict, df_dose
 
-    def gamma_energy_abundaces(self, master_file="library/Dose_ecerman_final.xlsx",
+    def gamma_energy_abundaces(self, master_file=ECKERMAN_WORKBOOK,
                                sheet_name="gamma_energy_radionuclide"):
 
         """
@@ -1837,12 +2200,10 @@ class HAZCAT():
         if self.rads_list == None:
             raise ValueError("radionuclide name is missing. Please provide it in array format e.g. ['Ir-192']")
 
-        logging.getLogger("main").info("Data source of gamma energy and abundances: {weblk}".format(
-            weblk="www-nds.iaea.org/xgamma_standards/genergies1.htm"))
-        xls = pd.ExcelFile(master_file)
+        nuclide_log.debug("Data source of gamma energy and abundances: %s",
+                          "www-nds.iaea.org/xgamma_standards/genergies1.htm")
         colnames = ['nuclide', 'energy_kev', 'std_energy_kev', 'emmission_prob', 'std_emmission_prob', 'type']
-        name = pd.read_excel("library/Dose_ecerman_final.xlsx",
-                             sheet_name="gamma_energy_radionuclide", header=0, names=colnames)
+        name = library_cache.read_excel(master_file, sheet_name=sheet_name, header=0, names=colnames)
         name.dropna(axis=0, how='all', inplace=True)
         name = name.iloc[:, :-1]
         energies = []
@@ -1858,14 +2219,10 @@ class HAZCAT():
             if df.empty:
                 emmission_prob_per_rad = [0]
                 energies_per_rad = [0]
-                print("gamma energy not available for {}. This either means the radionuclide is pure-beta emitter or "
-                      "the data of gamma energy not available in the current database (ref: www-nds.iaea.org/xgamma_standards/genergies1.htm)".format(
-                    rad))
-
-                logging.getLogger("gamma energies").info(
-                    "gamma energy not available for {}. This either means the radionuclide is pure-beta emitter or "
-                    "the data of gamma energy not available in the current database (ref: www-nds.iaea.org/xgamma_standards/genergies1.htm)".format(
-                        rad))
+                nuclide_log.info(
+                    "gamma energy not available for %s. This either means the radionuclide is pure-beta emitter or "
+                    "the data of gamma energy not available in the current database (ref: www-nds.iaea.org/xgamma_standards/genergies1.htm)",
+                    rad, extra={'nuclide': rad})
 
             df_e = df['energy_kev'].items()
             df_p = df['emmission_prob'].items()
@@ -1912,10 +2269,7 @@ class HAZCAT():
         # FOR EX. Cs-137 IS CONSIDERED BUT BA-137m is not consIdired for gamma if Cs-137 IS THE RAD
         # this follows USA HAZ CAT FORMULATION
         ###
-        E1s = []
-        for ndx, rad in enumerate(self.rads_list):
-            sum_ep = float(self.get_nuclide_info(rad)['Photon'])
-            E1s.append(sum_ep)
+        E1s = self.nuclide_properties()['e1_mev'].tolist()
 
         # print('E1s', E1s)
         return E1s
@@ -1929,341 +2283,161 @@ class HAZCAT():
             return 0
 
     def compute_threshold_quantity_HC2_in_gram_and_curie(self, Rs, aws, half_lives, dcfs_dicts_rads_list,
-                                                         CHI_BY_Q=1e-04):
+                                                         CHI_BY_Q=1e-04, progeny_ingrowth_time=None):
         """
         Computes the HC-2 threshold quantity in grams and curies based on NRC and DOE methodologies.
-        """
-        # Constants
-        BR = 3.3333E-4  # Respiration rate (m³/sec)
-        N_0 = 6.022E+23  # Avogadro's number
-        UNIT_CONVERSION_FACTOR = 0.01 / 3.7e10
-
-        TQ_HC2s_gram = []
-        TQ_HC2s_curie = []
 
-        for ndx, rad in enumerate(self.rads_list):
-            AW = aws[ndx]
-            t_half = half_lives[ndx]
-            R = Rs[ndx]
-
-            # setting nan to zero
-            DCF_inhalation = self._convert_to_float(dcfs_dicts_rads_list[rad].get('max_dcf_inh_hc2', 0))
-            if np.isnan(DCF_inhalation):
-                DCF_inhalation = 0.0
-            DCF_submersion = self._convert_to_float(dcfs_dicts_rads_list[rad].get('max_dcf_sub_hc2', 0))
-            if np.isnan(DCF_submersion):
-                DCF_submersion = 0.0
+        When `progeny_ingrowth_time` (s) is given, the DCFs include the progeny grown in over that time
+        (see progeny_weighted_dcfs); by default the radionuclides are treated individually.
+        """
+        if progeny_ingrowth_time is not None:
+            dcfs_dicts_rads_list = self.progeny_weighted_dcfs(dcfs_dicts_rads_list, progeny_ingrowth_time)
+
+        def dcf_vector(key):
+            return np.array([self._convert_to_float(dcfs_dicts_rads_list[rad].get(key, 0)) for rad in self.rads_list],
+                            dtype=np.float64)
+
+        n = len(self.rads_list)
+        TQ_HC2s_curie, TQ_HC2s_gram = hc2_threshold_quantity(np.asarray(Rs, dtype=np.float64)[:n],
+                                                             np.asarray(aws, dtype=np.float64)[:n],
+                                                             np.asarray(half_lives, dtype=np.float64)[:n],
+                                                             dcf_vector('max_dcf_inh_hc2'),
+                                                             dcf_vector('max_dcf_sub_hc2'),
+                                                             chi_by_q=CHI_BY_Q)
+        return TQ_HC2s_curie.tolist(), TQ_HC2s_gram.tolist()
 
-            # Specific activity (Ci/gm)
-            SA = (np.log(2) * N_0) / (AW * t_half * 3.7E+10)
+    @staticmethod
+    def _to_number(value):
+        """ Converts a table value (number, '--', one-element list) to float; anything else becomes NaN. """
+        if isinstance(value, list) and len(value) > 0:
+            value = value[0]
+        try:
+            return float(value) if str(value).strip() != "--" else np.nan
+        except (ValueError, TypeError):
+            return np.nan
 
-            # Compute denominator
-            denominator = R * SA * CHI_BY_Q * ((DCF_inhalation * BR) + DCF_submersion)
+    def compute_hc3_pathways(self, Rs, aws, BVs, half_lives, E1s, dcfs_dicts_rads_list, CHI_BY_Q=HC3_CHI_BY_Q,
+                             progeny_ingrowth_time=None, **pathway_parameters):
+        """
+        Computes the HC-3 threshold quantities of all five pathways for self.rads_list in one batch.
 
-            # Compute threshold quantity
-            TQ_HC2 = float('inf') if denominator == 0 else 1 / denominator
-            TQ_HC2_gram = TQ_HC2 * UNIT_CONVERSION_FACTOR
-            TQ_HC2_curie = TQ_HC2_gram * SA
+        Args:
+            Rs, aws, BVs, half_lives, E1s: Per-radionuclide release fractions, atomic weights, soil-to-plant
+                factors, half-lives (s) and photon energies (MeV), in the order of self.rads_list.
+            dcfs_dicts_rads_list (dict): DCF dictionaries per radionuclide (see compute_max_dcf_batch).
+            CHI_BY_Q (float): Dispersion coefficient (s/m^3).
+            progeny_ingrowth_time (float, optional): When given (s), the DCFs include the ingrown progeny.
+            **pathway_parameters: Overrides of FC, t_g, WC, C_gamma, mu_a and S (see hc3_threshold_quantities).
 
-            # print('aa', DCF_inhalation, DCF_submersion, SA, TQ_HC2 , TQ_HC2_curie, TQ_HC2_gram)
+        Returns:
+            HC3Pathways: (N x 5) TQs in Ci, with the dominant pathway per radionuclide.
+        """
+        if progeny_ingrowth_time is not None:
+            dcfs_dicts_rads_list = self.progeny_weighted_dcfs(dcfs_dicts_rads_list, progeny_ingrowth_time)
+
+        n = len(self.rads_list)
+        inert_gas_dcfs = self.get_dcf_sub_inert_gas_same_for_worker_and_public().set_index("Nuclide")[
+            "dcf_sub (Sv/sec per Bq/m^3)"].to_dict()
+
+        def vector(values):
+            return np.array([self._to_number(v) for v in list(values)[:n]], dtype=np.float64)
+
+        pathways = hc3_threshold_quantities(
+            vector(Rs), vector(aws), vector(BVs), vector(half_lives), vector(E1s),
+            vector(dcfs_dicts_rads_list[rad]['max_dcf_inh_hc3'] for rad in self.rads_list),
+            vector(dcfs_dicts_rads_list[rad]['max_dcf_ing_hc3'] for rad in self.rads_list),
+            vector(inert_gas_dcfs.get(rad, np.nan) for rad in self.rads_list),
+            chi_by_q=CHI_BY_Q, **pathway_parameters)
+
+        missing = [rad for rad, inh in zip(self.rads_list, pathways.tq_curie[:, 0]) if np.isinf(inh)]
+        if missing:
+            hc3_log.info("NOTE: R or inhalation DCF data not available for %s", ', '.join(missing),
+                         extra={'nuclides': missing})
+        return pathways
+
+    def threshold_quantity_inputs(self, result):
+        """
+        Per-radionuclide inputs of the HC-2 and HC-3 kernels (hazcat_kernels) behind a HazcatResult, converted as
+        in compute_threshold_quantity_HC2_in_gram_and_curie and compute_hc3_pathways.
 
-            TQ_HC2s_gram.append(TQ_HC2_gram)
-            TQ_HC2s_curie.append(TQ_HC2_curie)
+        Args:
+            result (HazcatResult): Result of the radionuclides.
 
-        return TQ_HC2s_curie, TQ_HC2s_gram
+        Returns:
+            dict: Float arrays in the order of result.rads_list: 'Rs_HC2', 'Rs_HC3', 'aws', 'half_lives', 'BVs',
+            'E1s', 'dcf_inh_hc2', 'dcf_sub_hc2', 'dcf_inh_hc3', 'dcf_ing_hc3' and 'dcf_sub_hc3' (NaN for
+            radionuclides that are not inert gases).
+        """
+        rads_list = result.rads_list
+        inert_gas_dcfs = self.get_dcf_sub_inert_gas_same_for_worker_and_public().set_index("Nuclide")[
+            "dcf_sub (Sv/sec per Bq/m^3)"].to_dict()
+
+        def vector(values):
+            return np.array([self._to_number(v) for v in values], dtype=np.float64)
+
+        def dcf_hc2(key):
+            return np.array([self._convert_to_float(result.dcfs[rad].get(key, 0)) for rad in rads_list],
+                            dtype=np.float64)
+
+        return {
+            'Rs_HC2': np.asarray(result.Rs_HC2, dtype=np.float64),
+            'Rs_HC3': vector(result.Rs_HC3),
+            'aws': vector(result.aws),
+            'half_lives': vector(result.half_lives),
+            'BVs': vector(result.BVs),
+            'E1s': vector(result.E1s),
+            'dcf_inh_hc2': dcf_hc2('max_dcf_inh_hc2'),
+            'dcf_sub_hc2': dcf_hc2('max_dcf_sub_hc2'),
+            'dcf_inh_hc3': vector(result.dcfs[rad]['max_dcf_inh_hc3'] for rad in rads_list),
+            'dcf_ing_hc3': vector(result.dcfs[rad]['max_dcf_ing_hc3'] for rad in rads_list),
+            'dcf_sub_hc3': vector(inert_gas_dcfs.get(rad, np.nan) for rad in rads_list),
+        }
 
     def compute_inhalation_threshold_quantity_HC3_in_gram_and_curie(self, Rs, aws, BVs,
                                                                     half_lives, E1s,
                                                                     dcfs_dicts_rads_list,
                                                                     r_factor_hc3=None,
-                                                                    CHI_BY_Q=7.2e-02):
-        # NRC approach
-        # HC-2: 1 rem (i.e. 10 mSv) at 100 m distance
-        # Q = Quantity of material used as threshold (grams)
-        # R = Release fraction for material of concern (unitless)
-        # H_I = Effective dose equivalent from inhalation (rem/gm-released)
-        # H_G = Effective dose equivalent from ground contamination (rem/gm-released)
-        # H_CS = Effective dose equivalent from cloud shine (rem/gm-released)
-        # Q = 1/(R*(H_I+H_G+H_CS))
-        # DOE approach
-        # TQ_HC2 = Quantity of material used as threshold (grams)
-        # R = release fraction of material averaged over an entire facility (unitless)
-        # SA = Specific activity of radionuclide released (Ci/gm)
-        # chi_by_Q = Meteorological dispersion coefficient (1E-4 sec/m 3 ) 
-        # CHI_BY_Q = 1e-04
-        # DCF inhalation = Inhalation Dose Coefficient (Sv/Bq)
-        # BR = Respiration rate (3.3333E-4 m 3 /sec)
-        BR = 3.3333E-4
-        # DC_submersion = Air Submersion Dose Coefficient (Sv/sec per Bq/m 3 )
-        # AW = Atomic weight
-        # t_half = halflife (in second)
-        N_0 = 6.022E+23
-        TQ_HC3s_curie = []
-        TQ_HC3s_gram = []
-        dominant_pathway_text_list = []
-        for ndx, rad in enumerate(self.rads_list):
-            print('rad under computation:', rad)
-            AW = np.float32(aws[ndx])
-            t_half = half_lives[ndx]
-            # print('dcfs_dicts_rads_list:', dcfs_dicts_rads_list)
-            DCF_inhalation = dcfs_dicts_rads_list[rad]['max_dcf_inh_hc3']
-            # DCF_submersion = sub_dcfs[ndx][0]
-            DCF_ingestion = dcfs_dicts_rads_list[rad]['max_dcf_ing_hc3']
-
-            R = Rs[ndx]
-            E1 = E1s[ndx]
-            # unit Ci/gm; for Ir-192 ~ 9220 Ci/gm
-            SA = (np.log(2) * N_0) / (AW * t_half * 3.7E+10)
-            factor = (0.01 / 3.7e10)
-
-            # Ensure R is a single value (if it's a list)
-            if isinstance(R, list) and len(R) > 0:
-                R = R[0]  # Extract the first element
-
-            # Convert R to a float (only if it's not "--")
-            try:
-                R = float(R) if str(R).strip() != "--" else np.nan
-            except ValueError:
-                print(f"Error: R='{R}' is not a valid number.")
-                R = np.nan  # Default to NaN if conversion fails
-
-            if not np.isnan(R) and type(DCF_inhalation) == float:
-                try:
-                    iTQ_HC3 = np.array(10 / (R * SA * CHI_BY_Q * DCF_inhalation * BR))
-
-                    iTQ_HC3_gram = iTQ_HC3 * factor
-
-                    iTQ_HC3_curie = iTQ_HC3_gram * SA
-                    # print(iTQ_HC3, R, SA, CHI_BY_Q, DCF_inhalation, BR, iTQ_HC3_gram)
-                except ZeroDivisionError:
-                    print("Error: Division by zero in iTQ_HC3 calculation.")
-                    iTQ_HC3_gram = np.inf
-                    iTQ_HC3_curie = np.inf
-            else:
-                print(f"NOTE: R or inhalation DCF data not available for {rad}")
-                iTQ_HC3_gram = np.inf
-                iTQ_HC3_curie = np.inf
-
-            # TQHC3,food = Food ingestion pathway threshold quantity [Ci];
-
-            # FC = Food (i.e., leafy vegetable) consumption rate of reference man [0.175
-            # kg/day];
-            FC = 0.175
-            # CT = Contact Time (effective time over which contaminated vegetables are
-            # ingested [days];
-            # λI = Radionuclide decay constant [day-1 ] = ln(2)/t 1/2 ;
-            # t 1/2 = Radionuclide half-life [days];
-            lambda_i = (86400 * np.log(2)) / t_half
-            # λW = Weathering decay constant [day-1 ] = ln(2)/14 days; and
-            lambda_w = np.log(2) / 14
-            # t_g = Growing season time [60 days]
-            t_g = 60
-            # unit = days               
-            CT = (1 - np.exp(-(lambda_i + lambda_w) * t_g)) / (lambda_i + lambda_w)
-            # R = Release fraction [dimensionless]; and
-            # DC ingest = Ingestion dose coefficient [Sv/Bq]
-            B_v = BVs[ndx]
-
-            # Ensure B_v is a single value (not a list)
-            if isinstance(B_v, list) and len(B_v) > 0:
-                B_v = B_v[0]  # Extract the first element
-
-            # Convert B_v to float (only if it's not '--')
-            try:
-                B_v = float(B_v) if str(B_v).strip() != "--" else np.nan
-            except ValueError:
-                # print(f"Error: B_v='{B_v}' is not a valid number.")
-                B_v = np.nan  # Default to NaN if conversion fails
-
-            if isinstance(R, list) and len(R) > 0:
-                # print("R is a list, extracting first element.")
-                R = R[0]
-
-            # Convert to string and check conditions
-            # print('B_v:', str(B_v).split(), 'R:', R)
-            # print('DCF_ingestion:', DCF_ingestion)
-            # Corrected condition
-            if (str(R).strip() != "--" and not isinstance(R, str) and not np.isnan(R)) or \
-                    (str(B_v).strip() != "--" and not isinstance(B_v, str) and not np.isnan(B_v)) or \
-                    (not np.isnan(DCF_ingestion)):
-
-                # Food ingestion pathway calculation
-                if isinstance(DCF_ingestion, float):
-                    # print('B_v:', B_v)
-                    DF = 1e-04 + (3.5e-06 * B_v)
-                    fing_TQ_HC3 = np.array(10 / (DF * FC * CT * R * DCF_ingestion))
-                    fing_TQ_HC3_curie = fing_TQ_HC3 * factor
-                    fing_TQ_HC3_gram = fing_TQ_HC3_curie * SA
-                else:
-                    fing_TQ_HC3_curie = np.inf
-                    fing_TQ_HC3_gram = np.inf
-            else:
-                print(f"NOTE: B_v data not available for {rad}")
-                fing_TQ_HC3_curie = np.inf
-                fing_TQ_HC3_gram = np.inf
-
-            # water ingestion pathway
-            # CT contact time: 9 days
-            contact_time = 9
-            ctfac = (1 - np.exp(-lambda_i * contact_time)) / lambda_i
-            # water consumption for reference man 2 L/day
-            WC = 2
-            # Retardation factor (1 day)
-            R_d = 1
-            # DF; t_half in day
-            DF = 7.6e-8 * np.exp((-4.2 * 86400 * R_d) / t_half)
-
-            if isinstance(DCF_ingestion, float):
-                wing_TQ_HC3 = np.array(10 / (DF * ctfac * WC * DCF_ingestion))
-                # unit conversion factor
-                factor = (0.01 / 3.7e10)
-                wing_TQ_HC3_curie = wing_TQ_HC3 * factor
-                wing_TQ_HC3_gram = wing_TQ_HC3_curie * SA
-            else:
-                print(f"WARNING: DCF for ingestion is not available for {rad}".format)
-                wing_TQ_HC3_curie = np.inf
-                wing_TQ_HC3_gram = np.inf
-
-            # CONSOLIDATED list from ICRP 103, TABLE ANNEX C, AND JAERI-DATA/CODE-2002-013 TABLE 8
-            inert_gas_lists = ['Ar-37', 'Ar-39', 'Ar-41', 'Kr-74', 'Kr-76', 'Kr-77', 'Kr-79',
-                               'Kr-81', 'Kr-81m', 'Kr-83m', 'Kr-85', 'Kr-85m', 'Kr-87', 'Kr-88',
-                               'Xe-120', 'Xe-121', 'Xe-122', 'Xe-123', 'Xe-125', 'Xe-127', 'Xe-129m',
-                               'Xe-131m', 'Xe-133', 'Xe-133m', 'Xe-135', 'Xe-135m', 'Xe-138',
-                               'N-13', 'O-14', 'O-15', 'Ar-42', 'Ar-44', 'Kr-75', 'Kr-89', 'Xe-127m',
-                               'Xe-137']
-            ##### External Exposure #######
-            # duration of exposure : 1 day
-            exposure_time = 1
-            expofac = (1 - np.exp(-lambda_i * exposure_time)) / lambda_i
-            # equation coefficient
-            C_gamma = 6.41e-05
-            # mu_a (cm-1) = Linear energy absorption coefficient for gamma rays in air
-            mu_a = 3.7e-05
-            # distance from point source in metre
-            S = 30
-            numerator = (10 * S ** 2 * C_gamma)
-            denominator = (E1 * mu_a * 24 * expofac * np.exp(-100 * mu_a * S))
-            # print('E1_:', E1, mu_a)
-            # direct_expo_TQ_HC3 = (numerator / denominator)
-
-            if denominator == 0 or rad in inert_gas_lists:
-                direct_expo_TQ_HC3 = float('inf')  # or some default value
-            else:
-                direct_expo_TQ_HC3 = numerator / denominator
-
-            # air exposure: submersion dose
-
-            def get_dcf_by_nuclide(nuclide_name):
-                """
-                Retrieves the effective dose rate coefficient (dcf_sub) for a given nuclide.
-
-                Args:
-                nuclide_name (str): The name of the nuclide (e.g., "Ar-37").
-
-                Returns:
-                float: The dcf_sub value in Sv/sec per Bq/m^3, or None if nuclide is not found.
-                """
-                df = self.get_dcf_sub_inert_gas_same_for_worker_and_public()
-                result = df[df["Nuclide"] == nuclide_name]["dcf_sub (Sv/sec per Bq/m^3)"].values
-                return result[0] if len(result) > 0 else None
-
-            def compute_submersion_TQ_HC3(rad):
-                """
-                Computes submersion_TQ_HC3_curie using the given DCF_submersion value.
-
-                Parameters:
-                DCF_submersion (float): The dose conversion factor for submersion.
-                # unit is Sv-sec/Bq-m3
-
-                Returns:
-                float: The computed submersion_TQ_HC3_curie value.
-                """
-
-                DCF_submersion = get_dcf_by_nuclide(rad)
-                # print('DCF_submersion:', DCF_submersion)
-
-                if not DCF_submersion:
-                    submersion_TQ_HC3_curie = np.inf
-                else:
-                    CHI_BY_Q_hc3 = 7.2e-02
-                    factor = (0.01 / 3.7e10)
-                    denominator_sub = CHI_BY_Q_hc3 * float(DCF_submersion)
-                    submersion_TQ_HC3_curie = (10 / denominator_sub) * factor
-
-                return submersion_TQ_HC3_curie
+                                                                    CHI_BY_Q=HC3_CHI_BY_Q,
+                                                                    progeny_ingrowth_time=None,
+                                                                    **pathway_parameters):
+        """
+        Computes the HC-3 threshold quantity in curies and grams as the minimum over the inhalation, food ingestion,
+        water ingestion, direct exposure and submersion pathways (see compute_hc3_pathways).
 
+        Returns:
+            tuple: (TQ HC-3 in Ci, TQ HC-3 in g, per-pathway text of every radionuclide)
+        """
+        pathways = self.compute_hc3_pathways(Rs, aws, BVs, half_lives, E1s, dcfs_dicts_rads_list, CHI_BY_Q=CHI_BY_Q,
+                                             progeny_ingrowth_time=progeny_ingrowth_time, **pathway_parameters)
+        return pathways.tq_hc3_curie.tolist(), pathways.tq_hc3_gram.tolist(), pathways.pathway_texts()
 
+    def write_hazcat_classification_and_dose(self, df_tq, inv, rad):
+        """
+        Classification of one radionuclide inventory against its DOE-STD-1027-2018 thresholds.
 
-            if rad in inert_gas_lists:
-                submersion_TQ_HC3_curie = compute_submersion_TQ_HC3(rad)
-            else:
-                print(f"NOTE: The submersion dose is not computed during HC3 TQ computation "
-                      f"for {rad} as it is not an inert gas".format())
-                submersion_TQ_HC3_curie = np.inf
-                # print(f"Computed submersion_TQ_HC3_curie: {submersion_TQ_HC3_curie}")
-            
-            # Meteorological dispersion coefficient 30 meters 
-            # from ground level releas[7.2x10-2 s/m3];
-            # CHI_BY_Q_hc3 = 7.2e-02
-            # factor = (0.01 / 3.7e10)
-            # print('DCF_submersion:', DCF_submersion)
-            # denominator_sub = CHI_BY_Q_hc3 * DCF_submersion
-            # submersion_TQ_HC3_curie = (10/denominator_sub) * factor
-            
+        Args:
+          df_tq (pd.DataFrame): The DOE threshold row of the radionuclide.
+          inv (float): Inventory value.
+          rad (str): Radionuclide name.
 
-            dominant_pathway_text = ''
-
-            if np.isnan(iTQ_HC3_curie):
-                iTQ_HC3_curie = np.inf
-            if np.isnan(fing_TQ_HC3_curie):
-                fing_TQ_HC3_curie = np.inf
-            if np.isnan(wing_TQ_HC3_curie):
-                wing_TQ_HC3_curie = np.inf
-            if np.isnan(direct_expo_TQ_HC3):
-                direct_expo_TQ_HC3 = np.inf
-            if np.isnan(submersion_TQ_HC3_curie):
-                submersion_TQ_HC3_curie = np.inf
-
-            stack_all_tq_hc3_curie = [iTQ_HC3_curie, fing_TQ_HC3_curie,
-                                      wing_TQ_HC3_curie, direct_expo_TQ_HC3,
-                                      submersion_TQ_HC3_curie]
-
-            # if r_factor_hc3 is not None:
-            #    x = r_factor_hc3[ndx]
-            #    stack_all_tq_hc3_curie = [x * i if ndx != 3 else i for ndx, i in enumerate(stack_all_tq_hc3_curie)]
-
-            # else:
-            #    stack_all_tq_hc3_curie = stack_all_tq_hc3_curie
-
-            # in gram
-            stack_all_tq_hc3_in_gram = stack_all_tq_hc3_curie / SA
-            pathways = ['  Inhalation', '  Food ingestion', '  Water ingestion',
-                        '  Direct exposure', '  Submersion']
-            # print('Dominant pathway:', pathways[np.argmin(stack_all_dose_hc3)])
-            # dominant_pathway_text = 'TQ-HC3: '
-            dominant_pathway_text += '\n'
-            for p, s in zip(pathways, stack_all_tq_hc3_curie):
-                dominant_pathway_text += '  ' + str(p) + ':' + ' ' + str(s) + ' Ci. '
-                dominant_pathway_text += '\n'
-            dominant_pathway_text += '  ' + 'Dominant Pathway (TQ HC-3):' + ' ' + str(
-                pathways[np.argmin(stack_all_tq_hc3_curie)])
-            # if np.argmin(stack_all_tq_hc3_curie) == 3:
-            dominant_pathway_text_list.append(dominant_pathway_text)
-
-            TQ_HC3s_curie.append(min(stack_all_tq_hc3_curie))
-            TQ_HC3s_gram.append(min(stack_all_tq_hc3_in_gram))
-
-        return TQ_HC3s_curie, TQ_HC3s_gram, dominant_pathway_text_list
+        Returns:
+          tuple: (classification text, short hazard category note)
+        """
+        return self.classification_note(inv, rad, df_tq.HC2_Curies.item(), df_tq.HC3_Curies.item(),
+                                        df_tq.Limiting_Pathway.item())
 
-    def write_hazcat_classification_and_dose(self, df_tq, inv, rad):
+    def classification_note(self, inv, rad, doe_hc2_curie, doe_hc3_curie, limiting_pathway):
         """
-        Writes HAZCAT classification and dose information to a file.
+        Classification text and short hazard category note of one radionuclide inventory.
 
         Args:
-          f (file): The file object to write to.
-          ndx (int): Index for accessing data from lists.
-          inv (float): Inventory value.
+          inv (float): Inventory value (Ci).
           rad (str): Radionuclide name.
+          doe_hc2_curie, doe_hc3_curie (float): DOE-STD-1027-2018 HC-2 and HC-3 threshold quantities (Ci).
+          limiting_pathway (str): DOE-STD-1027-2018 limiting pathway code.
+
+        Returns:
+          tuple: (classification text, short hazard category note)
         """
         # f = self.f
 
@@ -2293,19 +2467,19 @@ class HAZCAT():
             return notes.get(limiting_pathway, "")  # Return empty string if code not found
 
         # Write notes about specific limiting pathways (if applicable)
-        if df_tq.Limiting_Pathway.item() in ['C', 'E', 'Inhalation-D']:
-            text += get_limiting_pathway_note(df_tq.Limiting_Pathway.item()) + '\n'
+        if limiting_pathway in ['C', 'E', 'Inhalation-D']:
+            text += get_limiting_pathway_note(limiting_pathway) + '\n'
 
-            # f.write(get_limiting_pathway_note(df_tq.Limiting_Pathway.item()) + '\n')
+            # f.write(get_limiting_pathway_note(limiting_pathway) + '\n')
 
         # haz cat 2    
-        if inv > df_tq.HC2_Curies.item():
+        if inv > doe_hc2_curie:
             short_note += "HAZARD CATEGORY 2"
             text += "\n"
             text += "### TQs from look-up table of DOE-STD-1027-2018 document ###"
             text += "\n"
-            text += f"DOE-STD-1027-2018 TQ (HC2): {df_tq.HC2_Curies.item()} Ci \n"
-            text += f"DOE-STD-1027-2018 TQ (HC3): {df_tq.HC3_Curies.item()} Ci \n"
+            text += f"DOE-STD-1027-2018 TQ (HC2): {doe_hc2_curie} Ci \n"
+            text += f"DOE-STD-1027-2018 TQ (HC3): {doe_hc3_curie} Ci \n"
             text += "Based on US-DOE-std-1027-2018 based precomputed values and inventory = {} curie,".format(inv)
             text += " the case with {} belong to HAZARD CATEGORY 2\n".format(rad)
             text += "\n"
@@ -2330,13 +2504,13 @@ class HAZCAT():
             # f.write('\n')
 
         # below haz cat 3    
-        if inv < df_tq.HC3_Curies.item():
+        if inv < doe_hc3_curie:
             short_note += "BELOW HAZARD CATEGORY 3"
             text += "\n"
             text += "### TQs from look-up table of DOE-STD-1027-2018 document ###"
             text += "\n"
-            text += f"DOE-STD-1027-2018 TQ (HC2): {df_tq.HC2_Curies.item()} Ci \n"
-            text += f"DOE-STD-1027-2018 TQ (HC3): {df_tq.HC3_Curies.item()} Ci \n"
+            text += f"DOE-STD-1027-2018 TQ (HC2): {doe_hc2_curie} Ci \n"
+            text += f"DOE-STD-1027-2018 TQ (HC3): {doe_hc3_curie} Ci \n"
 
             text += "Based on US-DOE-std-1027-2018 based precomputed values and inventory = {} curie,".format(inv)
             text += " the case with {} belong to BELOW HAZARD CATEGORY 3\n".format(rad)
@@ -2369,14 +2543,14 @@ class HAZCAT():
             #        " CFR Part 830, Subpart B.")
 
         # haz cat 3    
-        if df_tq.HC2_Curies.item() > inv > df_tq.HC3_Curies.item():
+        if doe_hc2_curie > inv > doe_hc3_curie:
             short_note += "HAZARD CATEGORY 3"
 
             text += "\n"
             text += "### TQs from look-up table of DOE-STD-1027-2018 document ###"
             text += "\n"
-            text += f"DOE-STD-1027-2018 TQ (HC2): {df_tq.HC2_Curies.item()} Ci \n"
-            text += f"DOE-STD-1027-2018 TQ (HC3): {df_tq.HC3_Curies.item()} Ci \n"
+            text += f"DOE-STD-1027-2018 TQ (HC2): {doe_hc2_curie} Ci \n"
+            text += f"DOE-STD-1027-2018 TQ (HC3): {doe_hc3_curie} Ci \n"
             text += "Based on US-DOE-std-1027-2018 based precomputed values and inventory = {} curie,".format(inv)
             text += " the case with {} belong to HAZARD CATEGORY 3\n".format(rad)
             text += "\n"
@@ -2413,8 +2587,8 @@ class HAZCAT():
                              " For ex. if two radionuclides are being handled with inventory H-3 and Co-60 at the facility. "
                              "Provide the name of these radionuclides sequentially i.e. ['H-3', 'Co-60']")
 
-        print("NOTE: The limiting exposure pathways used for determining the HC-3 threshold value are: (1)"
-              " inhalation, (2) ingestion of food, (3) ingestion of water, (4) direct exposure, and (5) air"
-              " submersion\n")
+        hc3_log.info("NOTE: The limiting exposure pathways used for determining the HC-3 threshold value are: (1)"
+                     " inhalation, (2) ingestion of food, (3) ingestion of water, (4) direct exposure, and (5) air"
+                     " submersion\n")
 
         return
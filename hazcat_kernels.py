@@ -0,0 +1,320 @@
+"""
+Vectorized numerical kernels for pyHazCat.
+
+The functions in this module work on plain NumPy arrays (and the compiled library objects of ``hazcat_library``)
+so that whole inventories can be processed at once instead of one radionuclide at a time.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+AVOGADRO = 6.022E+23            # Avogadro's number
+BQ_PER_CURIE = 3.7E+10
+HC2_CHI_BY_Q = 1e-04            # Meteorological dispersion coefficient for HC-2 (s/m^3)
+BREATHING_RATE = 3.3333E-4      # Respiration rate (m^3/s)
+HC2_DOSE_SV = 0.01              # HC-2 dose criterion (1 rem)
+HC3_CHI_BY_Q = 7.2e-02          # Meteorological dispersion coefficient 30 m from a ground-level release (s/m^3)
+HC3_DOSE_REM = 10               # HC-3 dose criterion (10 rem)
+REM_TO_SV = 0.01
+
+HC3_PATHWAYS = ('Inhalation', 'Food ingestion', 'Water ingestion', 'Direct exposure', 'Submersion')
+SOR_CATEGORIES = ('HC-2', 'HC-3', 'BELOW HC-3')
+
+
+def specific_activity(aws, half_lives):
+    """
+    Specific activity (Ci/g) of radionuclides from their atomic weights and half-lives (s).
+    """
+    aws = np.asarray(aws, dtype=np.float64)
+    half_lives = np.asarray(half_lives, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (np.log(2) * AVOGADRO) / (aws * half_lives * BQ_PER_CURIE)
+
+
+def hc2_threshold_quantity(Rs, aws, half_lives, dcf_inh, dcf_sub, chi_by_q=HC2_CHI_BY_Q,
+                           breathing_rate=BREATHING_RATE):
+    """
+    HC-2 threshold quantities (DOE-STD-1027 methodology) for arrays of radionuclides and scenarios.
+
+    All arguments broadcast against each other, so e.g. ``Rs[:, None]`` against nuclide vectors gives one row per
+    release-fraction scenario. Missing (NaN) DCFs count as zero; a zero dose denominator gives an infinite TQ.
+
+    Args:
+        Rs (array-like): Release fractions.
+        aws (array-like): Atomic weights (g/mol).
+        half_lives (array-like): Half-lives (s).
+        dcf_inh (array-like): Inhalation dose coefficients (Sv/Bq).
+        dcf_sub (array-like): Submersion dose coefficients (Sv/s per Bq/m^3).
+        chi_by_q (array-like): Dispersion coefficient (s/m^3). Defaults to 1e-4.
+        breathing_rate (array-like): Respiration rate (m^3/s). Defaults to 3.3333e-4.
+
+    Returns:
+        tuple: (TQ in Ci, TQ in g) as arrays of the broadcast shape.
+    """
+    Rs, aws, half_lives, dcf_inh, dcf_sub, chi_by_q, breathing_rate = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (Rs, aws, half_lives, dcf_inh, dcf_sub, chi_by_q, breathing_rate)))
+
+    SA = specific_activity(aws, half_lives)
+    dose_per_bq = np.nan_to_num(dcf_inh, nan=0.0) * breathing_rate + np.nan_to_num(dcf_sub, nan=0.0)
+    with np.errstate(invalid='ignore', over='ignore'):
+        denominator = Rs * SA * chi_by_q * dose_per_bq
+        tq = np.divide(1.0, denominator, out=np.full(denominator.shape, np.inf), where=denominator != 0)
+        grams = tq * (HC2_DOSE_SV / BQ_PER_CURIE)
+        curies = grams * SA
+    return curies, grams
+
+
+@dataclass
+class HC3Pathways:
+    """
+    HC-3 threshold quantities of every pathway for a list of radionuclides.
+
+    Attributes:
+        tq_curie (np.ndarray): Shape (..., N, 5); TQ (Ci) per radionuclide and pathway, in the order of
+            HC3_PATHWAYS. Pathways that do not apply or lack data are inf.
+        specific_activity (np.ndarray): Shape (..., N); specific activity (Ci/g).
+    """
+    tq_curie: np.ndarray
+    specific_activity: np.ndarray
+
+    @property
+    def dominant(self):
+        """Index (into HC3_PATHWAYS) of the limiting pathway of every radionuclide."""
+        return np.argmin(self.tq_curie, axis=-1)
+
+    @property
+    def tq_hc3_curie(self):
+        return self.tq_curie.min(axis=-1)
+
+    @property
+    def tq_hc3_gram(self):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.tq_hc3_curie / self.specific_activity
+
+    def pathway_text(self, ndx):
+        """Per-pathway summary of one radionuclide, in the format of the HazCat text report."""
+        text = '\n'
+        for name, tq in zip(HC3_PATHWAYS, self.tq_curie[ndx].tolist()):
+            text += '    ' + name + ': ' + str(tq) + ' Ci. \n'
+        return text + '  Dominant Pathway (TQ HC-3):   ' + HC3_PATHWAYS[self.dominant[ndx]]
+
+    def pathway_texts(self):
+        return [self.pathway_text(ndx) for ndx in range(len(self.tq_curie))]
+
+
+def hc3_threshold_quantities(Rs, aws, BVs, half_lives, E1s, dcf_inh, dcf_ing, dcf_sub, chi_by_q=HC3_CHI_BY_Q,
+                             breathing_rate=BREATHING_RATE, FC=0.175, t_g=60, WC=2, C_gamma=6.41e-05, mu_a=3.7e-05,
+                             S=30):
+    """
+    HC-3 threshold quantities (DOE-STD-1027 methodology) of the five pathways for arrays of radionuclides.
+
+    The inputs broadcast against each other like those of hc2_threshold_quantity; the pathways are the last axis.
+
+    Missing data (NaN) make the affected pathway inf. Radionuclides with a submersion DCF are inert gases: for them
+    the submersion pathway is evaluated and the direct exposure pathway is not.
+
+    Args:
+        Rs (array-like): Release fractions.
+        aws (array-like): Atomic weights (g/mol).
+        BVs (array-like): Soil-to-plant concentration factors.
+        half_lives (array-like): Half-lives (s).
+        E1s (array-like): Photon energy per decay (MeV).
+        dcf_inh (array-like): Inhalation dose coefficients (Sv/Bq).
+        dcf_ing (array-like): Ingestion dose coefficients (Sv/Bq).
+        dcf_sub (array-like): Submersion dose coefficients (Sv/s per Bq/m^3), NaN for non-inert gases.
+        chi_by_q (array-like): Dispersion coefficient (s/m^3) for inhalation and submersion. Defaults to 7.2e-2.
+        breathing_rate (array-like): Respiration rate (m^3/s).
+        FC (float): Leafy vegetable consumption rate (kg/day).
+        t_g (float): Growing season (days).
+        WC (float): Water consumption rate (L/day).
+        C_gamma (float): Direct exposure equation coefficient.
+        mu_a (float): Linear energy absorption coefficient of air (cm^-1).
+        S (float): Distance from the point source (m).
+
+    Returns:
+        HC3Pathways: TQs of all pathways.
+    """
+    Rs, aws, BVs, half_lives, E1s, dcf_inh, dcf_ing, dcf_sub = (
+        np.asarray(x, dtype=np.float64) for x in (Rs, aws, BVs, half_lives, E1s, dcf_inh, dcf_ing, dcf_sub))
+    SA = specific_activity(aws, half_lives)
+    factor = REM_TO_SV / BQ_PER_CURIE
+    inert_gas = ~np.isnan(dcf_sub)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        lambda_i = (86400 * np.log(2)) / half_lives      # decay constant (1/day)
+        lambda_w = np.log(2) / 14                         # weathering constant (1/day)
+
+        inhalation = HC3_DOSE_REM / (Rs * SA * chi_by_q * dcf_inh * breathing_rate) * factor * SA
+
+        # Food ingestion: contact time over the growing season
+        CT = (1 - np.exp(-(lambda_i + lambda_w) * t_g)) / (lambda_i + lambda_w)
+        DF_food = 1e-04 + (3.5e-06 * BVs)
+        food = HC3_DOSE_REM / (DF_food * FC * CT * Rs * dcf_ing) * factor
+
+        # Water ingestion: 9 day contact time, retardation factor of 1 day
+        ctfac = (1 - np.exp(-lambda_i * 9)) / lambda_i
+        DF_water = 7.6e-8 * np.exp((-4.2 * 86400 * 1) / half_lives)
+        water = HC3_DOSE_REM / (DF_water * ctfac * WC * dcf_ing) * factor
+
+        # Direct exposure: 1 day at S metres from a point source
+        expofac = (1 - np.exp(-lambda_i * 1)) / lambda_i
+        denominator = E1s * mu_a * 24 * expofac * np.exp(-100 * mu_a * S)
+        direct = np.where((denominator == 0) | inert_gas, np.inf, (HC3_DOSE_REM * S ** 2 * C_gamma) / denominator)
+
+        submersion = np.where(dcf_sub == 0, np.inf, HC3_DOSE_REM / (chi_by_q * dcf_sub) * factor)
+
+    tq_curie = np.stack(np.broadcast_arrays(inhalation, food, water, direct, submersion), axis=-1)
+    tq_curie[np.isnan(tq_curie)] = np.inf
+    return HC3Pathways(tq_curie, SA)
+
+
+def decay_constants(half_lives):
+    """
+    Decay constants (1/s) from half-lives (s); stable (infinite) and unknown (NaN) half-lives give zero.
+    """
+    half_lives = np.asarray(half_lives, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lam = np.log(2) / half_lives
+    return np.where(np.isfinite(lam), lam, 0.0)
+
+
+def decay_inventories(inventories, lam, times):
+    """
+    Inventories of radionuclides decayed (without ingrowth) to every time of a grid.
+
+    Args:
+        inventories (np.ndarray): Inventories at t = 0, shape (N,).
+        lam (np.ndarray): Decay constants (1/s), shape (N,).
+        times (np.ndarray): Times after t = 0 (s), shape (T,).
+
+    Returns:
+        np.ndarray: Inventories of shape (T, N), in the unit of `inventories`.
+    """
+    times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+    return np.asarray(inventories, dtype=np.float64) * np.exp(-np.outer(times, lam))
+
+
+def sum_of_ratios(inventories, hc2_curie, hc3_curie):
+    """
+    Sum-of-ratio (SOR) of many inventory scenarios against one set of HC-2 and HC-3 threshold quantities.
+
+    Both sums are one matrix product of the (S, N) inventories with the (N, 2) reciprocal thresholds. An infinite
+    TQ contributes nothing; a missing (NaN) TQ makes the sums NaN.
+
+    Args:
+        inventories (np.ndarray): Inventories (Ci), shape (S, N) for S scenarios of N radionuclides, or (N,).
+        hc2_curie, hc3_curie (np.ndarray): Threshold quantities (Ci) of the N radionuclides.
+
+    Returns:
+        tuple: (SOR HC-2, SOR HC-3), each of shape (S,) (scalars for a single scenario).
+    """
+    inventories = np.asarray(inventories, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        reciprocal = 1.0 / np.stack([np.asarray(hc2_curie, dtype=np.float64),
+                                     np.asarray(hc3_curie, dtype=np.float64)], axis=-1)
+    sor = inventories @ reciprocal
+    return sor[..., 0], sor[..., 1]
+
+
+def sum_of_ratio_category(sor_hc2, sor_hc3):
+    """
+    Hazard category (SOR_CATEGORIES) of sum-of-ratio values, by the rule of HAZCAT.sum_of_ratio_text:
+    HC-2 if SOR HC-2 > 1, else HC-3 if SOR HC-3 > 1, else BELOW HC-3 ('' when both are exactly 1, or NaN).
+    """
+    sor_hc2 = np.asarray(sor_hc2)
+    sor_hc3 = np.asarray(sor_hc3)
+    return np.select([sor_hc2 > 1, sor_hc3 > 1, np.minimum(sor_hc2, sor_hc3) < 1], SOR_CATEGORIES, default='')
+
+
+def _distinct_decay_constants(lam, rtol=1e-9):
+    """
+    Nudge equal decay constants apart so that the Bateman eigenvectors exist.
+
+    Chains occasionally contain two members with the same tabulated half-life; shifting one of them by a relative
+    ``rtol`` changes the activities far below the precision of the half-life data.
+    """
+    lam = lam.astype(np.float64, copy=True)
+    for j in range(1, len(lam)):
+        while np.any(np.abs(lam[:j] - lam[j]) <= rtol * lam[j]):
+            lam[j] *= 1.0 + 10 * rtol
+    return lam
+
+
+def _chain_coefficients(lam, feed):
+    """
+    Bateman coefficients of the activities of one chain (nodes in topological order, the parent first).
+
+    With 1 Bq of pure parent at t = 0 the activity of member j is ``A_j(t) = sum_k a[j, k] exp(-lam[k] t)``. The
+    decay matrix of a single parent's chain is triangular, so the coefficients follow from the forward recurrence
+        a[j, k] = lam[j] * sum_i feed[j, i] a[i, k] / (lam[j] - lam[k])     (k < j)
+        a[j, j] = -sum_k a[j, k]                                            (A_j(0) = 0 for j > 0)
+    which only divides by differences of decay constants, never by the parent's own (possibly tiny) one.
+
+    Args:
+        lam (np.ndarray): Distinct decay constants (1/s).
+        feed (np.ndarray): feed[j, i] is the branching ratio of member i to member j.
+
+    Returns:
+        np.ndarray: Lower triangular (n x n) coefficients.
+    """
+    n = len(lam)
+    a = np.zeros((n, n))
+    a[0, 0] = 1.0
+    for j in range(1, n):
+        a[j, :j] = lam[j] * (feed[j, :j] @ a[:j, :j]) / (lam[j] - lam[:j])
+        a[j, j] = -a[j, :j].sum()
+    return a
+
+
+def bateman_activities(graph, parents, times):
+    """
+    Activities of every member of the decay chains of ``parents`` at the given times.
+
+    Each parent starts as 1 Bq of pure parent at t = 0 and is solved in closed form over its own radioactive
+    descendants only, for all times at once; chains of different parents are never mixed, so a parent's
+    activities do not depend on which other parents are solved with it.
+
+    Args:
+        graph (hazcat_library.DecayGraph): Compiled decay data.
+        parents (list): Parent nuclide names.
+        times (array-like): Times after t = 0 (s).
+
+    Returns:
+        tuple: (nodes, activities)
+            - nodes (np.ndarray): Names of the radioactive chain members, in topological order.
+            - activities (np.ndarray): Shape (len(parents), len(nodes), len(times)); activity (Bq) of each node per
+              Bq of the parent at t = 0. Parents that are unknown or stable give all-zero rows.
+    """
+    times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+    radioactive = np.isfinite(graph.decay_constant) & (graph.decay_constant > 0)
+
+    chains = []
+    for p in parents:
+        pid = graph.ids.get(p, -1)
+        if pid < 0 or not radioactive[pid]:
+            chains.append(None)
+            continue
+        # The chain stops at stable nuclides and at nuclides without a known half-life
+        chains.append([pid] + [d for d in graph._descendant_ids(pid)[0].tolist() if radioactive[d]])
+
+    members = {node for chain in chains if chain for node in chain}
+    nodes = np.array(sorted(members, key=graph.rank.__getitem__), dtype=np.intp)
+    position = {node: k for k, node in enumerate(nodes.tolist())}
+
+    activities = np.zeros((len(parents), len(nodes), len(times)))
+    for p, chain in enumerate(chains):
+        if chain is None:
+            continue
+        local = {node: i for i, node in enumerate(chain)}
+        feed = np.zeros((len(chain), len(chain)))
+        for node in chain:
+            daughters, ratios = graph.children(node)
+            for d, r in zip(daughters.tolist(), ratios.tolist()):
+                if d in local:
+                    feed[local[d], local[node]] += r
+        lam = _distinct_decay_constants(graph.decay_constant[chain])
+        a = _chain_coefficients(lam, feed)
+        activities[p, [position[node] for node in chain]] = np.clip(a @ np.exp(-np.outer(lam, times)), 0.0, None)
+
+    return graph.names[nodes], activities
@@ -0,0 +1,1081 @@
+"""
+Precompiled dose conversion factor (DCF) library for pyHazCat.
+
+The DCF screening in ``HAZCAT.compute_max_dcf`` draws on ten source tables (ICRP-119 Annex A/B/G/H,
+DOE-STD-1196-2011 Table A2/A3, JAERI-Data/Code 2002-013 Table 3/5/6/7 and FGR-15) stored as Excel
+workbooks and CSV files. Parsing those files is by far the slowest part of a HazCat run, so this module
+normalizes every source table once and writes the result to a single columnar ``.npz`` store that can be
+loaded in milliseconds.
+
+Build the store with:
+
+    python hazcat_library.py build
+
+Every other workbook/CSV read by pyHazCat goes through the process-wide ``library_cache`` so that each file
+(or workbook sheet) is parsed at most once per process.
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from hazcat_profile import profiler
+from hazcat_logging import get_logger, configure_logging
+
+# Library paths are anchored to the package, so pyHazCat works from any current directory
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+LIBRARY_DIR = os.path.join(PACKAGE_DIR, "library")
+DCF_LIBRARY_FILE = os.path.join(LIBRARY_DIR, "dcf_library.npz")
+DCF_LIBRARY_FORMAT = 1
+
+log = get_logger('library')
+
+
+class LibraryCache:
+    """
+    Process-wide LRU cache of parsed library tables.
+
+    Entries are keyed by the absolute file path, the sheet name (for workbooks), the parser options and the
+    modification time of the file, so an edited file is transparently re-read. Least recently used entries
+    are evicted once the cached DataFrames exceed ``max_bytes`` (or ``max_entries``). Callers always receive
+    a copy, so in-place edits (``dropna(inplace=True)`` etc.) never leak into the cache.
+
+    Args:
+        max_bytes (int): Memory cap for the cached DataFrames (deep memory usage). Defaults to 512 MiB.
+        max_entries (int, optional): Maximum number of cached tables.
+    """
+
+    def __init__(self, max_bytes=512 * 2 ** 20, max_entries=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, kind, path, sheet_name, kwargs, parse):
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        key = (kind, path, sheet_name, tuple(sorted((k, tuple(v) if isinstance(v, list) else v)
+                                                    for k, v in kwargs.items())))
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == mtime:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1].copy()
+
+        if entry is not None:
+            # file changed on disk since it was cached
+            self._discard(key)
+        self.misses += 1
+        profiler.count('library.tables_parsed')
+        with profiler.stage('library_load'):
+            df = parse()
+        nbytes = int(df.memory_usage(deep=True).sum())
+        self._entries[key] = (mtime, df, nbytes)
+        self._nbytes += nbytes
+        self._evict()
+        return df.copy()
+
+    def _discard(self, key):
+        _, _, nbytes = self._entries.pop(key)
+        self._nbytes -= nbytes
+
+    def _evict(self):
+        while len(self._entries) > 1 and (self._nbytes > self.max_bytes or
+                                          (self.max_entries is not None and len(self._entries) > self.max_entries)):
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def read_excel(self, path, sheet_name=0, **kwargs):
+        """Cached ``pd.read_excel`` of one workbook sheet."""
+        return self._get('excel', path, sheet_name, kwargs,
+                         lambda: pd.read_excel(path, sheet_name=sheet_name, **kwargs))
+
+    def read_csv(self, path, **kwargs):
+        """Cached ``pd.read_csv``."""
+        return self._get('csv', path, None, kwargs, lambda: pd.read_csv(path, **kwargs))
+
+    def invalidate(self, path=None):
+        """Drop every cached table (or only the tables read from ``path``)."""
+        if path is None:
+            self._entries.clear()
+            self._nbytes = 0
+            return
+        path = os.path.abspath(path)
+        for key in [k for k in self._entries if k[1] == path]:
+            self._discard(key)
+
+    def stats(self):
+        """Hit/miss counters and current size of the cache."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries), 'bytes': self._nbytes}
+
+    def __repr__(self):
+        s = self.stats()
+        return (f"LibraryCache(hits={s['hits']}, misses={s['misses']}, evictions={s['evictions']}, "
+                f"entries={s['entries']}, bytes={s['bytes']})")
+
+
+library_cache = LibraryCache()
+
+
+def read_annex_g_icrp119_dcf_inh_public(file_path):
+    """ICRP-119 Annex G: inhalation dose coefficients for members of the public."""
+    df = library_cache.read_excel(file_path, engine="openpyxl")
+    df.columns = ['Nuclide', 'Half-life', 'Type', 'f1', 'inh_infant', 'f1_age_g_gt_1a',
+                  'inh_1_year', 'inh_5_years', 'inh_10_years', 'inh_15_years',
+                  'inh_adult']
+    return df
+
+
+def read_annex_h_icrp119_dcf_inhal_reactive_soluble_gases_public(file_path):
+    """ICRP-119 Annex H: inhalation dose coefficients of soluble/reactive gases for members of the public."""
+    df = library_cache.read_csv(file_path, skiprows=1, index_col=0)
+    df.columns = ['Nuclide', 'Half-life', 'Type', 'f1', 'inh_infant', 'f1_age_g_gt_1a',
+                  'inh_1_year', 'inh_5_years', 'inh_10_years', 'inh_15_years', 'inh_adult',
+                  'VAPOUR_FORM']
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def read_table_a2_doe_std_1196_2011_dcf_inhal(file_path):
+    """DOE-STD-1196-2011 Table A-2: inhalation dose coefficients."""
+    df = library_cache.read_csv(file_path, skiprows=0)
+    df.columns = ['Index', 'Nuclide', 'Type', 'f1', 'inh_infant', 'inh_1_year',
+                  'inh_5_year', 'inh_10_year', 'inh_15_year', 'inh_adult', 'Reference Person']
+    # first column index is removed
+    return df.iloc[:, 1:]
+
+
+def read_table_5_jaeri_dcf_inh_particulates_public(file_path):
+    """JAERI-Data/Code 2002-013 Table 5: inhalation dose coefficients of particulates for the public."""
+    df = library_cache.read_csv(file_path, skiprows=0)
+    df.columns = ['Index', 'Nuclide', 'Half-life', 'Type', 'f1', 'inh_infant', 'f1_age_g_gt_1a',
+                  'inh_1_year', 'inh_5_years', 'inh_10_years', 'inh_15_years', 'inh_adult']
+    return df.iloc[:, 1:]
+
+
+def read_table_7_jaeri_dcf_inh_public_soluble_reactive_gases_vapours(file_path):
+    """JAERI-Data/Code 2002-013 Table 7: inhalation dose coefficients of soluble/reactive gases for the public."""
+    df = library_cache.read_csv(file_path, header=0)
+    df.columns = ['Index', 'Nuclide', 'Chemical Form', 'Half-life', 'Type', 'percent_deposit', 'f1',
+                  'inh_infant', 'f1_age_g_gt_1a', 'inh_1_year', 'inh_5_years',
+                  'inh_10_years', 'inh_15_years', 'inh_adult']
+    # first column index is removed
+    return df.iloc[:, 1:]
+
+
+def read_table_4_6_fgr_15_dcf_ecerman_submersion(file_path, sheet_name='submersion_dose'):
+    """FGR-15: air submersion dose rate coefficients."""
+    df = library_cache.read_excel(file_path, sheet_name=sheet_name, engine="openpyxl")
+
+    # Drop fully empty rows
+    df.dropna(axis=0, how='all', inplace=True)
+
+    expected_columns = ['Nuclide', 'sub_infant', 'sub_1_year', 'sub_5_years',
+                        'sub_10_years', 'sub_15_years', 'sub_adult']
+    if len(df.columns) >= len(expected_columns):
+        df.columns = expected_columns
+    return df
+
+
+def read_table_a3_doe_std_1196_2011_dcf_submersion(file_path):
+    """DOE-STD-1196-2011 Table A-3: air submersion dose rate coefficients."""
+    df = library_cache.read_excel(file_path, engine="openpyxl")
+
+    # Merge 2nd and 3rd columns (half-life value and unit) with a space separator
+    df["Merged_Col2_Col3"] = df.iloc[:, 1].astype(str) + " " + df.iloc[:, 2].astype(str)
+    df.drop(df.columns[[1, 2]], axis=1, inplace=True)
+    df.columns = ["Nuclide", "sub_adult", "Half-life"]
+    return df
+
+
+def read_annex_a_icrp119_dcf_inhal_worker(file_path, sheet_name=0):
+    """ICRP-119 Annex A: inhalation and ingestion dose coefficients for workers."""
+    df = library_cache.read_excel(file_path, sheet_name=sheet_name)
+
+    # Drop fully empty rows
+    df.dropna(axis=0, how='all', inplace=True)
+
+    expected_cols = 9
+    if df.shape[1] < expected_cols:
+        raise ValueError(f"Expected at least {expected_cols} columns, found {df.shape[1]}.")
+
+    df.columns = ['Element', 'Nuclide', 'Half-life', 'Type', 'inh_f1', 'inh_adult_1mu_m',
+                  'inh_adult_5mu_m', 'ing_f1', 'ing_adult']
+    return df.drop(columns=['Element'])
+
+
+def read_annex_b_icrp119_dcf_inhal_reactive_soluble_gases_worker(file_path):
+    """ICRP-119 Annex B: inhalation dose coefficients of soluble/reactive gases for workers."""
+    df = library_cache.read_csv(file_path, skiprows=1, sep=None, engine="python")
+
+    expected_cols = 4
+    if df.shape[1] < expected_cols:
+        raise ValueError(f"Expected at least {expected_cols} columns, found {df.shape[1]}.")
+
+    df.columns = ['Nuclide', 'Chemical Form', 'Half-life', 'inh_adult']
+    df.dropna(subset=["Nuclide"], inplace=True)
+    return df
+
+
+def read_table_3_jaeri_dcf_inh_ing_particulates_worker(file_path):
+    """JAERI-Data/Code 2002-013 Table 3: inhalation and ingestion dose coefficients of particulates for workers."""
+    df = library_cache.read_csv(file_path, skiprows=0)
+
+    expected_cols = 9
+    if df.shape[1] < expected_cols:
+        raise ValueError(f"Expected at least {expected_cols} columns, found {df.shape[1]}.")
+
+    df.columns = ['Element', 'Nuclide', 'Half-life', 'Type', 'inh_f1', 'inh_adult_1mu_m',
+                  'inh_adult_5mu_m', 'ing_f1', 'ing_adult']
+    return df.iloc[:, 1:]
+
+
+def read_table_6_jaeri_dcf_soluble_reactive_gases_worker(file_path):
+    """JAERI-Data/Code 2002-013 Table 6: inhalation dose coefficients of soluble/reactive gases for workers."""
+    df = library_cache.read_csv(file_path, header=0)
+
+    expected_cols = 5
+    if df.shape[1] < expected_cols:
+        raise ValueError(f"Expected at least {expected_cols} columns, but found {df.shape[1]}.")
+
+    df.columns = ['Index', 'Nuclide', 'Chemical Form', 'Half-life', 'inh_adult']
+    return df.drop(columns=['Index'], errors='ignore')
+
+
+# Reference name (as used in the merged DCF frames) -> (path relative to the library, reader)
+DCF_TABLES = {
+    'Annex_G_ICRP_119': ("inhalation_HC2/Annex_G_ICRP119_dcf_inh_public.xlsx",
+                         read_annex_g_icrp119_dcf_inh_public),
+    'Annex_H_ICRP_119': ("inhalation_HC2/Annex_H_ICRP119_dcf_inhal_reactive_soluble_gases_public.csv",
+                         read_annex_h_icrp119_dcf_inhal_reactive_soluble_gases_public),
+    'Table_A2_DOE_STD_1196_2011': ("inhalation_HC2/Table_A2-DOE-STD-1196-2011_dcf_inhal.csv",
+                                   read_table_a2_doe_std_1196_2011_dcf_inhal),
+    'Table_5_JAERI_DATA_CODE_2002_013': ("inhalation_HC2/Table_5_JAERI_dcf_inh_particulates_public.csv",
+                                         read_table_5_jaeri_dcf_inh_particulates_public),
+    'Table_7_JAERI_DATA_CODE_2002_013': ("inhalation_HC2/Table_7_JAERI_dcf_inh_Public_Soluble_Reactive_Gases_Vapours.csv",
+                                         read_table_7_jaeri_dcf_inh_public_soluble_reactive_gases_vapours),
+    'Table_4_6_FGR15': ("submersion_HC2/Dose_ecerman_final_FGR15.xlsx",
+                        read_table_4_6_fgr_15_dcf_ecerman_submersion),
+    'Table_A3_DOE_STD_1196_2011': ("submersion_HC2/Table_A3_DOE_STD_1196_2011_dcf_submersion.xlsx",
+                                   read_table_a3_doe_std_1196_2011_dcf_submersion),
+    'Annex_A_ICRP_119': ("inhalation_HC3/AnnexA_ICRP119_dcf_inhal_Worker.xlsx",
+                         read_annex_a_icrp119_dcf_inhal_worker),
+    'Annex_B_ICRP_119': ("inhalation_HC3/AnnexB_ICRP119_dcf_inh_soluble_reactive_gas_worker.csv",
+                         read_annex_b_icrp119_dcf_inhal_reactive_soluble_gases_worker),
+    'Table_3_JAERI_DATA_CODE_2002_013': ("inhalation_HC3/Table3_JAERI_dcf_ing_inh_PARTICULATES_Worker.csv",
+                                         read_table_3_jaeri_dcf_inh_ing_particulates_worker),
+    'Table_6_JAERI_DATA_CODE_2002_013': ("inhalation_HC3/Table6_JAERI_dcf_Soluble_Reactive_Gases_Worker.csv",
+                                         read_table_6_jaeri_dcf_soluble_reactive_gases_worker),
+}
+
+
+def dcf_table_path(name, library_dir=LIBRARY_DIR):
+    """Return the path of the source file behind a DCF table."""
+    return os.path.join(library_dir, DCF_TABLES[name][0])
+
+
+# How each screen_* method of HAZCAT matches a radionuclide against the "Nuclide" column of a table:
+#   'token'       - str.strip().str.upper().str.contains(r"(?:^|_)(?:NUCLIDE)(?:_|$)") on the upper-cased name
+#   'token_exact' - same pattern, case-sensitive, without strip (JAERI Table 3)
+#   'prefix'      - str.match(rf"^{re.escape(nuclide)}(_\w+)?$") (ICRP-119 Annex A)
+#   'equal'       - df['Nuclide'] == nuclide (FGR-15 and DOE-STD-1196 Table A3)
+DCF_TABLE_MATCH = {
+    'Annex_G_ICRP_119': 'token',
+    'Annex_H_ICRP_119': 'token',
+    'Table_A2_DOE_STD_1196_2011': 'token',
+    'Table_5_JAERI_DATA_CODE_2002_013': 'token',
+    'Table_7_JAERI_DATA_CODE_2002_013': 'token',
+    'Table_4_6_FGR15': 'equal',
+    'Table_A3_DOE_STD_1196_2011': 'equal',
+    'Annex_A_ICRP_119': 'prefix',
+    'Annex_B_ICRP_119': 'token',
+    'Table_3_JAERI_DATA_CODE_2002_013': 'token_exact',
+    'Table_6_JAERI_DATA_CODE_2002_013': 'token',
+}
+
+# Characters that make a nuclide name behave differently when it is pasted into a regular expression
+_REGEX_META = set(".^$*+?{}[]\\|()")
+_WORD_TAIL = re.compile(r"\w+")
+
+
+def regex_nuclide_rows(df, nuclide, mode):
+    """
+    Row positions selected by the original regular-expression filters of the screen_* methods.
+
+    This is the reference implementation the ``NuclideIndex`` is checked against.
+    """
+    col = df["Nuclide"]
+    if mode == 'token':
+        mask = col.astype(str).str.strip().str.upper().str.contains(
+            rf"(?:^|_)(?:{nuclide.upper()})(?:_|$)", regex=True, na=False)
+    elif mode == 'token_exact':
+        mask = col.str.contains(rf"(?:^|_)(?:{nuclide})(?:_|$)", regex=True, na=False)
+    elif mode == 'prefix':
+        mask = col.str.match(rf"^{re.escape(nuclide)}(_\w+)?$", na=False)
+    elif mode == 'equal':
+        mask = col == nuclide
+    else:
+        raise ValueError(f"Unknown nuclide match mode: {mode}")
+    return np.flatnonzero(np.asarray(mask, dtype=bool))
+
+
+class NuclideIndex:
+    """
+    Hash index from nuclide name to the row positions of a DCF table.
+
+    The keys are chosen so that a plain dictionary lookup selects exactly the rows the regular-expression
+    filter of the corresponding screen_* method would select:
+
+    - ``token`` / ``token_exact``: every run of consecutive ``_``-separated tokens of a (normalized) name,
+      so a row such as ``Rb-81_Kr-81m`` is found under ``Rb-81``, ``Kr-81m`` and ``Rb-81_Kr-81m``.
+    - ``prefix``: the full name plus every ``_``-prefix whose remainder is a word-character tail.
+    - ``equal``: the name itself.
+
+    Token queries containing regex metacharacters (or empty queries) are not plain names; they fall back to
+    the original regex scan so the result is still identical.
+
+    Attributes:
+        mode (str): One of the match modes in ``DCF_TABLE_MATCH``.
+        positions (dict): Key -> sorted np.ndarray of row positions.
+    """
+
+    def __init__(self, nuclides, mode):
+        self.mode = mode
+        self._nuclides = pd.Series(nuclides, copy=False) if not isinstance(nuclides, pd.Series) else nuclides
+        rows = {}
+        for pos, value in enumerate(self._nuclides.to_numpy(dtype=object)):
+            for key in self._keys(value):
+                rows.setdefault(key, []).append(pos)
+        self.positions = {key: np.unique(np.asarray(pos, dtype=np.intp)) for key, pos in rows.items()}
+        self._empty = np.empty(0, dtype=np.intp)
+
+    @classmethod
+    def from_frame(cls, df, mode):
+        """Build the index of a table's "Nuclide" column."""
+        return cls(df["Nuclide"].reset_index(drop=True), mode)
+
+    def _keys(self, value):
+        if self.mode == 'token':
+            # astype(str) turns missing values into 'nan', which the regex can match
+            return self._token_runs(str(value).strip().upper())
+        if not isinstance(value, str):
+            return ()
+        if self.mode == 'token_exact':
+            return self._token_runs(value)
+        if self.mode == 'prefix':
+            keys = set()
+            # '$' also matches just before a trailing newline
+            for name in {value, value[:-1]} if value.endswith("\n") else {value}:
+                keys.add(name)
+                for i, ch in enumerate(name):
+                    if ch == "_" and _WORD_TAIL.fullmatch(name, i + 1):
+                        keys.add(name[:i])
+            return keys
+        if self.mode == 'equal':
+            return (value,)
+        raise ValueError(f"Unknown nuclide match mode: {self.mode}")
+
+    @staticmethod
+    def _token_runs(name):
+        tokens = name.split("_")
+        return {"_".join(tokens[i:j]) for i in range(len(tokens)) for j in range(i + 1, len(tokens) + 1)}
+
+    def _normalize(self, nuclide):
+        if self.mode == 'token':
+            return nuclide.upper()
+        return nuclide
+
+    def rows(self, nuclide):
+        """Sorted row positions matching ``nuclide``."""
+        key = self._normalize(nuclide)
+        if self.mode in ('token', 'token_exact') and (not key or not _REGEX_META.isdisjoint(key)):
+            return regex_nuclide_rows(pd.DataFrame({"Nuclide": self._nuclides}), nuclide, self.mode)
+        return self.positions.get(key, self._empty)
+
+    def rows_many(self, nuclides, errors='raise'):
+        """
+        Row positions for several nuclides at once.
+
+        Args:
+            nuclides (iterable): Names to look up.
+            errors (str): 'raise' (default) or 'ignore' to treat names the regex fallback rejects as unmatched.
+
+        Returns:
+            tuple: (positions, owner) arrays; ``owner[k]`` is the index into ``nuclides`` that selected
+            ``positions[k]``, so ``df.iloc[positions]`` gathers every match in one step.
+        """
+        hits = []
+        for n in nuclides:
+            try:
+                hits.append(self.rows(n))
+            except re.error:
+                if errors != 'ignore':
+                    raise
+                hits.append(self._empty)
+        owner = np.repeat(np.arange(len(hits), dtype=np.intp), [len(h) for h in hits])
+        positions = np.concatenate(hits) if hits else self._empty
+        return positions.astype(np.intp, copy=False), owner
+
+    def take(self, df, nuclide):
+        """Rows of ``df`` (the indexed table) matching ``nuclide``."""
+        return df.iloc[self.rows(nuclide)]
+
+    def __len__(self):
+        return len(self.positions)
+
+
+def _source_stamp(path):
+    """Modification time and size of a source file, used to detect a stale store."""
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _column_to_arrays(series):
+    """
+    Convert a DataFrame column into plain NumPy arrays that ``np.savez`` can store without pickling.
+
+    Numeric columns are kept as they are. Any other column is stored as a fixed-width unicode array together
+    with a boolean mask marking the missing values.
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(), None
+    na = series.isna().to_numpy()
+    values = np.array(["" if m else str(v) for v, m in zip(series.to_numpy(dtype=object), na)], dtype=str)
+    return values, na
+
+
+def _arrays_to_column(values, na):
+    """Inverse of ``_column_to_arrays``."""
+    if na is None:
+        return values
+    out = values.astype(object)
+    out[na] = np.nan
+    return out
+
+
+class DcfLibrary:
+    """
+    In-memory view of the compiled DCF store.
+
+    Attributes:
+        tables (dict): Reference name -> normalized DataFrame, for every table that could be read.
+        errors (dict): Reference name -> error message, for every table that failed to build.
+        sources (dict): Reference name -> [mtime_ns, size] of the source file at build time.
+    """
+
+    def __init__(self, tables, errors=None, sources=None):
+        self.tables = tables
+        self.errors = errors or {}
+        self.sources = sources or {}
+        self._indexes = {}
+
+    def get(self, name):
+        """Return the normalized table, or None if it is not part of the store."""
+        return self.tables.get(name)
+
+    def index(self, name):
+        """Return the ``NuclideIndex`` of a table (built on first use), or None if the table is missing."""
+        if name not in self._indexes:
+            df = self.tables.get(name)
+            self._indexes[name] = None if df is None else NuclideIndex.from_frame(df, DCF_TABLE_MATCH[name])
+        return self._indexes[name]
+
+    def is_stale(self, library_dir=LIBRARY_DIR):
+        """True if any source file changed (or disappeared/appeared) since the store was built."""
+        for name in DCF_TABLES:
+            path = dcf_table_path(name, library_dir)
+            stamp = _source_stamp(path) if os.path.exists(path) else None
+            if stamp != self.sources.get(name):
+                return True
+        return False
+
+
+def build_dcf_library(library_dir=LIBRARY_DIR, store_path=None):
+    """
+    Read every DCF source table once, normalize it and write the compiled columnar store.
+
+    Args:
+        library_dir (str): Directory holding the source tables.
+        store_path (str, optional): Output file. Defaults to ``<library_dir>/dcf_library.npz``.
+
+    Returns:
+        DcfLibrary: The freshly built library.
+    """
+    store_path = store_path or os.path.join(library_dir, os.path.basename(DCF_LIBRARY_FILE))
+
+    arrays = {}
+    tables = {}
+    errors = {}
+    sources = {}
+    for name, (rel_path, reader) in DCF_TABLES.items():
+        path = os.path.join(library_dir, rel_path)
+        sources[name] = _source_stamp(path) if os.path.exists(path) else None
+        try:
+            df = reader(path).reset_index(drop=True)
+        except Exception as e:
+            errors[name] = f"Error: {e}"
+            continue
+
+        tables[name] = df
+        arrays[f"{name}.__columns__"] = np.array([str(c) for c in df.columns], dtype=str)
+        for i, col in enumerate(df.columns):
+            values, na = _column_to_arrays(df[col])
+            arrays[f"{name}.{i}"] = values
+            if na is not None:
+                arrays[f"{name}.{i}.__na__"] = na
+
+    meta = {"format": DCF_LIBRARY_FORMAT, "sources": sources, "errors": errors}
+    arrays["__meta__"] = np.array(json.dumps(meta))
+    np.savez(store_path, **arrays)
+
+    return DcfLibrary(tables, errors, sources)
+
+
+def read_dcf_library(store_path=DCF_LIBRARY_FILE):
+    """Load a compiled DCF store from disk."""
+    with np.load(store_path, allow_pickle=False) as store:
+        meta = json.loads(str(store["__meta__"]))
+        if meta.get("format") != DCF_LIBRARY_FORMAT:
+            raise ValueError(f"Unsupported DCF library format in {store_path}: {meta.get('format')}")
+
+        tables = {}
+        for name in DCF_TABLES:
+            key = f"{name}.__columns__"
+            if key not in store.files:
+                continue
+            columns = store[key].tolist()
+            data = {}
+            for i, col in enumerate(columns):
+                na_key = f"{name}.{i}.__na__"
+                na = store[na_key] if na_key in store.files else None
+                data[col] = _arrays_to_column(store[f"{name}.{i}"], na)
+            tables[name] = pd.DataFrame(data, columns=columns)
+
+    return DcfLibrary(tables, meta.get("errors"), meta.get("sources"))
+
+
+_dcf_library = None
+
+
+def load_dcf_library(library_dir=LIBRARY_DIR, store_path=None, rebuild_if_stale=True):
+    """
+    Return the process-wide DCF library, building the compiled store on first use.
+
+    The store is loaded at most once per process. It is rebuilt when it does not exist yet or (with
+    ``rebuild_if_stale``) when any source table changed since it was built.
+    """
+    global _dcf_library
+    store_path = store_path or os.path.join(library_dir, os.path.basename(DCF_LIBRARY_FILE))
+
+    if _dcf_library is not None:
+        return _dcf_library
+
+    with profiler.stage('library_load'):
+        library = None
+        if os.path.exists(store_path):
+            try:
+                library = read_dcf_library(store_path)
+            except (ValueError, OSError, KeyError) as e:
+                log.warning("could not read DCF library %s (%s); rebuilding.", store_path, e)
+            if library is not None and rebuild_if_stale and library.is_stale(library_dir):
+                library = None
+
+        if library is None:
+            library = build_dcf_library(library_dir, store_path)
+
+    _dcf_library = library
+    return _dcf_library
+
+
+HALF_LIFE_TABLE = os.path.join(LIBRARY_DIR, "half-life", "radionuclides_halflife_complete.csv")
+NOMENCLATURE_TABLE = os.path.join(LIBRARY_DIR, "half-life", "formatted_nuclide_nomenclature.csv")
+JAERI_HALF_LIFE_TABLE = os.path.join(LIBRARY_DIR, "half-life", "Table1_2_JAERI_half_life.csv")
+MASS_TABLE = os.path.join(LIBRARY_DIR, "MASS", "massround_data_final.csv")
+MASS_ARRAY_FILE = os.path.join(LIBRARY_DIR, "MASS", "massround_data_final.npz")
+DOE_TQ_WORKBOOK = os.path.join(LIBRARY_DIR, "doe_haz_cat_excel.xlsx")
+ECKERMAN_WORKBOOK = os.path.join(LIBRARY_DIR, "Dose_ecerman_final.xlsx")
+RADIOTOXICITY_WORKBOOK = os.path.join(LIBRARY_DIR, "RadioToxicityMaster.xls")
+WORKER_ICRP119_WORKBOOK = os.path.join(LIBRARY_DIR, "worker_icrp119.xlsx")
+ATOMIC_WEIGHT_WORKBOOK = os.path.join(LIBRARY_DIR, "AWS.xls")
+
+# Consolidated nuclide property table: one fixed-width record per nuclide, memory-mapped read-only
+NUCLIDE_TABLE_FILE = os.path.join(LIBRARY_DIR, "nuclide_properties.npy")
+NUCLIDE_TABLE_FORMAT = 2
+NUCLIDE_DTYPE = np.dtype([
+    ("nuclide", "U16"),          # name as used in rads_list (e.g. "Co-60", "Eu-150s")
+    ("z", "i4"),                 # atomic number (-1 if unknown)
+    ("a", "i4"),                 # mass number (-1 if unknown)
+    ("half_life_s", "f8"),       # half-life (s)
+    ("decay_constant", "f8"),    # 0.693 / half-life (1/s)
+    ("atomic_mass", "f8"),       # atomic mass (u)
+    ("e1_mev", "f8"),            # photon energy per decay, ICRP-107 (MeV)
+    ("decay_mode", "U16"),
+])
+NUCLIDE_TABLE_SOURCES = (HALF_LIFE_TABLE, NOMENCLATURE_TABLE, JAERI_HALF_LIFE_TABLE, MASS_ARRAY_FILE, DOE_TQ_WORKBOOK)
+
+
+def _sources_stamp(paths, library_dir=LIBRARY_DIR):
+    """
+    Stamps of the source files, keyed by their path relative to the library.
+
+    `paths` are given within LIBRARY_DIR; the files stamped are those at the same place within `library_dir`.
+    """
+    stamps = {}
+    for path in paths:
+        rel_path = os.path.relpath(path, LIBRARY_DIR)
+        path = os.path.join(library_dir, rel_path)
+        stamps[rel_path] = _source_stamp(path) if os.path.exists(path) else None
+    return stamps
+
+
+class NuclideTable:
+    """
+    Read-only view of the consolidated nuclide property table.
+
+    The records live in a ``.npy`` file opened with ``numpy.memmap`` semantics, so worker processes that load the
+    same file share its pages instead of each parsing the CSV sources. Lookups by nuclide name go through a dict to
+    a row id; all further access is array indexing.
+
+    Attributes:
+        data (np.ndarray): Structured array (``NUCLIDE_DTYPE``), memory-mapped when loaded from disk.
+        sources (dict): Source path (relative to the library) -> [mtime_ns, size] at build time.
+    """
+
+    def __init__(self, data, sources=None):
+        self.data = data
+        self.sources = sources or {}
+        self._ids = {str(name): i for i, name in enumerate(data["nuclide"])}
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, nuclide):
+        return nuclide in self._ids
+
+    def ids(self, nuclides):
+        """Row ids of the nuclides (-1 for names not in the table)."""
+        return np.fromiter((self._ids.get(n, -1) for n in nuclides), dtype=np.intp, count=len(nuclides))
+
+    def take(self, nuclides):
+        """
+        Records of the nuclides, in order, as a new structured array.
+
+        Names that are not in the table get NaN floats, -1 integers and empty strings.
+        """
+        ids = self.ids(nuclides)
+        records = self.data[np.where(ids < 0, 0, ids)] if len(self.data) else np.zeros(len(ids), NUCLIDE_DTYPE)
+        missing = ids < 0
+        if missing.any():
+            for field in NUCLIDE_DTYPE.names:
+                kind = NUCLIDE_DTYPE[field].kind
+                records[field][missing] = np.nan if kind == "f" else (-1 if kind == "i" else "")
+            records["nuclide"][missing] = np.asarray(nuclides, dtype=object)[missing]
+        return records
+
+    def is_stale(self, library_dir=LIBRARY_DIR):
+        """True if any source table of `library_dir` changed since the property table was built."""
+        return _sources_stamp(NUCLIDE_TABLE_SOURCES, library_dir) != self.sources
+
+
+def write_nuclide_table(records, path=NUCLIDE_TABLE_FILE, library_dir=LIBRARY_DIR):
+    """
+    Write the property table as a ``.npy`` file plus a ``.json`` sidecar holding the source stamps.
+
+    Args:
+        records (np.ndarray): Structured array with dtype ``NUCLIDE_DTYPE``.
+        path (str): Output ``.npy`` file.
+        library_dir (str): Directory holding the source tables that are stamped.
+
+    Returns:
+        NuclideTable: Table backed by the freshly written file.
+    """
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=NUCLIDE_DTYPE, shape=(len(records),))
+    out[:] = records
+    out.flush()
+    del out
+
+    meta = {"format": NUCLIDE_TABLE_FORMAT, "sources": _sources_stamp(NUCLIDE_TABLE_SOURCES, library_dir)}
+    with open(os.path.splitext(path)[0] + ".json", "w") as f:
+        json.dump(meta, f, indent=1)
+    return read_nuclide_table(path)
+
+
+def read_nuclide_table(path=NUCLIDE_TABLE_FILE):
+    """Memory-map a property table written by ``write_nuclide_table``."""
+    with open(os.path.splitext(path)[0] + ".json") as f:
+        meta = json.load(f)
+    if meta.get("format") != NUCLIDE_TABLE_FORMAT:
+        raise ValueError(f"Unsupported nuclide table format in {path}: {meta.get('format')}")
+    data = np.load(path, mmap_mode="r")
+    if data.dtype != NUCLIDE_DTYPE:
+        raise ValueError(f"Unexpected record layout in {path}")
+    return NuclideTable(data, meta.get("sources"))
+
+
+_nuclide_table = None
+
+
+def load_nuclide_table(build, path=NUCLIDE_TABLE_FILE, rebuild_if_stale=True):
+    """
+    Return the process-wide nuclide property table, building it on first use.
+
+    Args:
+        build (callable): Returns the records (``NUCLIDE_DTYPE`` array) when the table has to be (re)built.
+        path (str): Location of the ``.npy`` file.
+        rebuild_if_stale (bool): Rebuild when any source table changed since the last build.
+    """
+    global _nuclide_table
+    if _nuclide_table is not None:
+        return _nuclide_table
+
+    with profiler.stage('library_load'):
+        table = None
+        if os.path.exists(path):
+            try:
+                table = read_nuclide_table(path)
+            except (ValueError, OSError, KeyError) as e:
+                log.warning("could not read nuclide table %s (%s); rebuilding.", path, e)
+            if table is not None and rebuild_if_stale and table.is_stale():
+                table = None
+
+        if table is None:
+            table = write_nuclide_table(build(), path)
+
+    _nuclide_table = table
+    return _nuclide_table
+
+
+_NUCLIDE_NAME = re.compile(r"^([A-Za-z]+)-([1-9]\d*)([a-z]*)$")
+
+
+class MassTable:
+    """
+    Atomic masses as typed arrays sorted by (Z, A, isomer), written by library/MASS/convert_amdc_mass_data_to_csv.py.
+
+    Lookups are a binary search over the packed (Z, A, isomer) key. Masses are those of the ground state (AME), so
+    a metastable state such as "Ba-137m" gets the mass of "Ba-137", as get_atomic_mass always did.
+    """
+
+    def __init__(self, z, a, isomer, mass, symbol):
+        self.z = np.asarray(z, dtype=np.int32)
+        self.a = np.asarray(a, dtype=np.int32)
+        self.isomer = np.asarray(isomer, dtype=np.int8)
+        self.mass = np.asarray(mass, dtype=np.float64)
+        self.key = self._key(self.z, self.a, self.isomer)
+        if np.any(np.diff(self.key) < 0):
+            raise ValueError("Mass table is not sorted by (Z, A, isomer)")
+        self.z_of_symbol = dict(zip(np.asarray(symbol, dtype=str).tolist(), self.z.tolist()))
+
+    @staticmethod
+    def _key(z, a, isomer):
+        return (np.asarray(z, dtype=np.int64) * 1000 + np.asarray(a, dtype=np.int64)) * 10 + np.asarray(isomer)
+
+    def lookup(self, z, a, isomer=0):
+        """
+        Masses for arrays of (Z, A, isomer).
+
+        Returns:
+            tuple: (mass, found) arrays; mass is NaN where found is False.
+        """
+        key = np.atleast_1d(self._key(z, a, isomer))
+        pos = np.clip(np.searchsorted(self.key, key), 0, max(len(self.key) - 1, 0))
+        found = (self.key[pos] == key) if len(self.key) else np.zeros(key.shape, dtype=bool)
+        return np.where(found, self.mass[pos], np.nan), found
+
+    def masses(self, nuclides):
+        """
+        Masses for nuclide names such as "Cs-137" or "Ba-137m".
+
+        Returns:
+            tuple: (mass, error) arrays; error is True (and mass NaN) for unknown or malformed names.
+        """
+        z = np.full(len(nuclides), -1, dtype=np.int32)
+        a = np.full(len(nuclides), -1, dtype=np.int32)
+        for i, name in enumerate(nuclides):
+            match = _NUCLIDE_NAME.match(str(name))
+            if match and match.group(1) in self.z_of_symbol:
+                z[i] = self.z_of_symbol[match.group(1)]
+                a[i] = int(match.group(2))
+        mass, found = self.lookup(z, a)
+        return mass, ~found
+
+
+_mass_table = None
+
+
+def load_mass_table(path=MASS_ARRAY_FILE):
+    """Return the process-wide ``MassTable``."""
+    global _mass_table
+    if _mass_table is None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{path} not found; run library/MASS/convert_amdc_mass_data_to_csv.py")
+        with profiler.stage('library_load'), np.load(path, allow_pickle=False) as data:
+            _mass_table = MassTable(data["z"], data["a"], data["isomer"], data["mass"], data["symbol"])
+    return _mass_table
+
+
+def convert_half_life_to_seconds(half_life):
+    """Convert half-life string with unit to seconds."""
+    units = {"ls": 1e-6, "us": 1e-6, "ms": 1e-3, "s": 1, "m": 60, "h": 3600, "d": 86400, "y": 31556952}
+
+    if isinstance(half_life, (int, float)):  # If already numeric, return as is
+        return half_life
+
+    if isinstance(half_life, str):
+        half_life = half_life.strip()
+        for unit, factor in units.items():
+            if half_life.endswith(unit):
+                try:
+                    value = float(half_life.replace(unit, "").strip())
+                    return value * factor
+                except ValueError:
+                    return None  # If conversion fails
+
+    return None  # If no match
+
+
+class DecayGraph:
+    """
+    Decay chains compiled from the "Daughter Products" column of radionuclides_halflife_complete.csv.
+
+    Parent -> daughter edges are stored as CSR arrays (``indptr``, ``daughters``, ``branching``), nodes carry their
+    half-life and decay constant (ln 2 / T; 0 for stable nuclides), and ``order`` is a topological order (parents before
+    daughters). Daughters that are not listed in the table (stable end products, or a few very short-lived nuclides)
+    are terminal nodes; spontaneous fission ('SF') is not a node.
+
+    Attributes:
+        names (np.ndarray): Node names.
+        half_life (np.ndarray): Half-life (s); inf for stable nuclides, NaN where unknown.
+        decay_constant (np.ndarray): ln 2 / half-life (1/s).
+        indptr, daughters, branching (np.ndarray): CSR adjacency; the daughters of node i are
+            ``daughters[indptr[i]:indptr[i + 1]]`` with branching ratios ``branching[indptr[i]:indptr[i + 1]]``.
+        order (np.ndarray): Node ids in topological order.
+    """
+
+    def __init__(self, names, half_life, indptr, daughters, branching):
+        self.names = np.asarray(names, dtype=str)
+        self.half_life = np.asarray(half_life, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            self.decay_constant = np.where(np.isinf(self.half_life), 0.0, np.log(2) / self.half_life)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.daughters = np.asarray(daughters, dtype=np.intp)
+        self.branching = np.asarray(branching, dtype=np.float64)
+        self.ids = {name: i for i, name in enumerate(self.names.tolist())}
+        self.order = self._topological_order()
+        self.rank = np.empty(len(self.names), dtype=np.intp)
+        self.rank[self.order] = np.arange(len(self.order))
+        self._closure = {}
+
+    @classmethod
+    def from_table(cls, df):
+        """Build the graph from a frame with "Nuclide", "Half-life" and "Daughter Products" columns."""
+        names = df["Nuclide"].astype(str).tolist()
+        half_life = []
+        for value in df["Half-life"]:
+            text = str(value).strip()
+            seconds = np.inf if text.lower() == "stable" else convert_half_life_to_seconds(text)
+            half_life.append(np.nan if seconds is None else seconds)
+
+        ids = {name: i for i, name in enumerate(names)}
+        edges = []
+        for parent, products in zip(names, df["Daughter Products"]):
+            products = ast.literal_eval(products) if isinstance(products, str) and products.strip() else {}
+            for daughter, ratio in products.items():
+                # Spontaneous fission has no single daughter; a nuclide listed as its own daughter (Rh-102) is a
+                # transition within the same entry, not a decay
+                if daughter == "SF" or daughter == parent:
+                    continue
+                if daughter not in ids:
+                    ids[daughter] = len(names)
+                    names.append(daughter)
+                    half_life.append(np.inf)
+                edges.append((ids[parent], ids[daughter], float(ratio)))
+
+        edges.sort()
+        indptr = np.zeros(len(names) + 1, dtype=np.intp)
+        np.add.at(indptr, [e[0] + 1 for e in edges], 1)
+        return cls(names, half_life, np.cumsum(indptr), [e[1] for e in edges], [e[2] for e in edges])
+
+    def _topological_order(self):
+        n = len(self.names)
+        indegree = np.bincount(self.daughters, minlength=n)
+        ready = [i for i in range(n) if indegree[i] == 0]
+        order = []
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for d in self.daughters[self.indptr[node]:self.indptr[node + 1]]:
+                indegree[d] -= 1
+                if indegree[d] == 0:
+                    ready.append(d)
+        if len(order) != n:
+            raise ValueError("Decay data contains a cycle")
+        return np.asarray(order, dtype=np.intp)
+
+    def children(self, node):
+        """(daughter ids, branching ratios) of a node id."""
+        start, stop = self.indptr[node], self.indptr[node + 1]
+        return self.daughters[start:stop], self.branching[start:stop]
+
+    def _descendant_ids(self, node):
+        """All descendants of a node id in topological order, with the summed branching ratio over all paths."""
+        if node not in self._closure:
+            reach = set()
+            stack = [node]
+            while stack:
+                for d in self.children(stack.pop())[0]:
+                    if d not in reach:
+                        reach.add(d)
+                        stack.append(d)
+            ids = np.array(sorted(reach, key=self.rank.__getitem__), dtype=np.intp)
+            position = {d: k for k, d in enumerate(ids.tolist())}
+            fraction = np.zeros(len(ids))
+            for k, parent in enumerate([node] + ids.tolist()):
+                share = 1.0 if k == 0 else fraction[k - 1]
+                daughters, ratios = self.children(parent)
+                for d, r in zip(daughters.tolist(), ratios):
+                    fraction[position[d]] += share * r
+            self._closure[node] = (ids, fraction)
+        return self._closure[node]
+
+    def descendants(self, nuclide, max_half_life=None, include_stable=False):
+        """
+        Progeny of a nuclide in topological order.
+
+        Args:
+            nuclide (str): Parent nuclide.
+            max_half_life (float, optional): Only return progeny whose half-life (s) does not exceed this, as the
+                ``ignore_half_life`` setting does. The chain is still followed through the longer-lived ones.
+            include_stable (bool): Also return stable end products.
+
+        Returns:
+            tuple: (names, branching) arrays; branching is the fraction of parent decays leading to each nuclide.
+        """
+        if nuclide not in self.ids:
+            return np.array([], dtype=str), np.array([])
+        ids, fraction = self._descendant_ids(self.ids[nuclide])
+        half_life = self.half_life[ids]
+        keep = np.ones(len(ids), dtype=bool)
+        if not include_stable:
+            keep &= ~np.isinf(half_life)
+        if max_half_life is not None:
+            keep &= half_life <= max_half_life
+        return self.names[ids[keep]], fraction[keep]
+
+    def topological_order(self, nuclides=None):
+        """Node names in topological order, optionally restricted to the given nuclides and their progeny."""
+        if nuclides is None:
+            return self.names[self.order]
+        nodes = set()
+        for nuclide in nuclides:
+            if nuclide in self.ids:
+                nodes.add(self.ids[nuclide])
+                nodes.update(self._descendant_ids(self.ids[nuclide])[0].tolist())
+        return self.names[sorted(nodes, key=self.rank.__getitem__)]
+
+
+_decay_graph = None
+
+
+def load_decay_graph(path=HALF_LIFE_TABLE):
+    """Return the process-wide ``DecayGraph`` (built from the half-life table on first use)."""
+    global _decay_graph
+    if _decay_graph is None:
+        with profiler.stage('library_load'):
+            _decay_graph = DecayGraph.from_table(library_cache.read_csv(path))
+    return _decay_graph
+
+
+def verify_nuclide_index(library=None, nuclides=None):
+    """
+    Check that every table's ``NuclideIndex`` selects exactly the rows of the original regex filter.
+
+    Args:
+        library (DcfLibrary, optional): Library to check. Defaults to the process-wide library.
+        nuclides (iterable, optional): Names to look up. Defaults to every nuclide in the half-life table,
+            every alternate name in the nomenclature table and every name appearing in the DCF tables.
+
+    Returns:
+        dict: Reference name -> list of nuclide names whose index lookup differs from the regex filter.
+    """
+    library = library or load_dcf_library()
+    if nuclides is None:
+        names = set(library_cache.read_csv(HALF_LIFE_TABLE)["Nuclide"].dropna().astype(str))
+        nomenclature = library_cache.read_csv(NOMENCLATURE_TABLE)
+        for col in nomenclature.columns:
+            if col.endswith("_name"):
+                names.update(nomenclature[col].dropna().astype(str))
+        for df in library.tables.values():
+            names.update(df["Nuclide"].dropna().astype(str))
+        nuclides = sorted(names)
+
+    def outcome(lookup, *args):
+        # Names that are not valid regular expressions make the original filter raise; the index must too
+        try:
+            return lookup(*args)
+        except re.error:
+            return None
+
+    mismatches = {}
+    for name, df in library.tables.items():
+        index = library.index(name)
+        bad = []
+        for n in nuclides:
+            got = outcome(index.rows, n)
+            expected = outcome(regex_nuclide_rows, df, n, DCF_TABLE_MATCH[name])
+            if (got is None) != (expected is None) or (got is not None and not np.array_equal(got, expected)):
+                bad.append(n)
+        if bad:
+            mismatches[name] = bad
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the compiled pyHazCat DCF library.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="(Re)build the compiled DCF library and nuclide property table.")
+    build.add_argument("--library-dir", default=LIBRARY_DIR)
+    build.add_argument("--output", default=None, help="Output .npz file (default: <library-dir>/dcf_library.npz)")
+    sub.add_parser("verify", help="Check the nuclide index against the original regex filters.")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        library = build_dcf_library(args.library_dir, args.output)
+        for name, df in library.tables.items():
+            print(f"  {name}: {len(df)} rows")
+        for name, err in library.errors.items():
+            print(f"  {name}: {err}")
+        print(f"DCF library built in {time.perf_counter() - start:.2f} s")
+
+        # The property records come from HAZCAT's own nuclide lookups
+        from hazcat_class import HAZCAT
+        start = time.perf_counter()
+        hazcat = HAZCAT({'inventories': [], 'rads_list': [], 'output_filename': None})
+        path = os.path.join(args.library_dir, os.path.basename(NUCLIDE_TABLE_FILE))
+        table = write_nuclide_table(hazcat.build_nuclide_records(), path, args.library_dir)
+        print(f"Nuclide property table ({len(table)} nuclides) built in {time.perf_counter() - start:.2f} s")
+    elif args.command == "verify":
+        mismatches = verify_nuclide_index()
+        for name, bad in mismatches.items():
+            print(f"  {name}: {len(bad)} mismatches, e.g. {bad[:5]}")
+        print("Nuclide index matches the regex filters." if not mismatches else "Nuclide index MISMATCH.")
+        if mismatches:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
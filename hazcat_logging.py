@@ -0,0 +1,155 @@
+"""
+Logging of the HazCat pipeline.
+
+Every subsystem logs to its own logger below ``hazcat`` (``hazcat.dcf``, ``hazcat.hc3``, ...), so levels can be set
+per subsystem. Importing the modules configures nothing: the ``hazcat`` logger only carries a NullHandler, so an
+application's own logging configuration applies. The command-line tools and the GUIs call configure_logging, which
+by default writes the messages at INFO and above to stdout as plain text, as the print calls they replace; the
+verbose diagnostic dumps (complete screened DCF tables, regex patterns, nuclide info) are logged at DEBUG and are
+not even formatted unless DEBUG is enabled. Configure with:
+
+    configure_logging('DEBUG')                                   # everything
+    configure_logging('WARNING', levels={'classification': 'INFO'})
+    configure_logging(json_path='hazcat_log.jsonl')              # plus one JSON object per record
+
+or with the environment variable HAZCAT_LOG_LEVEL, e.g. ``HAZCAT_LOG_LEVEL=INFO,dcf=DEBUG``.
+"""
+
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+
+ROOT_LOGGER = 'hazcat'
+SUBSYSTEMS = ('library', 'dcf', 'nuclide', 'hc3', 'classification', 'session')
+LOG_LEVEL_ENV = 'HAZCAT_LOG_LEVEL'
+DEFAULT_LEVEL = 'INFO'
+
+# Attributes every LogRecord has; anything else was passed through `extra` and goes into the JSON lines
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_configured = False
+
+
+def get_logger(subsystem):
+    """Logger of a HazCat subsystem (one of SUBSYSTEMS)."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+class StdoutHandler(logging.StreamHandler):
+    """Writes to the current sys.stdout, so that contextlib.redirect_stdout captures the log as it did the prints."""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class PlainFormatter(logging.Formatter):
+    """The message alone; warnings and errors are prefixed with their level ("WARNING: ...")."""
+
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname}: {message}"
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message and the fields passed through `extra`."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def parse_levels(spec):
+    """
+    Parses a level specification such as "INFO,dcf=DEBUG,hc3=WARNING".
+
+    Returns:
+        tuple: (level of the root logger, dict of subsystem -> level)
+    """
+    level, levels = None, {}
+    for part in filter(None, (p.strip() for p in spec.split(','))):
+        if '=' in part:
+            subsystem, sub_level = (s.strip() for s in part.split('=', 1))
+            levels[subsystem] = sub_level.upper()
+        else:
+            level = part.upper()
+    return level, levels
+
+
+def configure_logging(level=None, levels=None, json_path=None, stdout=True):
+    """
+    Sets the levels and the sinks of the HazCat loggers (replacing any earlier configuration). The records are no
+    longer passed on to the handlers of the root logger.
+
+    Args:
+        level (str or int, optional): Level of every subsystem. Defaults to HAZCAT_LOG_LEVEL, then INFO.
+            A specification such as "INFO,dcf=DEBUG" also sets subsystem levels.
+        levels (dict, optional): Subsystem -> level, overriding `level`.
+        json_path (str, optional): Append every record as a JSON line to this file.
+        stdout (bool): Write the records as plain text to stdout.
+
+    Returns:
+        logging.Logger: The root HazCat logger.
+    """
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, DEFAULT_LEVEL)
+    spec_levels = {}
+    if isinstance(level, str):
+        level, spec_levels = parse_levels(level)
+    levels = {**spec_levels, **(levels or {})}
+    unknown = set(levels) - set(SUBSYSTEMS)
+    if unknown:
+        raise ValueError(f"unknown logging subsystems {sorted(unknown)}; available: {', '.join(SUBSYSTEMS)}")
+
+    global _configured
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(level or DEFAULT_LEVEL)
+    root.propagate = False
+    for subsystem in SUBSYSTEMS:
+        get_logger(subsystem).setLevel(levels.get(subsystem, logging.NOTSET))
+
+    if stdout:
+        handler = StdoutHandler()
+        handler.setFormatter(PlainFormatter())
+        root.addHandler(handler)
+    if json_path:
+        handler = logging.FileHandler(json_path)
+        handler.setFormatter(JsonLinesFormatter())
+        root.addHandler(handler)
+    if not root.handlers:
+        root.addHandler(logging.NullHandler())
+    _configured = True
+    return root
+
+
+def ensure_logging():
+    """Configures the default logging (see configure_logging) unless it was configured already in this process."""
+    if not _configured:
+        configure_logging()
+
+
+# A library does not configure logging on import; the entry points call configure_logging
+if not logging.getLogger(ROOT_LOGGER).handlers:
+    logging.getLogger(ROOT_LOGGER).addHandler(logging.NullHandler())
@@ -0,0 +1,240 @@
+"""
+Per-stage timing and profiling of the HazCat pipeline.
+
+The pipeline is instrumented with named stages (library loading, name resolution, DCF screening, HC-2, HC-3, DOE
+lookup, reporting) and counters. The process-wide ``profiler`` is disabled by default; a disabled stage is a shared
+no-op context manager, so the instrumentation costs nothing measurable. Enable it around a run:
+
+    from hazcat_profile import profiler
+    with profiler.profiling(cprofile=False, trace_memory=True):
+        HAZCAT(config).compute_hazcat_result()
+    print(profiler.summary())
+    profiler.save('profile.json')
+
+Stages nest: a stage entered inside another is recorded under the path 'outer/inner'. The profiler is meant for a
+single thread; batch workers each have their own.
+"""
+
+import contextlib
+import cProfile
+import functools
+import json
+import pstats
+import time
+import tracemalloc
+
+PROFILE_FORMAT = 1
+
+_DISABLED = contextlib.nullcontext()
+
+
+class _Stage:
+    """Context manager timing one entry of a stage."""
+    __slots__ = ('profiler', 'name', 'path', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        profiler = self.profiler
+        stack = profiler._stack
+        self.path = f"{stack[-1][0]}/{self.name}" if stack else self.name
+        if profiler._trace_memory:
+            # The peak of the enclosing stage so far is kept before the peak is reset for this one
+            peak = tracemalloc.get_traced_memory()[1]
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        if self.path not in profiler.stages:
+            # Registered on entry, so that stages are listed in the order they are first entered
+            profiler.stages[self.path] = {'calls': 0, 'total_s': 0.0, 'min_s': float('inf'), 'max_s': 0.0,
+                                          'peak_bytes': None}
+        stack.append([self.path, 0])
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        profiler = self.profiler
+        _, peak = profiler._stack.pop()
+        if profiler._trace_memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            if profiler._stack:
+                profiler._stack[-1][1] = max(profiler._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        else:
+            peak = None
+        profiler._record(self.path, seconds, peak)
+        return False
+
+
+class Profiler:
+    """
+    Stage timers and counters, with optional cProfile and tracemalloc capture.
+
+    Attributes:
+        enabled (bool): Whether stages and counters are recorded.
+        stages (dict): Stage path -> {'calls', 'total_s', 'min_s', 'max_s', 'peak_bytes'}.
+        counters (dict): Counter name -> count.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stages = {}
+        self.counters = {}
+        self._stack = []
+        self._trace_memory = False
+        self._started_tracemalloc = False
+        self._cprofile = None
+        self._cprofile_stats = None
+        self._start = None
+        self._elapsed = 0.0
+
+    def stage(self, name):
+        """
+        Context manager timing the enclosed block as stage `name` (a no-op while disabled).
+        """
+        if not self.enabled:
+            return _DISABLED
+        return _Stage(self, name)
+
+    def count(self, name, n=1):
+        """Adds `n` to counter `name` (a no-op while disabled)."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def _record(self, path, seconds, peak):
+        entry = self.stages[path]
+        entry['calls'] += 1
+        entry['total_s'] += seconds
+        entry['min_s'] = min(entry['min_s'], seconds)
+        entry['max_s'] = max(entry['max_s'], seconds)
+        if peak is not None:
+            entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak)
+
+    def enable(self, cprofile=False, trace_memory=False):
+        """
+        Starts recording.
+
+        Args:
+            cprofile (bool): Also run cProfile until disable (function-level times in the summary and JSON).
+            trace_memory (bool): Record the peak traced memory of every stage (tracemalloc; slows the run down).
+        """
+        if self.enabled:
+            return
+        self._trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._start = time.perf_counter()
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording; the recorded stages and counters are kept until reset."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._elapsed += time.perf_counter() - self._start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile_stats = pstats.Stats(self._cprofile)
+            self._cprofile = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._trace_memory = False
+
+    @contextlib.contextmanager
+    def profiling(self, cprofile=False, trace_memory=False):
+        """Records the enclosed block (after a reset); see enable."""
+        self.reset()
+        self.enable(cprofile=cprofile, trace_memory=trace_memory)
+        try:
+            yield self
+        finally:
+            self.disable()
+
+    def reset(self):
+        self.stages = {}
+        self.counters = {}
+        self._stack = []
+        self._cprofile_stats = None
+        self._elapsed = 0.0
+
+    def functions(self, limit=25):
+        """
+        Functions with the largest cumulative time of the cProfile capture.
+
+        Returns:
+            list: [{'function', 'calls', 'total_s', 'cumulative_s'}, ...], empty without a cProfile capture.
+        """
+        if self._cprofile_stats is None:
+            return []
+        rows = []
+        for (file_name, line, name), (_, calls, tottime, cumtime, _) in self._cprofile_stats.stats.items():
+            rows.append({'function': f"{file_name}:{line}({name})", 'calls': calls, 'total_s': tottime,
+                         'cumulative_s': cumtime})
+        rows.sort(key=lambda row: row['cumulative_s'], reverse=True)
+        return rows[:limit]
+
+    def to_dict(self):
+        """The recorded stages, counters and cProfile functions (JSON-serializable)."""
+        return {
+            'format': PROFILE_FORMAT,
+            'elapsed_s': self._elapsed,
+            'stages': {path: dict(entry) for path, entry in self.stages.items() if entry['calls']},
+            'counters': dict(self.counters),
+            'functions': self.functions(),
+        }
+
+    def save(self, path):
+        """Writes to_dict() as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self, functions=15):
+        """Table of the stages (in order of first entry), the counters and the top cProfile functions."""
+        elapsed = self._elapsed or float('nan')
+        lines = [f"{'Stage':<44}{'Calls':>7}{'Total (s)':>11}{'Mean (ms)':>11}{'Share':>8}{'Peak (MB)':>11}"]
+        for path, entry in self.stages.items():
+            if not entry['calls']:
+                continue
+            depth = path.count('/')
+            label = "  " * depth + path.rsplit('/', 1)[-1]
+            peak = '' if entry['peak_bytes'] is None else f"{entry['peak_bytes'] / 2 ** 20:.1f}"
+            lines.append(f"{label:<44}{entry['calls']:>7}{entry['total_s']:>11.4f}"
+                         f"{1e3 * entry['total_s'] / entry['calls']:>11.3f}"
+                         f"{entry['total_s'] / elapsed:>8.1%}{peak:>11}")
+        lines.append(f"{'Elapsed':<44}{'':>7}{self._elapsed:>11.4f}")
+        if self.counters:
+            lines.append("Counters: " + ", ".join(f"{name}={n}" for name, n in self.counters.items()))
+        top = self.functions(functions)
+        if top:
+            lines.append(f"{'Function':<80}{'Calls':>9}{'Own (s)':>10}{'Cum. (s)':>10}")
+            for row in top:
+                lines.append(f"{row['function'][-80:]:<80}{row['calls']:>9}{row['total_s']:>10.4f}"
+                             f"{row['cumulative_s']:>10.4f}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"Profiler(enabled={self.enabled}, stages={len(self.stages)}, counters={len(self.counters)})"
+
+
+profiler = Profiler()
+
+
+def profiled(name):
+    """Decorator timing every call of a function as stage `name` of the process-wide profiler."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            with _Stage(profiler, name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,203 @@
+"""
+Results of a HazCat run and the reports written from them.
+
+HAZCAT.compute_hazcat_result returns a HazcatResult holding every per-radionuclide quantity as a column; the text
+report and the CSV are both generated from it.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from hazcat_kernels import HC3_PATHWAYS, HC3Pathways
+from hazcat_profile import profiled
+
+# Copyright and Acknowledgment
+COPYRIGHT = "Copyright (c) 2024 Bhabha Atomic Research Centre, Mumbai, India"
+ACKNOWLEDGMENT = "This code is developed by Dr. Biswajit Sadhu, RS & ESS, HPD and supervised by Dr. S. Anand, Head, RS & ESS, HPD."
+
+
+@dataclass
+class HazcatResult:
+    """
+    Threshold quantities and hazard categorization of a list of radionuclides.
+
+    Attributes:
+        rads_list (list): Radionuclide names.
+        inventories (np.ndarray): Inventories (Ci).
+        half_lives, aws, Rs_HC2, Rs_HC3, BVs, E1s (list): Input data per radionuclide, as used in the computation.
+        dcfs (dict): DCF dictionaries per radionuclide (see HAZCAT.compute_max_dcf_batch).
+        tq_hc2_curie, tq_hc2_gram (np.ndarray): HazCat HC-2 threshold quantities.
+        hc3 (HC3Pathways): HazCat HC-3 threshold quantities of every pathway.
+        doe_hc2_curie, doe_hc2_gram, doe_hc3_curie, doe_hc3_gram (np.ndarray): DOE-STD-1027-2018 threshold quantities.
+        doe_pathway (np.ndarray): DOE-STD-1027-2018 limiting pathway.
+        classification (np.ndarray): Hazard category of every radionuclide from the DOE thresholds.
+        classification_notes (list): Text explaining each classification.
+        dcf_provenance (list): Source table of every DCF used.
+        sor_doe, sor_hazcat (tuple or None): (SOR HC-2, SOR HC-3, text) from the DOE and HazCat thresholds, for
+            inventories of more than one radionuclide.
+    """
+    rads_list: list
+    inventories: np.ndarray
+    half_lives: list
+    aws: list
+    Rs_HC2: list
+    Rs_HC3: list
+    BVs: list
+    E1s: list
+    dcfs: dict
+    tq_hc2_curie: np.ndarray
+    tq_hc2_gram: np.ndarray
+    hc3: HC3Pathways
+    doe_hc2_curie: np.ndarray
+    doe_hc2_gram: np.ndarray
+    doe_hc3_curie: np.ndarray
+    doe_hc3_gram: np.ndarray
+    doe_pathway: np.ndarray
+    classification: np.ndarray
+    classification_notes: list
+    dcf_provenance: list = field(default_factory=list)
+    sor_doe: tuple = None
+    sor_hazcat: tuple = None
+
+    @property
+    def tq_hc3_curie(self):
+        return self.hc3.tq_hc3_curie
+
+    @property
+    def tq_hc3_gram(self):
+        return self.hc3.tq_hc3_gram
+
+    @property
+    def dominant_pathway(self):
+        """Name of the HazCat limiting HC-3 pathway of every radionuclide."""
+        return np.asarray(HC3_PATHWAYS)[self.hc3.dominant]
+
+
+def nuclide_report_text(result):
+    """
+    Per-radionuclide section of the HazCat text report: input data and computed threshold quantities.
+    """
+    output_text = ""
+    pathway_texts = result.hc3.pathway_texts()
+    for i, isotope in enumerate(result.rads_list):
+        dcfs = result.dcfs[isotope]
+        output_text += f"Radionuclide: {isotope}\n"
+        output_text += f"  Half life (second): {result.half_lives[i]}\n"
+        output_text += f"  HC2: Inhalation dose conversion factor (Public) (Sv/Bq): {dcfs['max_dcf_inh_hc2']}\n"
+        output_text += f"  HC3: Inhalation dose conversion factor (Worker) (Sv/Bq): {dcfs['max_dcf_inh_hc3']}\n"
+        output_text += f"  HC2: Air Submersion Dose Coefficient (Sv/sec per Bq/m3): {dcfs['max_dcf_sub_hc2']}\n"
+        output_text += f"  HC3: Ingestion dose coefficient [Sv/Bq]: {dcfs['max_dcf_ing_hc3']}\n"
+        output_text += f"  Atomic Weight: {result.aws[i]}\n"
+        output_text += f"  Release fraction for computing Threshold for HC2: {result.Rs_HC2[i]}\n"
+        output_text += f"  Release fraction for computing Threshold for HC3: {result.Rs_HC3[i]}\n"
+        output_text += f"  Soil to Plant Concentration Factor: {result.BVs[i]}\n"
+        output_text += f"  Sum of the products of the photon energies and the photon fraction or intensities [MeV]: {result.E1s[i]}\n"
+        output_text += f"  Threshold quantity for HC2 (Curie): {result.tq_hc2_curie[i]}\n"
+        output_text += f"  Threshold quantity for HC2 (Gram): {result.tq_hc2_gram[i]}\n"
+        output_text += f"  Threshold quantity across all pathways for HC3 (Curie): {pathway_texts[i]}\n"
+        output_text += f"  Threshold quantity for HC3 (Curie): {result.tq_hc3_curie[i]}\n"
+        output_text += f"  Threshold quantity for HC3 (Gram): {result.tq_hc3_gram[i]}\n\n"
+    return output_text
+
+
+def write_text_report(result, output_file):
+    """
+    Writes the classification notes, the per-radionuclide section and the sum-of-ratio summaries to an open file.
+    """
+    for notes in result.classification_notes:
+        output_file.write(notes)
+    output_file.write(nuclide_report_text(result))
+    for sor in (result.sor_doe, result.sor_hazcat):
+        if sor is not None:
+            output_file.write(sor[2])
+
+
+def write_hazcat_logo(f):
+    
+    letters = {
+                'A': [' *** ', '*   *', '*****', '*   *', '*   *'],
+                'B': ['**** ', '*   *', '**** ', '*   *', '**** '],
+                'C': [' ****', '*    ', '*    ', '*    ', ' ****'],
+                'D': ['**** ', '*   *', '*   *', '*   *', '**** '],
+                'E': ['*****', '*    ', '*****', '*    ', '*****'],
+                'F': ['*****', '*    ', '***  ', '*    ', '*    '],
+                'G': [' ****', '*    ', '*  **', '*   *', ' ****'],
+                'H': ['*   *', '*   *', '*****', '*   *', '*   *'],
+                'I': ['*****', '  *  ', '  *  ', '  *  ', '*****'],
+                'J': ['*****', '    *', '    *', '*   *', ' *** '],
+                'K': ['*   *', '*  * ', '**   ', '*  * ', '*   *'],
+                'L': ['*    ', '*    ', '*    ', '*    ', '*****'],
+                'M': ['*   *', '** **', '* * *', '*   *', '*   *'],
+                'N': ['*   *', '**  *', '* * *', '*  **', '*   *'],
+                'O': [' *** ', '*   *', '*   *', '*   *', ' *** '],
+                'P': ['**** ', '*   *', '**** ', '*    ', '*    '],
+                'Q': [' *** ', '*   *', '*   *', '*  **', ' ** *'],
+                'R': ['**** ', '*   *', '**** ', '*  * ', '*   *'],
+                'S': [' ****', '*    ', '**** ', '    *', '**** '],
+                'T': ['*****', '  *  ', '  *  ', '  *  ', '  *  '],
+                'U': ['*   *', '*   *', '*   *', '*   *', ' *** '],
+                'V': ['*   *', '*   *', '*   *', ' * * ', '  *  '],
+                'W': ['*   *', '*   *', '* * *', '** **', '*   *'],
+                'X': ['*   *', ' * * ', '  *  ', ' * * ', '*   *'],
+                'Y': ['*   *', ' * * ', '  *  ', '  *  ', '  *  '],
+                'Z': ['*****', '   * ', '  *  ', ' *   ', '*****'],
+            }
+
+    string = "HazCat"
+    f.write('\n')
+    f.write(
+        '###############################################################################################################################\n')
+    # f.write('\n')
+    for i in range(5):
+        for word in range(len(string)):
+            current_word = string[word].upper()
+            if word == len(string) - 1:
+                print(letters[current_word][i], file=f)
+
+            else:
+                print(letters[current_word][i], end='  ', file=f)
+    f.write(
+        '###############################################################################################################################\n')
+
+
+@profiled('reporting')
+def write_report_file(result, filename):
+    """
+    Writes the complete HazCat text report (logo, acknowledgement and results) to `filename`.
+    """
+    with open(filename, "w") as output_file:
+        write_hazcat_logo(output_file)
+        output_file.write(f"{COPYRIGHT}\n\n{ACKNOWLEDGMENT}\n\n")
+        write_text_report(result, output_file)
+
+
+def result_frame(result):
+    """
+    The HazCat CSV table: TQs with the DOE reference value in parentheses, the TQ of every HC-3 pathway (NaN where
+    the pathway does not apply), the dominant pathway and the DCF provenance.
+    """
+    def format_with_doe(values, doe_values):
+        return [f"{value:.4e} ({doe_value:.4e})" for value, doe_value in zip(values, doe_values)]
+
+    df = pd.DataFrame({
+        "Radionuclide": result.rads_list,
+        "TQ HC-3 (Ci)": format_with_doe(result.tq_hc3_curie, result.doe_hc3_curie),
+        "TQ HC-3 (Gram)": format_with_doe(result.tq_hc3_gram, result.doe_hc3_gram),
+        "TQ HC-2 (Ci)": format_with_doe(result.tq_hc2_curie, result.doe_hc2_curie),
+        "TQ HC-2 (Gram)": format_with_doe(result.tq_hc2_gram, result.doe_hc2_gram),
+    })
+    pathways = np.where(np.isinf(result.hc3.tq_curie), np.nan, result.hc3.tq_curie)
+    for ndx, name in enumerate(HC3_PATHWAYS):
+        df[name] = pathways[:, ndx]
+    # The CSV has always named the dominant pathway by its first word ('Food', 'Direct', ...)
+    df["Dominant Pathway"] = [f"{dom.split()[0]} ({doe})" for dom, doe in zip(result.dominant_pathway,
+                                                                                result.doe_pathway)]
+    df["DCF Provenance"] = result.dcf_provenance
+    return df
+
+
+@profiled('reporting')
+def write_csv(result, path):
+    result_frame(result).to_csv(path, index=False)
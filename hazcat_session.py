@@ -0,0 +1,309 @@
+"""
+Inventory what-if sessions.
+
+The threshold quantities of a radionuclide set do not depend on the inventories; only the classification and the
+sums of ratios do. A HazcatSession computes (or takes from the result cache) the threshold quantities once and then
+applies any number of inventories to them without touching the library:
+
+    session = HazcatSession.from_config(config)
+    result = session.apply([120.0, 3.5e4])
+    sor = session.sum_of_ratios(inventory_matrix)   # one row per inventory scenario
+    timeline = session.decay_timeline(inventories, times, t0='2025-01-01')
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from hazcat_kernels import sum_of_ratios, sum_of_ratio_category, decay_constants, decay_inventories
+from hazcat_cache import compute_hazcat_result_cached, normalize_config, result_cache
+from hazcat_logging import get_logger
+
+log = get_logger('session')
+
+
+class HazcatSession:
+    """
+    Threshold quantities of a fixed list of radionuclides, to which inventories are applied.
+
+    Args:
+        result (HazcatResult): A result of the radionuclides (any inventory); its threshold quantities are reused.
+    """
+
+    def __init__(self, result):
+        from hazcat_class import HAZCAT
+
+        self.result = result
+        self.rads_list = list(result.rads_list)
+        self._hazcat = HAZCAT({'inventories': list(result.inventories), 'rads_list': self.rads_list,
+                               'output_filename': None})
+        self._inputs = None
+
+    @classmethod
+    def from_config(cls, config, cache=result_cache):
+        """
+        Session of the radionuclides, release fractions and options of a config.
+
+        Args:
+            config (dict): HazCat config (your_input.json schema); 'inventories' may be omitted.
+            cache (ResultCache, optional): Cache used for the threshold quantities; None computes them.
+        """
+        if config.get('inventories') is None:
+            config = {**config, 'inventories': [0.0] * len(config['rads_list'])}
+        return cls(compute_hazcat_result_cached(config, cache=cache))
+
+    def apply(self, inventories, verbose=False):
+        """
+        HazcatResult of the session radionuclides with `inventories` (Ci, in the order of rads_list).
+
+        Args:
+            verbose (bool): Print the sum-of-ratio categorizations.
+
+        Raises:
+            ValueError: If the number of inventories differs from the number of radionuclides.
+        """
+        return self._hazcat.classify_inventories(self.result, inventories, verbose=verbose)
+
+    def sum_of_ratios(self, inventory_matrix):
+        """
+        Sums of ratios and hazard categories of many inventory scenarios, against both the DOE-STD-1027-2018 and
+        the HazCat computed threshold quantities.
+
+        Args:
+            inventory_matrix (np.ndarray): Inventories (Ci) of shape (S scenarios, N radionuclides of rads_list).
+
+        Returns:
+            pd.DataFrame: One row per scenario with the columns 'SOR HC-2 (DOE)', 'SOR HC-3 (DOE)', 'Category (DOE)',
+            'SOR HC-2 (HazCat)', 'SOR HC-3 (HazCat)' and 'Category (HazCat)'.
+
+        Raises:
+            ValueError: If the inventory matrix does not have one column per radionuclide.
+        """
+        inventory_matrix = np.atleast_2d(np.asarray(inventory_matrix, dtype=np.float64))
+        if inventory_matrix.ndim != 2 or inventory_matrix.shape[1] != len(self.rads_list):
+            raise ValueError(f"inventory matrix of shape {inventory_matrix.shape} given for "
+                             f"{len(self.rads_list)} radionuclides")
+        return sum_of_ratio_frame(inventory_matrix, self.thresholds())
+
+    def threshold_quantity_inputs(self):
+        """Nominal inputs of the threshold quantity kernels (see HAZCAT.threshold_quantity_inputs)."""
+        if self._inputs is None:
+            self._inputs = self._hazcat.threshold_quantity_inputs(self.result)
+        return self._inputs
+
+    def thresholds(self):
+        """
+        Returns:
+            dict: 'DOE' and 'HazCat' -> (HC-2 TQs, HC-3 TQs) in Ci, in the order of rads_list.
+        """
+        return {'DOE': (self.result.doe_hc2_curie, self.result.doe_hc3_curie),
+                'HazCat': (self.result.tq_hc2_curie, self.result.tq_hc3_curie)}
+
+    def decay_timeline(self, inventories, times, t0=None, progeny=False):
+        """
+        Sums of ratios and hazard categories of a decaying inventory over a time grid.
+
+        Every radionuclide decays with the decay constant of its half-life (unknown half-lives do not decay).
+        With `progeny`, the Bateman solution of the decay chains is used instead and the ingrown progeny count
+        towards the sums with their own threshold quantities; progeny without a DOE-STD-1027-2018 threshold are
+        left out of the DOE sums.
+
+        Args:
+            inventories (list): Inventories (Ci) of rads_list at t0.
+            times (array-like): Times after t0 (s), in increasing order.
+            t0 (str or datetime, optional): Date of the inventory; adds the dates to the timeline.
+            progeny (bool): Include the ingrowth of progeny.
+
+        Returns:
+            DecayTimeline: The timeline and the time at which the facility drops below HC-3.
+        """
+        inventories = np.asarray(inventories, dtype=np.float64)
+        if inventories.shape != (len(self.rads_list),):
+            raise ValueError(f"{inventories.size} inventories given for {len(self.rads_list)} radionuclides")
+        times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        if np.any(np.diff(times) < 0):
+            raise ValueError("times must be in increasing order")
+
+        nuclides = list(self.rads_list)
+        thresholds = self.thresholds()
+        lam = decay_constants(self.result.half_lives)
+        if not progeny:
+            inventory_matrix = decay_inventories(inventories, lam, times)
+        else:
+            nodes, activities = self._hazcat.progeny_activities(times, self.rads_list)
+            nodes = nodes.tolist()
+            # Parents outside the decay graph (unknown or stable) have no chain and only decay
+            in_chain = activities.any(axis=(1, 2))
+            progeny_names = [node for node in nodes if node not in nuclides]
+            nuclides += progeny_names
+            if progeny_names:
+                thresholds = self._progeny_thresholds(progeny_names, thresholds)
+
+            inventory_matrix = np.zeros((len(times), len(nuclides)))
+            inventory_matrix[:, :len(self.rads_list)] = decay_inventories(
+                np.where(in_chain, 0.0, inventories), lam, times)
+            columns = [nuclides.index(node) for node in nodes]
+            inventory_matrix[:, columns] += np.einsum('p,pmt->tm', np.where(in_chain, inventories, 0.0),
+                                                      activities)
+
+        frame = sum_of_ratio_frame(inventory_matrix, thresholds)
+        frame.insert(0, 'Time (s)', times)
+        if t0 is not None:
+            t0 = pd.Timestamp(t0)
+            frame.insert(1, 'Date', t0 + pd.to_timedelta(times, unit='s'))
+        below_hc3 = {label: below_hc3_time(times, frame[f'SOR HC-3 ({label})'].to_numpy(),
+                                           frame[f'Category ({label})'].to_numpy())
+                     for label in thresholds}
+        return DecayTimeline(frame=frame, nuclides=nuclides, inventories=inventory_matrix, t0=t0,
+                             below_hc3=below_hc3)
+
+    def _progeny_thresholds(self, progeny_names, thresholds):
+        """Thresholds of the session extended by those of ingrown progeny (default release fractions)."""
+        progeny_result = HazcatSession.from_config({'rads_list': progeny_names, 'output_filename': None}).result
+        missing = [name for name, tq in zip(progeny_names, progeny_result.doe_hc3_curie) if np.isnan(tq)]
+        if missing:
+            log.info("NOTE: no DOE-STD-1027-2018 threshold for the progeny %s; they are left out of the DOE sums "
+                     "of ratios", ', '.join(missing), extra={'nuclides': missing})
+
+        def extend(values, extra):
+            return np.concatenate([np.asarray(values, dtype=np.float64),
+                                   np.where(np.isnan(extra), np.inf, extra)])
+
+        progeny = HazcatSession(progeny_result).thresholds()
+        return {label: (extend(hc2, progeny[label][0]), extend(hc3, progeny[label][1]))
+                for label, (hc2, hc3) in thresholds.items()}
+
+    def __repr__(self):
+        return f"HazcatSession({len(self.rads_list)} radionuclides)"
+
+
+@dataclass
+class DecayTimeline:
+    """
+    Hazard categorization of a decaying inventory over time (see HazcatSession.decay_timeline).
+
+    Attributes:
+        frame (pd.DataFrame): One row per time point: 'Time (s)', 'Date' (with t0) and the columns of
+            HazcatSession.sum_of_ratios.
+        nuclides (list): The session radionuclides followed by the ingrown progeny.
+        inventories (np.ndarray): Inventories (Ci) of shape (time points, nuclides).
+        t0 (pd.Timestamp or None): Date of the initial inventory.
+        below_hc3 (dict): 'DOE' and 'HazCat' -> time after t0 (s) from which the facility stays BELOW HC-3
+            (0 if it already is at t0), or None if it does not get there within the time grid.
+    """
+    frame: pd.DataFrame
+    nuclides: list
+    inventories: np.ndarray
+    t0: pd.Timestamp
+    below_hc3: dict
+
+    def below_hc3_date(self, label='HazCat'):
+        """Date from which the facility stays BELOW HC-3 by the `label` ('DOE' or 'HazCat') thresholds, or None."""
+        seconds = self.below_hc3[label]
+        if seconds is None or self.t0 is None:
+            return None
+        return self.t0 + pd.Timedelta(seconds=seconds)
+
+
+def sum_of_ratio_frame(inventory_matrix, thresholds):
+    """
+    Sums of ratios and categories of an (S, N) inventory matrix for every threshold set of `thresholds`
+    ({label: (HC-2 TQs, HC-3 TQs)}), as a DataFrame with one row per scenario.
+    """
+    columns = {}
+    for label, (hc2_curie, hc3_curie) in thresholds.items():
+        sor_hc2, sor_hc3 = sum_of_ratios(inventory_matrix, hc2_curie, hc3_curie)
+        columns[f'SOR HC-2 ({label})'] = sor_hc2
+        columns[f'SOR HC-3 ({label})'] = sor_hc3
+        columns[f'Category ({label})'] = sum_of_ratio_category(sor_hc2, sor_hc3)
+    return pd.DataFrame(columns)
+
+
+def below_hc3_time(times, sor_hc3, category):
+    """
+    Time from which `category` stays BELOW HC-3, interpolated between the grid points on log(SOR HC-3).
+
+    Returns:
+        float or None: times[0] if below from the start, None if still not below at the end of the grid.
+    """
+    not_below = np.flatnonzero(category != 'BELOW HC-3')
+    if not_below.size == 0:
+        return float(times[0])
+    k = not_below[-1]
+    if k == len(times) - 1:
+        return None
+    before, after = np.log(sor_hc3[k]), np.log(sor_hc3[k + 1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = before / (before - after)
+    if not np.isfinite(fraction):
+        fraction = 1.0
+    return float(times[k] + np.clip(fraction, 0.0, 1.0) * (times[k + 1] - times[k]))
+
+
+def session_key(config):
+    """The fields of a config that determine the threshold quantities (everything but the inventories)."""
+    key = normalize_config(config)
+    del key['inventories']
+    return repr(sorted(key.items()))
+
+
+class SessionCache:
+    """
+    The HazcatSessions of the configs run in this process, least recently used evicted first.
+
+    Args:
+        max_entries (int): Maximum number of sessions kept. Defaults to 64.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._sessions = OrderedDict()
+
+    def get(self, key):
+        """The session stored under `key` (marked as recently used), or None."""
+        session = self._sessions.get(key)
+        if session is not None:
+            self._sessions.move_to_end(key)
+        return session
+
+    def put(self, key, session):
+        self._sessions[key] = session
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_entries:
+            self._sessions.popitem(last=False)
+
+    def clear(self):
+        self._sessions.clear()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __repr__(self):
+        return f"SessionCache(entries={len(self._sessions)}, max_entries={self.max_entries})"
+
+
+session_cache = SessionCache()
+
+
+def session_result(config, cache=result_cache, sessions=session_cache):
+    """
+    HazcatResult of a config, reusing the threshold quantities of any recent config of this process with the same
+    radionuclides, release fractions and options: only the classification and the sums of ratios are recomputed.
+
+    Args:
+        config (dict): HazCat config (your_input.json schema).
+        cache (ResultCache, optional): Cache used when the threshold quantities are not known yet.
+        sessions (SessionCache): Sessions of the earlier configs.
+
+    Returns:
+        HazcatResult: The result.
+    """
+    key = session_key(config)
+    session = sessions.get(key)
+    if session is None:
+        result = compute_hazcat_result_cached(config, cache=cache)
+        sessions.put(key, HazcatSession(result))
+        return result
+    return session.apply(config['inventories'], verbose=True)
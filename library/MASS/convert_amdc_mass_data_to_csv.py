@@ -1,13 +1,23 @@
+import argparse
+import os
+
+import numpy as np
 import pandas as pd
 import re
 
-def convert_mass_data_to_csv(txt_file_path, csv_file_path):
+MASS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_mass_data(txt_file_path):
     """
-    Reads a nuclear mass data file, processes it, and saves it as a CSV.
+    Reads a nuclear mass data file (AME "massround" format) and returns its rows as a DataFrame.
 
     Parameters:
         txt_file_path (str): Path to the input .txt file.
-        csv_file_path (str): Path to the output .csv file.
+
+    Returns:
+        DataFrame: Columns Nuclide, N, Z, A, El, Atomic Mass (the historical "1.008664.9159" string)
+        and Mass (u) (the same value parsed as float64, e.g. 1.0086649159).
     """
     # Read the text file
     with open(txt_file_path, "r") as file:
@@ -17,7 +27,7 @@ def convert_mass_data_to_csv(txt_file_path, csv_file_path):
     data_lines = [line.strip() for line in lines if line.strip() and not line.startswith("1")]
 
     # Define column headers
-    columns = ['Nuclide', 'N', 'Z', 'A', 'El', 'Atomic Mass']
+    columns = ['Nuclide', 'N', 'Z', 'A', 'El', 'Atomic Mass', 'Mass (u)']
 
     processed_data = []
 
@@ -44,27 +54,68 @@ def convert_mass_data_to_csv(txt_file_path, csv_file_path):
         else:
             continue  # Skip rows that don't fit expected format
 
-        # Merge atomic mass values
+        # Merge atomic mass values: integer part (u) and the remainder in micro-u
         atomic_mass_combined = f"{parts[-3]}.{parts[-2]}"
+        mass_u = int(parts[-3]) + float(parts[-2]) * 1e-6
 
         # Generate Nuclide identifier: "El-A" (e.g., Cs-137)
         nuclide = f"{El}-{A}"
 
         # Append row to processed data
-        row = [nuclide, N, Z, A, El, atomic_mass_combined]
+        row = [nuclide, N, Z, A, El, atomic_mass_combined, mass_u]
         processed_data.append(row)
 
     # Convert to DataFrame
-    df = pd.DataFrame(processed_data, columns=columns)
+    return pd.DataFrame(processed_data, columns=columns)
+
+
+def convert_mass_data_to_csv(txt_file_path, csv_file_path):
+    """
+    Reads a nuclear mass data file, processes it, and saves it as a CSV.
+
+    Parameters:
+        txt_file_path (str): Path to the input .txt file.
+        csv_file_path (str): Path to the output .csv file.
+    """
+    df = parse_mass_data(txt_file_path)
 
-    # Save as CSV
-    df.to_csv(csv_file_path, index=False)
+    # Save as CSV (keeping the historical column layout)
+    df.drop(columns=['Mass (u)']).to_csv(csv_file_path, index=False)
 
     print(f"Data successfully saved to {csv_file_path}")
+    return df
+
+
+def write_mass_array(df, npz_file_path):
+    """
+    Saves the masses as typed arrays sorted by (Z, A, isomer), for binary-search lookups.
+
+    The AME table lists ground states only, so the isomer flag is always 0; it is part of the
+    key so that isomeric states can be added without changing the layout.
+
+    Parameters:
+        df (DataFrame): Output of parse_mass_data.
+        npz_file_path (str): Path to the output .npz file.
+    """
+    z = df['Z'].to_numpy(dtype=np.int32)
+    a = df['A'].to_numpy(dtype=np.int32)
+    isomer = np.zeros(len(df), dtype=np.int8)
+    order = np.lexsort((isomer, a, z))
+
+    np.savez(npz_file_path,
+             z=z[order], a=a[order], isomer=isomer[order],
+             mass=df['Mass (u)'].to_numpy(dtype=np.float64)[order],
+             symbol=df['El'].to_numpy(dtype=str)[order])
+
+    print(f"Data successfully saved to {npz_file_path}")
 
-# Example usage:
-txt_file_path = "/home/biswajit/Documents/HAZCAT_CODE/HazCat/pyHazCat/library/MASS/massround.mas20.txt"
-csv_file_path = "massround_data_final.csv"
 
-convert_mass_data_to_csv(txt_file_path, csv_file_path)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert the AME mass table to pyHazCat library files.")
+    parser.add_argument("--input", default=os.path.join(MASS_DIR, "massround.mas20.txt"))
+    parser.add_argument("--csv", default=os.path.join(MASS_DIR, "massround_data_final.csv"))
+    parser.add_argument("--npz", default=os.path.join(MASS_DIR, "massround_data_final.npz"))
+    args = parser.parse_args()
 
+    mass_df = convert_mass_data_to_csv(args.input, args.csv)
+    write_mass_array(mass_df, args.npz)
@@ -0,0 +1,414 @@
+"""
+Command-line entry point for running HazCat without a GUI.
+
+    python -m pyhazcat run config.json [config2.json ...]
+    python -m pyhazcat batch config_dir/ [--workers N]
+    python -m pyhazcat warm [nuclide ...]
+    python -m pyhazcat decay config.json [--years 10] [--t0 2025-01-01] [--progeny]
+    python -m pyhazcat uncertainty config.json distributions.json [--samples 100000]
+    python -m pyhazcat sensitivity config.json ranges.json [--method sobol|morris]
+
+Each config uses the schema of the `your_input.json` file written by the GUIs (rads_list, inventories, Rs_HC2, Rs_HC3,
+consider_progeny, ignore_half_life, output_filename). For every config the text report and the CSV are written next
+to the config (or to --output-dir): the text report to `output_filename` (default `<config name>_hazcat_out.txt`)
+and the CSV to the same name with a .csv extension.
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+
+CONFIG_DEFAULTS = {
+    'consider_progeny': False,
+    'ignore_half_life': None,
+    'Rs_HC2': None,
+    'Rs_HC3': None,
+    'output_filename': None,
+}
+
+
+def load_config(path):
+    """
+    Reads a HazCat config JSON and fills in the optional fields.
+
+    Raises:
+        ValueError: If rads_list or inventories are missing or of different lengths.
+    """
+    with open(path) as f:
+        config = {**CONFIG_DEFAULTS, **json.load(f)}
+    for key in ('rads_list', 'inventories'):
+        if not isinstance(config.get(key), list):
+            raise ValueError(f"{path}: '{key}' must be a list")
+    if len(config['rads_list']) != len(config['inventories']):
+        raise ValueError(f"{path}: 'rads_list' and 'inventories' have different lengths")
+    for key in ('Rs_HC2', 'Rs_HC3'):
+        if config[key] is not None and len(config[key]) != len(config['rads_list']):
+            raise ValueError(f"{path}: '{key}' must be null or have one value per radionuclide")
+    return config
+
+
+def output_paths(config_path, config, output_dir=None):
+    """
+    Absolute paths of the text report and the CSV of a config.
+    """
+    output_dir = output_dir or os.path.dirname(os.path.abspath(config_path))
+    name = config.get('output_filename') or \
+        os.path.splitext(os.path.basename(config_path))[0] + '_hazcat_out.txt'
+    text_path = os.path.abspath(os.path.join(output_dir, name))
+    return text_path, os.path.splitext(text_path)[0] + '.csv'
+
+
+def run_config(config, text_path, csv_path, use_cache=True):
+    """
+    Runs the full HazCat pipeline for one config and writes its reports.
+
+    Args:
+        use_cache (bool): Reuse a stored result of an identical config and library (see hazcat_cache), the
+            threshold quantities of earlier configs of the same radionuclides (see hazcat_session) and the memoized
+            inputs of every nuclide. False recomputes everything.
+
+    Returns:
+        HazcatResult: The computed result.
+    """
+    from hazcat_cache import compute_hazcat_result_cached, result_cache
+    from hazcat_report import write_report_file, write_csv
+    from hazcat_session import session_result
+
+    if use_cache:
+        result = session_result(config)
+    else:
+        result = compute_hazcat_result_cached(config, cache=None, use_memo=False)
+    write_report_file(result, text_path)
+    write_csv(result, csv_path)
+    return result
+
+
+def warm_library():
+    """
+    Loads the process-wide library data (DCF store, nuclide table, masses, decay graph, DOE workbook sheets).
+
+    Used as the initializer of batch workers, so that every worker pays the loading cost once instead of per config.
+    A worker started without fork also sets up the logging from HAZCAT_LOG_LEVEL.
+    """
+    from hazcat_logging import ensure_logging
+    ensure_logging()
+
+    from hazcat_class import HAZCAT
+    from hazcat_library import (library_cache, load_dcf_library, load_nuclide_table, load_mass_table,
+                                load_decay_graph, DOE_TQ_WORKBOOK)
+
+    hazcat = HAZCAT({'inventories': [], 'rads_list': [], 'output_filename': None})
+    load_dcf_library()
+    load_nuclide_table(hazcat.build_nuclide_records)
+    load_mass_table()
+    load_decay_graph()
+    for sheet_name in ('thresholds', 'r_bv'):
+        library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name=sheet_name)
+    from hazcat_cache import nuclide_memo
+    nuclide_memo.records
+
+
+def run_job(config_path, output_dir=None, quiet=False, use_cache=True):
+    """
+    Runs one config; any error is caught and reported in the outcome instead of being raised.
+
+    Args:
+        config_path (str): Absolute path of the config.
+        output_dir (str, optional): Absolute path of the report directory.
+        quiet (bool): Discard the diagnostic output of the pipeline.
+        use_cache (bool): Use the result cache.
+
+    Returns:
+        tuple: (config_path, ok, message, seconds)
+    """
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            config = load_config(config_path)
+            text_path, csv_path = output_paths(config_path, config, output_dir)
+            run_config(config, text_path, csv_path, use_cache)
+        return config_path, True, f"results saved to {text_path} and {csv_path}", time.perf_counter() - start
+    except Exception as e:
+        return config_path, False, f"FAILED: {e}\n{traceback.format_exc()}", time.perf_counter() - start
+
+
+def report_outcome(outcome):
+    config_path, ok, message, seconds = outcome
+    print(f"{config_path}: {message} ({seconds:.2f} s)", file=sys.stdout if ok else sys.stderr)
+
+
+def run(config_paths, output_dir=None, use_cache=True, profile=False, profile_output=None, cprofile=False,
+        trace_memory=False):
+    """
+    Runs every config in turn; a failing config is reported and does not stop the others.
+
+    Args:
+        profile (bool): Time the pipeline stages (see hazcat_profile) and print the summary table.
+        profile_output (str, optional): Also write the profile as JSON (implies profile).
+        cprofile (bool): Include the cProfile function times in the profile.
+        trace_memory (bool): Include the peak traced memory of every stage in the profile.
+
+    Returns:
+        int: Number of configs that failed.
+    """
+    from hazcat_profile import profiler
+
+    jobs = [(os.path.abspath(path), output_dir and os.path.abspath(output_dir)) for path in config_paths]
+    profile_output = profile_output and os.path.abspath(profile_output)
+
+    failures = 0
+    with profiler.profiling(cprofile, trace_memory) if profile or profile_output else contextlib.nullcontext():
+        for config_path, out_dir in jobs:
+            outcome = run_job(config_path, out_dir, use_cache=use_cache)
+            report_outcome(outcome)
+            failures += not outcome[1]
+    if profile or profile_output:
+        print(profiler.summary())
+    if profile_output:
+        profiler.save(profile_output)
+        print(f"Profile saved to {profile_output}")
+    return failures
+
+
+def run_batch(config_dir, output_dir=None, workers=None, pattern='*.json', use_cache=True):
+    """
+    Runs all configs of a directory in parallel worker processes.
+
+    Every worker loads the library once (warm_library). Configs are run in sorted order and their outcomes are
+    reported in that order whatever the completion order; a failing or crashing job only fails itself. The reported
+    throughput covers the worker pool only; the warm-up of the library in this process is timed separately.
+
+    Args:
+        config_dir (str): Directory with the config files.
+        output_dir (str, optional): Directory for the reports (default: next to each config).
+        workers (int, optional): Number of worker processes (default: number of CPUs).
+        pattern (str): File name pattern of the configs.
+        use_cache (bool): Use the result cache.
+
+    Returns:
+        list: (config_path, ok, message, seconds) per config, in sorted config order.
+    """
+    paths = sorted(os.path.abspath(p) for p in glob.glob(os.path.join(config_dir, pattern)))
+    output_dir = output_dir and os.path.abspath(output_dir)
+    if not paths:
+        print(f"No configs matching {pattern} in {config_dir}")
+        return []
+
+    # Build any missing compiled library files once, before the workers read them
+    start = time.perf_counter()
+    warm_library()
+    warm_up = time.perf_counter() - start
+
+    start = time.perf_counter()
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_library) as pool:
+        futures = [pool.submit(run_job, path, output_dir, True, use_cache) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                outcome = future.result()
+            except Exception as e:  # the worker process died
+                outcome = (path, False, f"FAILED: worker error: {e!r}", 0.0)
+            report_outcome(outcome)
+            outcomes.append(outcome)
+
+    elapsed = time.perf_counter() - start
+    failures = sum(not ok for _, ok, _, _ in outcomes)
+    print(f"{len(paths)} configs in {elapsed:.2f} s ({len(paths) / elapsed:.2f} configs/s) after a library "
+          f"warm-up of {warm_up:.2f} s, {failures} failed")
+    return outcomes
+
+
+def run_decay(config_path, years=10.0, points=1001, t0=None, progeny=False, output=None):
+    """
+    Projects the inventory of a config over time and writes the categorization timeline to a CSV.
+
+    Args:
+        config_path (str): Config file; its inventories are taken at t0.
+        years (float): Length of the projection.
+        points (int): Number of time points.
+        t0 (str, optional): Date of the inventory (default: today).
+        progeny (bool): Include the ingrowth of progeny.
+        output (str, optional): CSV path (default: `<config name>_decay.csv` next to the config).
+
+    Returns:
+        DecayTimeline: The timeline.
+    """
+    config = load_config(config_path)
+    output = os.path.abspath(output or os.path.splitext(os.path.abspath(config_path))[0] + '_decay.csv')
+    import numpy as np
+    import pandas as pd
+    from hazcat_session import HazcatSession
+
+    times = np.linspace(0.0, years * 365.25 * 86400, points)
+    timeline = HazcatSession.from_config(config).decay_timeline(
+        config['inventories'], times, t0=pd.Timestamp(t0 or 'today').normalize(), progeny=progeny)
+    timeline.frame.to_csv(output, index=False)
+    print(f"Timeline saved to {output}")
+    for label in timeline.below_hc3:
+        date = timeline.below_hc3_date(label)
+        print(f"Below HC-3 ({label} thresholds): "
+              f"{date if date is not None else f'not within {years:g} years'}")
+    return timeline
+
+
+def run_uncertainty(config_path, distributions_path, samples=100000, seed=None, output=None):
+    """
+    Monte Carlo uncertainty of the threshold quantities and sums of ratios of a config (see hazcat_analysis).
+
+    Args:
+        config_path (str): Config file.
+        distributions_path (str): JSON object of input name -> distribution, e.g. {"R_HC3": ["lognormal", 1, 2]}.
+        samples (int): Number of samples.
+        seed (int, optional): Seed of the random generator.
+        output (str, optional): CSV path of the TQ percentiles (default: `<config name>_uncertainty.csv` next to
+            the config); the SOR percentiles go to the same name with `_sor` appended.
+
+    Returns:
+        UncertaintyResult: The percentiles.
+    """
+    config = load_config(config_path)
+    with open(distributions_path) as f:
+        distributions = {name: tuple(spec) for name, spec in json.load(f).items()}
+    output = os.path.abspath(output or os.path.splitext(os.path.abspath(config_path))[0] + '_uncertainty.csv')
+    from hazcat_analysis import monte_carlo
+    from hazcat_session import HazcatSession
+
+    start = time.perf_counter()
+    result = monte_carlo(HazcatSession.from_config(config), distributions, samples=samples, seed=seed)
+    result.frame().to_csv(output, index=False)
+    sor_output = os.path.splitext(output)[0] + '_sor.csv'
+    result.sor_frame().to_csv(sor_output, index=False)
+    print(f"{samples} samples in {time.perf_counter() - start:.2f} s; percentiles saved to {output} and {sor_output}")
+    for category, probability in result.category_probability.items():
+        print(f"P({category}) = {probability:.4f}")
+    return result
+
+
+def run_sensitivity(config_path, ranges_path, method='sobol', samples=None, seed=None, output=None):
+    """
+    Sobol or Morris sensitivity of the threshold quantities of a config to its inputs (see hazcat_analysis).
+
+    Args:
+        config_path (str): Config file.
+        ranges_path (str): JSON object of input name -> range, e.g. {"R_HC3": ["loguniform", 0.1, 10]}.
+        method (str): 'sobol' or 'morris'.
+        samples (int, optional): Sobol base samples (default 1024) or Morris trajectories (default 20).
+        seed (int, optional): Seed of the random generator.
+        output (str, optional): CSV path (default: `<config name>_<method>.csv` next to the config).
+
+    Returns:
+        pd.DataFrame: The indices.
+    """
+    config = load_config(config_path)
+    with open(ranges_path) as f:
+        ranges = {name: tuple(spec) for name, spec in json.load(f).items()}
+    output = os.path.abspath(output or os.path.splitext(os.path.abspath(config_path))[0] + f'_{method}.csv')
+    from hazcat_analysis import sobol_indices, morris_screening
+    from hazcat_session import HazcatSession
+
+    session = HazcatSession.from_config(config)
+    start = time.perf_counter()
+    if method == 'sobol':
+        indices = sobol_indices(session, ranges, samples=samples or 1024, seed=seed)
+    else:
+        indices = morris_screening(session, ranges, trajectories=samples or 20, seed=seed)
+    indices.to_csv(output, index=False)
+    print(f"{method} indices in {time.perf_counter() - start:.2f} s saved to {output}")
+    return indices
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pyhazcat', description="Headless HazCat hazard categorization.")
+    parser.add_argument('--log-level', default=None,
+                        help="Logging level, optionally per subsystem, e.g. INFO or INFO,dcf=DEBUG (default: INFO).")
+    parser.add_argument('--log-json', default=None, help="Also append the log as JSON lines to this file.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    run_parser = sub.add_parser('run', help="Run the HazCat pipeline for one or more config JSON files.")
+    run_parser.add_argument('configs', nargs='+', help="Config files (your_input.json schema).")
+    run_parser.add_argument('--output-dir', default=None,
+                            help="Directory for the reports (default: next to each config).")
+    run_parser.add_argument('--no-cache', action='store_true', help="Ignore the result cache and the nuclide memo.")
+    run_parser.add_argument('--profile', action='store_true', help="Print the time of every pipeline stage.")
+    run_parser.add_argument('--profile-output', default=None, help="Write the stage times as JSON (implies --profile).")
+    run_parser.add_argument('--cprofile', action='store_true', help="Add cProfile function times to the profile.")
+    run_parser.add_argument('--trace-memory', action='store_true',
+                            help="Add the peak memory of every stage to the profile (tracemalloc).")
+    batch_parser = sub.add_parser('batch', help="Run all config JSON files of a directory in parallel.")
+    batch_parser.add_argument('config_dir', help="Directory with the config files.")
+    batch_parser.add_argument('--output-dir', default=None,
+                              help="Directory for the reports (default: next to each config).")
+    batch_parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count).")
+    batch_parser.add_argument('--pattern', default='*.json', help="Config file name pattern (default: *.json).")
+    batch_parser.add_argument('--no-cache', action='store_true', help="Ignore the result cache and the nuclide memo.")
+    warm_parser = sub.add_parser('warm', help="Precompute the nuclide memo (default: all DOE-STD-1027 nuclides).")
+    warm_parser.add_argument('nuclides', nargs='*', help="Nuclides to precompute.")
+    decay_parser = sub.add_parser('decay', help="Project the inventory of a config over time and find when it "
+                                                "drops below HC-3.")
+    decay_parser.add_argument('config', help="Config file (your_input.json schema); inventories at t0.")
+    decay_parser.add_argument('--years', type=float, default=10.0, help="Length of the projection (default: 10).")
+    decay_parser.add_argument('--points', type=int, default=1001, help="Number of time points (default: 1001).")
+    decay_parser.add_argument('--t0', default=None, help="Date of the inventory, e.g. 2025-01-01 (default: today).")
+    decay_parser.add_argument('--progeny', action='store_true', help="Include the ingrowth of progeny.")
+    decay_parser.add_argument('--output', default=None,
+                              help="Timeline CSV (default: <config name>_decay.csv next to the config).")
+    mc_parser = sub.add_parser('uncertainty', help="Monte Carlo percentiles of the TQs and sums of ratios.")
+    mc_parser.add_argument('config', help="Config file (your_input.json schema).")
+    mc_parser.add_argument('distributions', help='JSON of input -> distribution, e.g. {"R_HC3": ["lognormal", 1, 2]}.')
+    mc_parser.add_argument('--samples', type=int, default=100000, help="Number of samples (default: 100000).")
+    mc_parser.add_argument('--seed', type=int, default=None, help="Seed of the random generator.")
+    mc_parser.add_argument('--output', default=None,
+                           help="TQ percentile CSV (default: <config name>_uncertainty.csv next to the config).")
+    sa_parser = sub.add_parser('sensitivity', help="Sobol or Morris indices of the TQs per input and pathway.")
+    sa_parser.add_argument('config', help="Config file (your_input.json schema).")
+    sa_parser.add_argument('ranges', help='JSON of input -> range, e.g. {"R_HC3": ["loguniform", 0.1, 10]}.')
+    sa_parser.add_argument('--method', choices=('sobol', 'morris'), default='sobol', help="Method (default: sobol).")
+    sa_parser.add_argument('--samples', type=int, default=None,
+                           help="Sobol base samples (default: 1024) or Morris trajectories (default: 20).")
+    sa_parser.add_argument('--seed', type=int, default=None, help="Seed of the random generator.")
+    sa_parser.add_argument('--output', default=None,
+                           help="Indices CSV (default: <config name>_<method>.csv next to the config).")
+    args = parser.parse_args(argv)
+
+    from hazcat_logging import configure_logging, LOG_LEVEL_ENV
+    if args.log_level:
+        # Inherited by batch workers started without fork
+        os.environ[LOG_LEVEL_ENV] = args.log_level
+    try:
+        configure_logging(args.log_level, json_path=args.log_json and os.path.abspath(args.log_json))
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.command == 'run':
+        return 1 if run(args.configs, args.output_dir, not args.no_cache, args.profile, args.profile_output,
+                        args.cprofile, args.trace_memory) else 0
+    if args.command == 'batch':
+        outcomes = run_batch(args.config_dir, args.output_dir, args.workers, args.pattern,
+                             not args.no_cache)
+        return 1 if not all(ok for _, ok, _, _ in outcomes) else 0
+    if args.command == 'warm':
+        from hazcat_cache import nuclide_memo
+        start = time.perf_counter()
+        computed = nuclide_memo.warm(args.nuclides or None)
+        print(f"Computed {computed} nuclides in {time.perf_counter() - start:.2f} s: {nuclide_memo}")
+        return 0
+    if args.command == 'decay':
+        run_decay(args.config, args.years, args.points, args.t0, args.progeny, args.output)
+        return 0
+    if args.command == 'uncertainty':
+        run_uncertainty(args.config, args.distributions, args.samples, args.seed, args.output)
+        return 0
+    if args.command == 'sensitivity':
+        run_sensitivity(args.config, args.ranges, args.method, args.samples, args.seed, args.output)
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,9 +6,14 @@
 
 import tkinter as tk
 from hazcat_class import *
+from hazcat_library import library_cache, DOE_TQ_WORKBOOK
+from hazcat_logging import configure_logging
 from tkinter import ttk
 from tkinter import *
 
+# Pipeline messages go to the console, at the level of HAZCAT_LOG_LEVEL (INFO by default)
+configure_logging()
+
 
 # Copyright and Acknowledgment
 COPYRIGHT = "Copyright (c) 2024 Bhabha Atomic Research Centre, Mumbai, India"
@@ -462,8 +467,7 @@ def calculate_hazcat():
     
 # Radionuclide list
 def get_rads_list_from_doe():
-    xls = pd.ExcelFile("library/doe_haz_cat_excel.xlsx")
-    df_tq = pd.read_excel(xls, sheet_name='thresholds')
+    df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='thresholds')
     df_tq.dropna(axis=0, how='all', inplace=True)
     list_of_rads = df_tq['Radionuclide'].to_list()
     return list_of_rads
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+# The pyHazCat modules live at the top of the repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A small mixed inventory (fission products, actinides, a noble gas and tritium)
+FACILITY_CONFIG = {
+    "consider_progeny": False, "ignore_half_life": None,
+    "rads_list": ["Sr-90", "Cs-137", "Pu-239", "Kr-85", "Co-60", "H-3", "U-235", "Am-241"],
+    "inventories": [10, 100000.0, 1, 1000.0, 50, 1000000.0, 0.01, 2],
+    "Rs_HC2": None, "Rs_HC3": None, "output_filename": None,
+}
+
+
+@pytest.fixture(scope="session")
+def facility_config():
+    return dict(FACILITY_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def facility_session(facility_config):
+    from hazcat_session import HazcatSession
+
+    return HazcatSession.from_config(facility_config, cache=None)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from hazcat_analysis import monte_carlo, morris_screening, parameter_sweep, sobol_indices, SENSITIVITY_OUTPUTS
+from hazcat_kernels import BREATHING_RATE, HC3_CHI_BY_Q
+
+
+@pytest.mark.parametrize("name", ["R_HC2", "R_HC3", "chi_by_q_hc3"])
+def test_monte_carlo_single_input(facility_session, name):
+    """Sampling the inputs of one HC level only leaves the TQs of the other level at their nominal values."""
+    mc = monte_carlo(facility_session, {name: ('uniform', 0.5, 1.0)}, samples=200, seed=1)
+    n = len(facility_session.rads_list)
+    assert mc.tq_hc2_curie.shape == mc.tq_hc3_curie.shape == (3, n)
+    fixed = mc.tq_hc3_curie if name == 'R_HC2' else mc.tq_hc2_curie
+    nominal = (facility_session.result.tq_hc3_curie if name == 'R_HC2' else facility_session.result.tq_hc2_curie)
+    for row in fixed:
+        np.testing.assert_allclose(row, nominal, rtol=5e-3)
+    assert sum(mc.category_probability.values()) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("name, values", [("R_HC3", [1.5]), ("R_HC2", [0.0, 0.5]), ("R_HC3", [-0.1])])
+def test_parameter_sweep_rejects_release_fractions_outside_unit_interval(facility_session, name, values):
+    with pytest.raises(ValueError, match=name):
+        parameter_sweep(facility_session, **{name: values})
+
+
+def test_parameter_sweep_dimensions_and_nominal_point(facility_session):
+    sweep = parameter_sweep(facility_session, chi_by_q_hc3=[HC3_CHI_BY_Q, 0.01], breathing_rate=[BREATHING_RATE],
+                            R_HC3=[0.1, 1.0])
+    n = len(facility_session.rads_list)
+    assert sweep.dims('tq_hc3_curie') == ('chi_by_q_hc3', 'breathing_rate', 'R_HC3', 'nuclide')
+    assert sweep['tq_hc3_curie'].shape == (2, 1, 2, n)
+    assert sweep.dims('tq_hc2_curie') == ('breathing_rate', 'nuclide')
+    np.testing.assert_allclose(sweep['tq_hc2_curie'][0], facility_session.result.tq_hc2_curie, rtol=1e-12)
+    # A wider dispersion (smaller chi/Q) gives larger HC-3 thresholds
+    assert np.all(sweep['tq_hc3_curie'][1] >= sweep['tq_hc3_curie'][0])
+
+
+def indices(frame, output, name):
+    return frame[(frame['Output'] == output) & (frame['Input'] == name)].set_index('Radionuclide')
+
+
+def test_sobol_indices_of_log_linear_outputs(facility_session):
+    # log10 of the inhalation TQ is -log10(R_HC3) - log10(chi/Q) + const: two inputs of equal log-width share its
+    # variance, and the HC-2 TQ depends on neither of them
+    ranges = {'R_HC3': ('loguniform', 0.1, 1.0), 'chi_by_q_hc3': ('loguniform', 0.01, 0.1)}
+    frame = sobol_indices(facility_session, ranges, samples=4096, seed=21)
+    assert len(frame) == len(facility_session.rads_list) * len(SENSITIVITY_OUTPUTS) * len(ranges)
+    for name in ranges:
+        inhalation = indices(frame, 'Inhalation', name).drop('Kr-85')
+        np.testing.assert_allclose(inhalation['S1'], 0.5, atol=0.05)
+        np.testing.assert_allclose(inhalation['ST'], 0.5, atol=0.05)
+        # Outputs that do not vary have no indices
+        assert indices(frame, 'TQ HC-2', name)[['S1', 'ST']].isna().all().all()
+    # Noble gases have no inhalation pathway
+    assert indices(frame, 'Inhalation', 'R_HC3').loc['Kr-85', ['S1', 'ST']].isna().all()
+
+
+def test_sobol_indices_are_reproducible(facility_session):
+    ranges = {'R_HC2': (0.5, 1.0), 'dcf_inh': ('loguniform', 0.5, 2.0), 'breathing_rate': (2e-4, 4e-4)}
+    first = sobol_indices(facility_session, ranges, samples=64, seed=3, chunk_size=50)
+    second = sobol_indices(facility_session, ranges, samples=64, seed=3)
+    assert first.equals(second)
+
+
+def test_morris_elementary_effects_of_log_linear_outputs(facility_session):
+    ranges = {'R_HC2': ('loguniform', 0.1, 1.0), 'chi_by_q_hc3': ('uniform', 0.01, 0.1)}
+    frame = morris_screening(facility_session, ranges, trajectories=10, seed=21)
+    # log10 TQ HC-2 falls by one decade over the log-uniform range of R_HC2, whatever the other input
+    release = indices(frame, 'TQ HC-2', 'R_HC2')
+    np.testing.assert_allclose(release['mu'], -1.0, rtol=1e-9)
+    np.testing.assert_allclose(release['mu_star'], 1.0, rtol=1e-9)
+    np.testing.assert_allclose(release['sigma'], 0.0, atol=1e-9)
+    np.testing.assert_array_equal(indices(frame, 'TQ HC-2', 'chi_by_q_hc3')['mu_star'], 0.0)
+
+
+def test_sensitivity_ranges_must_be_uniform_or_loguniform(facility_session):
+    with pytest.raises(ValueError, match="uniform or loguniform"):
+        morris_screening(facility_session, {'R_HC3': ('lognormal', 1.0, 2.0)})
+
+
+def test_monte_carlo_floors_non_positive_samples(facility_session):
+    """A wide normal release fraction draws values <= 0 in a third of the samples; the TQs must stay positive."""
+    mc = monte_carlo(facility_session, {'R_HC3': ('normal', 1.0, 2.0), 'breathing_rate': ('normal', 3.3e-4, 1e-3)},
+                     samples=2000, percentiles=(0, 5, 50, 95, 100), seed=20)
+    nominal = facility_session.result.tq_hc3_curie
+    finite = np.isfinite(nominal)
+    assert np.all(mc.tq_hc3_curie[:, finite] > 0) and np.all(np.isfinite(mc.tq_hc3_curie[:, finite]))
+    # At worst the floor of the release fraction and of the breathing rate, 10^12 times the nominal TQ
+    assert np.all(mc.tq_hc3_curie[-1, finite] <= 1.01e12 * nominal[finite])
+    assert np.all(mc.sor_hc3 > 0) and np.all(mc.sor_hc2 > 0)
+    assert sum(mc.category_probability.values()) == pytest.approx(1.0)
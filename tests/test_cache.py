@@ -0,0 +1,78 @@
+import os
+import time
+
+import numpy as np
+
+from hazcat_cache import library_files, library_fingerprint, LIBRARY_CODE, PACKAGE_DIR
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def test_library_files_skip_bytecode(tmp_path):
+    library = str(tmp_path)
+    write(os.path.join(library, "table.csv"), "Nuclide\nCo-60\n")
+    write(os.path.join(library, "annex.py"), "x = 1\n")
+    write(os.path.join(library, "__pycache__", "annex.cpython-311.pyc"), "bytecode")
+    write(os.path.join(library, "MASS", "stray.pyc"), "bytecode")
+    assert [os.path.relpath(p, library) for p in library_files(library)] == ["annex.py", "table.csv"]
+
+
+def test_library_fingerprint_follows_sources_only(tmp_path):
+    library = str(tmp_path)
+    write(os.path.join(library, "table.csv"), "Nuclide\nCo-60\n")
+    fingerprint = library_fingerprint(library)
+    write(os.path.join(library, "__pycache__", "annex.cpython-311.pyc"), "bytecode")
+    assert library_fingerprint(library) == fingerprint
+    write(os.path.join(library, "table.csv"), "Nuclide\nCo-60\nCs-137\n")
+    assert library_fingerprint(library) != fingerprint
+
+
+def test_library_code_covers_the_cached_pipeline():
+    for name in ("hazcat_cache.py", "hazcat_session.py", "hazcat_class.py", "hazcat_kernels.py"):
+        assert name in LIBRARY_CODE
+    assert all(os.path.isfile(os.path.join(PACKAGE_DIR, name)) for name in LIBRARY_CODE)
+
+
+def test_no_cache_run_bypasses_the_nuclide_memo(facility_config, tmp_path, monkeypatch):
+    import hazcat_cache
+    from pyhazcat import run_config
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the nuclide memo was used")
+
+    monkeypatch.setattr(hazcat_cache.nuclide_memo, "records_for", fail)
+    result = run_config(facility_config, str(tmp_path / "out.txt"), str(tmp_path / "out.csv"), use_cache=False)
+    assert result.rads_list == facility_config["rads_list"]
+    assert (tmp_path / "out.txt").exists() and (tmp_path / "out.csv").exists()
+
+
+def test_result_cache_round_trip(facility_config, tmp_path):
+    from hazcat_cache import compute_hazcat_result_cached, ResultCache
+
+    cache = ResultCache(str(tmp_path))
+    first = compute_hazcat_result_cached(facility_config, cache=cache)
+    second = compute_hazcat_result_cached(facility_config, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.rads_list == first.rads_list
+    np.testing.assert_array_equal(second.tq_hc3_curie, first.tq_hc3_curie)
+    assert second.sor_hazcat == first.sor_hazcat
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    from hazcat_cache import ResultCache
+
+    cache = ResultCache(str(tmp_path), max_bytes=2500)
+    cache._fingerprint = "library"
+    configs = [{'rads_list': ['Co-60'], 'inventories': [float(k)], 'output_filename': None} for k in range(3)]
+    for age, config in zip((300, 200), configs):
+        cache.put(config, b"x" * 1000)
+        os.utime(cache._path(cache.key(config)), (time.time() - age,) * 2)
+    assert cache.get(configs[0]) == b"x" * 1000     # now the most recently used
+    cache.put(configs[2], b"x" * 1000)
+    assert cache.evictions == 1
+    assert cache.get(configs[1]) is None
+    assert cache.get(configs[0]) is not None and cache.get(configs[2]) is not None
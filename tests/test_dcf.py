@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hazcat_class import HAZCAT
+
+REFERENCES = ["Annex_A_ICRP_119", "Table_4_6_FGR15", "Table_A2_DOE_STD_1196_2011", "Table_3_JAERI_DATA_CODE_2002_013",
+              "Unranked_table"]
+NAMES = ["Cs-137", "Cs-137m", "Ba-137m", " cs-137", "I-131"]
+
+# Nuclides covering particulates, a noble gas, tritium, reactive gases and a metastable state
+RADS = ["Sr-90", "Cs-137", "Pu-239", "Kr-85", "Co-60", "H-3", "U-235", "Am-241", "I-131", "Rn-222", "Tc-99m"]
+
+
+def make_hazcat(rads_list=()):
+    return HAZCAT({'inventories': [0.0] * len(rads_list), 'rads_list': list(rads_list), 'output_filename': None})
+
+
+def baseline_filter_max_value(df, nuclide_col, value_col, reference_col):
+    """The per-nuclide priority loop of the original filter_max_value_by_reference."""
+    df = df.copy()
+    df[nuclide_col] = df[nuclide_col].astype(str).str.strip().str.upper()
+    df[reference_col] = df[reference_col].astype(str)
+    df[value_col] = pd.to_numeric(df[value_col], errors='coerce')
+
+    def contains_keyword(df, keywords):
+        return df[df[reference_col].str.contains('|'.join(keywords), case=False, na=False)]
+
+    max_value = None
+    for radionuclide in df[nuclide_col].unique():
+        subset_df = df[df[nuclide_col].str.contains(rf"^{radionuclide}|{radionuclide}", na=False, case=False)]
+        if subset_df.empty:
+            continue
+        for keywords in (["ICRP_119", "FGR"], ["DOE_STD"], ["JAERI"]):
+            found = contains_keyword(subset_df, keywords)
+            if not found.empty:
+                max_value = found[value_col].max()
+                break
+        else:
+            max_value = None
+    return max_value
+
+
+def same_value(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return (np.isnan(a) and np.isnan(b)) or a == b
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_priority_reduction_matches_baseline_loop(seed):
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(1, 9))
+    values = rng.choice([1e-9, 2e-9, 5e-10, 3e-8, np.nan, "2.OE-10", "--"], size).tolist()
+    df = pd.DataFrame({"Nuclide": rng.choice(NAMES, size), "inh_adult": values,
+                       "Reference": rng.choice(REFERENCES, size)})
+    expected = baseline_filter_max_value(df, "Nuclide", "inh_adult", "Reference")
+    got = make_hazcat().filter_max_value_by_reference(df.copy(), "Nuclide", "inh_adult", "Reference")
+    assert same_value(got, expected)
+
+
+def test_priority_reduction_prefers_icrp_over_higher_jaeri_value():
+    df = pd.DataFrame({"Radionuclide": ["A", "A", "A", "B", "B", "C"],
+                       "Nuclide": ["Co-60", "Co-60", "Co-60", "I-131", "I-131", "H-3"],
+                       "dcf": [1e-9, 4e-9, 9e-9, 2e-9, 3e-9, 1e-11],
+                       "Reference": ["Annex_G_ICRP_119", "Table_4_6_FGR15", "Table_7_JAERI_DATA_CODE_2002_013",
+                                     "Table_A2_DOE_STD_1196_2011", "Table_5_JAERI_DATA_CODE_2002_013",
+                                     "Unranked_table"]})
+    selection = make_hazcat().reduce_by_reference_priority(df, "Radionuclide", "Nuclide", "dcf", "Reference")
+    assert selection.loc["A", "value"] == 4e-9 and selection.loc["A", "tier"] == 1
+    assert selection.loc["B", "value"] == 2e-9 and selection.loc["B", "source"] == "Table_A2_DOE_STD_1196_2011"
+    assert np.isnan(selection.loc["C", "value"]) and selection.loc["C", "source"] == "No data available"
+
+
+def test_compute_max_dcf_batch_matches_single_nuclide():
+    hazcat = make_hazcat(RADS)
+    batch = hazcat.compute_max_dcf_batch()
+    assert list(batch) == RADS
+    for rad in RADS:
+        single = hazcat.compute_max_dcf(rad)
+        for key, value in single.items():
+            assert same_value(float(batch[rad][key]), float(value)), (rad, key)
+
+
+def test_compute_max_dcf_batch_is_independent_of_the_other_nuclides():
+    batch = make_hazcat(RADS).compute_max_dcf_batch()
+    for rad in ("Cs-137", "Kr-85", "I-131"):
+        alone = make_hazcat([rad]).compute_max_dcf_batch()[rad]
+        assert all(same_value(float(alone[key]), float(batch[rad][key])) for key in alone)
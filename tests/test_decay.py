@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from hazcat_class import HAZCAT
+from hazcat_kernels import bateman_activities
+from hazcat_library import load_decay_graph, DecayGraph
+
+DAY = 86400.0
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return load_decay_graph()
+
+
+def two_member_chain(parent_half_life, daughter_half_life):
+    # P -> D -> (stable) S
+    return DecayGraph(["P", "D", "S"], [parent_half_life, daughter_half_life, np.inf], [0, 1, 2, 2], [1, 2],
+                      [1.0, 1.0])
+
+
+def progeny_settings(consider_progeny, ignore_half_life):
+    hazcat = HAZCAT.__new__(HAZCAT)
+    hazcat.config = {'consider_progeny': consider_progeny, 'ignore_half_life': ignore_half_life}
+    return hazcat
+
+
+def test_bateman_two_member_chain_matches_closed_form():
+    lam_p, lam_d = np.log(2) / 10.0, np.log(2) / 1.0
+    times = np.array([0.0, 0.5, 1.0, 5.0, 20.0])
+    nodes, activities = bateman_activities(two_member_chain(10.0, 1.0), ["P"], times)
+    assert list(nodes) == ["P", "D"]
+    np.testing.assert_allclose(activities[0, 0], np.exp(-lam_p * times))
+    np.testing.assert_allclose(activities[0, 1], lam_d / (lam_d - lam_p) * (np.exp(-lam_p * times)
+                                                                          - np.exp(-lam_d * times)), atol=1e-15)
+
+
+def test_bateman_secular_equilibrium():
+    """A long-lived parent and a short-lived daughter reach equal activities."""
+    nodes, activities = bateman_activities(two_member_chain(1e9 * DAY, 1.0), ["P"], [0.0, 60.0])
+    np.testing.assert_allclose(activities[0, :, 0], [1.0, 0.0])
+    np.testing.assert_allclose(activities[0, 1, 1], activities[0, 0, 1], rtol=1e-12)
+
+
+def test_bateman_secular_equilibrium_in_library_chain(graph):
+    nodes, activities = bateman_activities(graph, ["Sr-90"], [100 * DAY])
+    a = dict(zip(nodes, activities[0, :, 0]))
+    assert a["Y-90"] == pytest.approx(a["Sr-90"], rel=1e-3)
+
+
+def test_bateman_long_lived_parent_has_no_unrelated_activity(graph):
+    """Sm-148 (T ~ 7e15 y) grows in nothing at t = 1 s, whatever it is batched with."""
+    parents = ["Sm-148", "Ce-144", "Pr-144m", "Nd-144"]
+    nodes, activities = bateman_activities(graph, parents, [1.0])
+    a = dict(zip(nodes, activities[0, :, 0]))
+    assert a["Sm-148"] == pytest.approx(1.0)
+    assert a["Pr-144m"] == 0.0
+    assert sum(a.values()) == pytest.approx(1.0)
+
+
+def test_bateman_parent_alone_equals_batched(graph):
+    radioactive = np.isfinite(graph.decay_constant) & (graph.decay_constant > 0)
+    parents = graph.names[radioactive].tolist()
+    times = [1.0, 3600.0, 30 * DAY, 1e4 * DAY]
+    nodes, activities = bateman_activities(graph, parents, times)
+    position = {name: k for k, name in enumerate(nodes.tolist())}
+    assert np.all(np.isfinite(activities))
+    for p in [parents.index(name) for name in ("Sm-148", "U-238", "Th-232", "Cs-137", "Pu-241")]:
+        alone_nodes, alone = bateman_activities(graph, [parents[p]], times)
+        columns = [position[name] for name in alone_nodes.tolist()]
+        np.testing.assert_array_equal(activities[p, columns], alone[0])
+        others = np.ones(len(nodes), dtype=bool)
+        others[columns] = False
+        assert not activities[p, others].any()
+
+
+def test_bateman_unknown_and_stable_parents_give_zero_rows(graph):
+    nodes, activities = bateman_activities(graph, ["Xx-999", "Pb-208", "Co-60"], [DAY])
+    assert not activities[:2].any()
+    assert activities[2].any()
+
+
+def test_progeny_keep_baseline_half_life_cutoff(graph):
+    """Only progeny with a half-life up to ignore_half_life are considered, as in find_progeny_name_and_yield_f."""
+    hazcat = progeny_settings(True, 1800)
+    names, _ = hazcat.get_progeny("Cs-137")
+    assert list(names) == ["Ba-137m"]
+    daughters, _ = hazcat.find_progeny_name_and_yield_f("Cs-137")
+    assert list(daughters) == ["Ba-137m"]
+    assert len(hazcat.get_progeny("Sr-90")[0]) == 0
+    assert all(graph.half_life[graph.ids[n]] <= 1800 for n in hazcat.get_progeny("Th-232")[0])
+    assert len(progeny_settings(False, 1800).get_progeny("Cs-137")[0]) == 0
+
+
+def test_ingrowth_folds_long_lived_progeny():
+    """With the default settings, a century of ingrowth raises the DCFs of U-238 and Th-232 measurably."""
+    hazcat = HAZCAT({'inventories': [1.0, 1.0], 'rads_list': ["U-238", "Th-232"], 'output_filename': None})
+    dcfs = hazcat.compute_max_dcf_batch()
+    folded = hazcat.progeny_weighted_dcfs(dcfs, 100 * 365.25 * DAY)
+    # U-234 grows in slowly; Ra-228 and Th-228 bring Th-232 close to equilibrium with its chain
+    assert folded["U-238"]["max_dcf_inh_hc3"] > 1.001 * dcfs["U-238"]["max_dcf_inh_hc3"]
+    assert folded["Th-232"]["max_dcf_inh_hc3"] > 2 * dcfs["Th-232"]["max_dcf_inh_hc3"]
+    assert folded["Th-232"]["max_dcf_ing_hc3"] > 5 * dcfs["Th-232"]["max_dcf_ing_hc3"]
+    nominal = hazcat.compute_hazcat_result()
+    aged = hazcat.compute_hazcat_result(progeny_ingrowth_time=100 * 365.25 * DAY)
+    assert np.all(aged.tq_hc3_curie < nominal.tq_hc3_curie)
+    # Without ingrowth time only the parent remains
+    unfolded = hazcat.progeny_weighted_dcfs(dcfs, 0.0)
+    assert unfolded["Th-232"]["max_dcf_inh_hc3"] == pytest.approx(float(dcfs["Th-232"]["max_dcf_inh_hc3"]))
+
+
+def test_ingrowth_folds_progeny_listed_as_parents():
+    """A descendant that is itself in rads_list still contributes to its parent."""
+    time = 1e4 * 365.25 * DAY
+    alone = HAZCAT({'inventories': [1.0], 'rads_list': ["U-238"], 'output_filename': None})
+    alone = alone.progeny_weighted_dcfs(alone.compute_max_dcf_batch(), time)
+    both = HAZCAT({'inventories': [1.0, 1.0], 'rads_list': ["U-238", "U-234"], 'output_filename': None})
+    both = both.progeny_weighted_dcfs(both.compute_max_dcf_batch(), time)
+    for key, value in alone["U-238"].items():
+        assert float(both["U-238"][key]) == pytest.approx(float(value), rel=1e-12)
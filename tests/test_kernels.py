@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from hazcat_kernels import hc2_threshold_quantity, hc3_threshold_quantities, specific_activity, HC3_PATHWAYS
+
+YEAR = 365.25 * 86400
+
+
+def baseline_hc2(Rs, aws, half_lives, dcf_inh, dcf_sub, chi_by_q=1e-04):
+    """The per-nuclide HC-2 loop of the original compute_threshold_quantity_HC2_in_gram_and_curie."""
+    curies, grams = [], []
+    for R, AW, t_half, DCF_inhalation, DCF_submersion in zip(Rs, aws, half_lives, dcf_inh, dcf_sub):
+        DCF_inhalation = 0.0 if np.isnan(DCF_inhalation) else DCF_inhalation
+        DCF_submersion = 0.0 if np.isnan(DCF_submersion) else DCF_submersion
+        SA = (np.log(2) * 6.022E+23) / (AW * t_half * 3.7E+10)
+        denominator = R * SA * chi_by_q * ((DCF_inhalation * 3.3333E-4) + DCF_submersion)
+        TQ_HC2 = float('inf') if denominator == 0 else 1 / denominator
+        grams.append(TQ_HC2 * 0.01 / 3.7e10)
+        curies.append(grams[-1] * SA)
+    return curies, grams
+
+
+@pytest.fixture
+def nuclides():
+    rng = np.random.default_rng(10)
+    n = 50
+    dcf_inh = 10 ** rng.uniform(-11, -5, n)
+    dcf_sub = np.where(rng.random(n) < 0.2, 10 ** rng.uniform(-16, -13, n), np.nan)
+    dcf_inh[rng.random(n) < 0.1] = np.nan
+    dcf_inh[:2] = np.nan
+    dcf_sub[:2] = np.nan    # no DCF at all: infinite TQ
+    return dict(Rs=rng.choice([1e-3, 1e-2, 0.5, 1.0], n), aws=rng.uniform(3, 250, n),
+                half_lives=10 ** rng.uniform(2, 17, n), dcf_inh=dcf_inh, dcf_sub=dcf_sub)
+
+
+def test_hc2_matches_baseline_loop(nuclides):
+    curies, grams = hc2_threshold_quantity(**nuclides)
+    expected_curies, expected_grams = baseline_hc2(*nuclides.values())
+    np.testing.assert_allclose(curies, expected_curies, rtol=1e-13)
+    np.testing.assert_allclose(grams, expected_grams, rtol=1e-13)
+    assert np.isinf(curies[:2]).all()
+
+
+def test_hc2_broadcasts_scenarios(nuclides):
+    Rs = np.array([0.1, 1.0])
+    curies, grams = hc2_threshold_quantity(Rs[:, None], nuclides['aws'], nuclides['half_lives'],
+                                           nuclides['dcf_inh'], nuclides['dcf_sub'])
+    assert curies.shape == grams.shape == (2, len(nuclides['aws']))
+    for row, R in zip(curies, Rs):
+        expected, _ = hc2_threshold_quantity(R, nuclides['aws'], nuclides['half_lives'], nuclides['dcf_inh'],
+                                             nuclides['dcf_sub'])
+        np.testing.assert_array_equal(row, expected)
+    # The TQ is inversely proportional to the release fraction
+    finite = np.isfinite(curies[1])
+    np.testing.assert_allclose(curies[0, finite], 10 * curies[1, finite])
+
+
+def test_specific_activity_of_co60():
+    # 1 g of Co-60 (5.27 y) is about 1130 Ci
+    assert specific_activity(59.93, 5.2714 * YEAR) == pytest.approx(1130, rel=2e-3)
+
+
+def test_hc3_pathways_of_one_nuclide():
+    R, aw, t_half, E1, bv = 1e-3, 137.0, 30.0 * YEAR, 0.66, 0.04
+    dcf_inh, dcf_ing = 6.7e-9, 1.3e-8
+    hc3 = hc3_threshold_quantities(R, aw, bv, t_half, E1, dcf_inh, dcf_ing, np.nan)
+    inhalation, food, water, direct, submersion = hc3.tq_curie
+
+    SA = specific_activity(aw, t_half)
+    factor = 0.01 / 3.7e10
+    lambda_i, lambda_w = 86400 * np.log(2) / t_half, np.log(2) / 14
+    CT = (1 - np.exp(-(lambda_i + lambda_w) * 60)) / (lambda_i + lambda_w)
+    assert inhalation == pytest.approx(10 / (R * SA * 7.2e-2 * dcf_inh * 3.3333e-4) * factor * SA)
+    assert food == pytest.approx(10 / ((1e-4 + 3.5e-6 * bv) * 0.175 * CT * R * dcf_ing) * factor)
+    assert water == pytest.approx(10 / (7.6e-8 * np.exp(-4.2 * 86400 / t_half) * (1 - np.exp(-lambda_i * 9)) / lambda_i
+                                        * 2 * dcf_ing) * factor)
+    assert direct == pytest.approx(10 * 30 ** 2 * 6.41e-5 / (E1 * 3.7e-5 * 24 * (1 - np.exp(-lambda_i)) / lambda_i
+                                                             * np.exp(-100 * 3.7e-5 * 30)))
+    assert submersion == np.inf
+    assert hc3.tq_hc3_curie == min(inhalation, food, water, direct)
+    assert hc3.tq_hc3_gram == pytest.approx(hc3.tq_hc3_curie / SA)
+
+
+def test_hc3_inert_gas_uses_submersion_instead_of_direct_exposure():
+    hc3 = hc3_threshold_quantities(1.0, 85.0, np.nan, 10.7 * YEAR, 0.0022, np.nan, np.nan, 2.2e-16)
+    inhalation, food, water, direct, submersion = hc3.tq_curie
+    assert inhalation == food == water == direct == np.inf
+    assert submersion == pytest.approx(10 / (7.2e-2 * 2.2e-16) * 0.01 / 3.7e10)
+    assert HC3_PATHWAYS[hc3.dominant] == 'Submersion'
+
+
+def test_hc3_batch_equals_single_nuclides(nuclides):
+    rng = np.random.default_rng(11)
+    n = len(nuclides['aws'])
+    inputs = dict(Rs=nuclides['Rs'], aws=nuclides['aws'], BVs=rng.uniform(0, 1, n), half_lives=nuclides['half_lives'],
+                  E1s=np.where(rng.random(n) < 0.2, 0.0, rng.uniform(0, 2, n)), dcf_inh=nuclides['dcf_inh'],
+                  dcf_ing=10 ** rng.uniform(-11, -6, n), dcf_sub=nuclides['dcf_sub'])
+    batch = hc3_threshold_quantities(**inputs)
+    assert batch.tq_curie.shape == (n, len(HC3_PATHWAYS))
+    assert not np.isnan(batch.tq_curie).any()
+    for k in range(n):
+        single = hc3_threshold_quantities(**{name: values[k] for name, values in inputs.items()})
+        np.testing.assert_array_equal(single.tq_curie, batch.tq_curie[k])
+    np.testing.assert_array_equal(batch.tq_curie[np.arange(n), batch.dominant], batch.tq_hc3_curie)
+
+
+def test_hc3_pathways_of_the_pipeline(facility_session):
+    """HAZCAT.compute_hc3_pathways is the kernel applied to the nominal inputs of the radionuclides."""
+    inputs = facility_session.threshold_quantity_inputs()
+    hc3 = hc3_threshold_quantities(inputs['Rs_HC3'], inputs['aws'], inputs['BVs'], inputs['half_lives'],
+                                   inputs['E1s'], inputs['dcf_inh_hc3'], inputs['dcf_ing_hc3'], inputs['dcf_sub_hc3'])
+    np.testing.assert_allclose(hc3.tq_curie, facility_session.result.hc3.tq_curie, rtol=1e-12)
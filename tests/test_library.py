@@ -0,0 +1,76 @@
+import os
+import re
+
+import numpy as np
+import pytest
+
+from hazcat_library import (library_cache, load_dcf_library, regex_nuclide_rows, DCF_TABLES, DCF_TABLE_MATCH,
+                            HALF_LIFE_TABLE)
+
+
+@pytest.fixture(scope="module")
+def library():
+    return load_dcf_library()
+
+
+@pytest.fixture(scope="module")
+def half_life_nuclides():
+    return sorted(set(library_cache.read_csv(HALF_LIFE_TABLE)["Nuclide"].dropna().astype(str)))
+
+
+def lookup(function, *args):
+    # Names that are not valid regular expressions make the original filter raise; the index must too
+    try:
+        return function(*args)
+    except re.error:
+        return None
+
+
+@pytest.mark.parametrize("name", list(DCF_TABLES))
+def test_nuclide_index_matches_regex_filter(library, half_life_nuclides, name):
+    """The NuclideIndex of every DCF table selects the rows of the original regex filter, for every nuclide."""
+    if name not in library.tables:
+        pytest.skip(f"{name} is not in the compiled library ({library.errors.get(name)})")
+    df = library.tables[name]
+    index = library.index(name)
+    mismatches = []
+    for nuclide in half_life_nuclides:
+        got = lookup(index.rows, nuclide)
+        expected = lookup(regex_nuclide_rows, df, nuclide, DCF_TABLE_MATCH[name])
+        if (got is None) != (expected is None) or (got is not None and not np.array_equal(got, expected)):
+            mismatches.append(nuclide)
+    assert not mismatches, f"{name}: index differs from the regex filter for {mismatches[:10]}"
+
+
+def test_nuclide_index_finds_tabulated_nuclides(library):
+    index = library.index('Annex_A_ICRP_119')
+    rows = index.rows('Co-60')
+    assert len(rows) > 0
+    assert set(library.tables['Annex_A_ICRP_119']['Nuclide'].iloc[rows]) == {'Co-60'}
+
+
+def test_atomic_mass_lookup():
+    from hazcat_class import HAZCAT
+
+    hazcat = HAZCAT({'inventories': [], 'rads_list': [], 'output_filename': None})
+    assert hazcat.get_atomic_mass("Cs-137") == pytest.approx(136.907, abs=1e-3)
+    assert hazcat.get_atomic_mass("Ba-137m") == hazcat.get_atomic_mass("Ba-137")
+    # A miss is NaN, never a message that a float conversion would choke on
+    assert np.isnan(hazcat.get_atomic_mass("Xx-999"))
+    masses, error = hazcat.get_atomic_masses(["Co-60", "Xx-999"])
+    assert list(error) == [False, True] and np.isnan(masses[1])
+
+
+def test_nuclide_table_stamps_the_sources_of_its_library(tmp_path):
+    from hazcat_library import write_nuclide_table, NUCLIDE_DTYPE, NUCLIDE_TABLE_SOURCES, LIBRARY_DIR
+
+    library = tmp_path / "library"
+    source = library / os.path.relpath(NUCLIDE_TABLE_SOURCES[0], LIBRARY_DIR)
+    source.parent.mkdir(parents=True)
+    source.write_text("Nuclide\nCo-60\n")
+    table = write_nuclide_table(np.zeros(1, NUCLIDE_DTYPE), str(library / "nuclide_properties.npy"), str(library))
+    stamped = {path for path, stamp in table.sources.items() if stamp is not None}
+    assert stamped == {os.path.relpath(NUCLIDE_TABLE_SOURCES[0], LIBRARY_DIR)}
+    assert not table.is_stale(str(library))
+    source.write_text("Nuclide\nCo-60\nCs-137\n")
+    assert table.is_stale(str(library))
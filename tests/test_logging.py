@@ -0,0 +1,51 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+from hazcat_logging import configure_logging, get_logger, ROOT_LOGGER
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger(ROOT_LOGGER)
+    handlers, level, propagate = list(root.handlers), root.level, root.propagate
+    yield
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+    root.propagate = propagate
+    for subsystem in ('library', 'dcf', 'nuclide', 'hc3', 'classification', 'session'):
+        get_logger(subsystem).setLevel(logging.NOTSET)
+
+
+def test_import_does_not_configure_logging():
+    code = ("import logging, hazcat_class, hazcat_session; root = logging.getLogger('hazcat'); "
+            "print([type(h).__name__ for h in root.handlers], root.propagate)")
+    out = subprocess.run([sys.executable, "-c", code], cwd=PACKAGE_DIR, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "['NullHandler'] True"
+
+
+def test_configure_logging_levels_and_json(tmp_path, capsys, restore_logging):
+    json_path = tmp_path / "log.jsonl"
+    configure_logging('WARNING,dcf=DEBUG', json_path=str(json_path))
+    get_logger('dcf').debug("screened %d tables", 11)
+    get_logger('hc3').info("hidden")
+    get_logger('hc3').warning("missing R", extra={'nuclide': 'Kr-85'})
+    assert capsys.readouterr().out.splitlines() == ["screened 11 tables", "WARNING: missing R"]
+    records = [json.loads(line) for line in json_path.read_text().splitlines()]
+    assert [r['logger'] for r in records] == ['hazcat.dcf', 'hazcat.hc3']
+    assert records[1]['nuclide'] == 'Kr-85'
+
+
+def test_configure_logging_rejects_unknown_subsystem(restore_logging):
+    with pytest.raises(ValueError, match="unknown logging subsystems"):
+        configure_logging(levels={'reactor': 'DEBUG'})
@@ -0,0 +1,14 @@
+import json
+
+from pyhazcat import run_batch
+
+
+def test_run_batch_reports_throughput_apart_from_warm_up(facility_config, tmp_path, capsys):
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.json").write_text(json.dumps(facility_config))
+    (tmp_path / "broken.json").write_text(json.dumps({**facility_config, "inventories": [1.0]}))
+    outcomes = run_batch(str(tmp_path), str(tmp_path), workers=1)
+    assert [ok for _, ok, _, _ in outcomes] == [True, True, False]
+    summary = capsys.readouterr().out.strip().splitlines()[-1]
+    assert summary.startswith("3 configs in ") and "configs/s) after a library warm-up of " in summary
+    assert summary.endswith("1 failed")
@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+import pytest
+
+from hazcat_kernels import HC3_PATHWAYS
+from hazcat_report import result_frame
+from pyhazcat import load_config, run_config
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Reports of the GUI pipeline (xgui.calculate_hazcat) before the results were structured; both writers must keep
+# producing them byte for byte
+GOLDEN_CONFIGS = ("mixed_inventory", "single_nuclide", "release_fractions")
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", GOLDEN_CONFIGS)
+def test_reports_match_golden_files(name, tmp_path):
+    config = load_config(os.path.join(DATA_DIR, f"{name}.json"))
+    text_path, csv_path = str(tmp_path / "out.txt"), str(tmp_path / "out.csv")
+    run_config(config, text_path, csv_path, use_cache=False)
+    assert read(text_path) == read(os.path.join(DATA_DIR, f"{name}_hazcat_out.txt"))
+    assert read(csv_path) == read(os.path.join(DATA_DIR, f"{name}_hazcat_out.csv"))
+
+
+def test_hazcat_result_is_consistent(facility_session):
+    result = facility_session.result
+    n = len(result.rads_list)
+    assert result.hc3.tq_curie.shape == (n, len(HC3_PATHWAYS))
+    np.testing.assert_array_equal(result.tq_hc3_curie, result.hc3.tq_curie.min(axis=1))
+    assert list(result.dominant_pathway) == [HC3_PATHWAYS[k] for k in np.argmin(result.hc3.tq_curie, axis=1)]
+    assert len(result.classification) == len(result.dcf_provenance) == n
+    # The SORs are the inventory-weighted sums of the inverse TQs
+    sor_hc2, sor_hc3 = result.sor_hazcat[:2]
+    assert sor_hc2 == pytest.approx(np.sum(result.inventories / result.tq_hc2_curie))
+    assert sor_hc3 == pytest.approx(np.sum(result.inventories / result.tq_hc3_curie))
+
+
+def test_result_frame_columns(facility_session):
+    df = result_frame(facility_session.result)
+    assert list(df.columns) == (["Radionuclide", "TQ HC-3 (Ci)", "TQ HC-3 (Gram)", "TQ HC-2 (Ci)", "TQ HC-2 (Gram)"]
+                                + list(HC3_PATHWAYS) + ["Dominant Pathway", "DCF Provenance"])
+    assert df.loc[df["Radionuclide"] == "Kr-85", "Dominant Pathway"].item() == "Submersion (Submersion)"
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hazcat_session import HazcatSession, SessionCache, session_result, session_key
+
+
+def test_session_cache_evicts_least_recently_used():
+    sessions = SessionCache(max_entries=2)
+    sessions.put('a', 1)
+    sessions.put('b', 2)
+    assert sessions.get('a') == 1
+    sessions.put('c', 3)
+    assert len(sessions) == 2
+    assert sessions.get('b') is None
+    assert sessions.get('a') == 1 and sessions.get('c') == 3
+
+
+def test_session_result_reuses_threshold_quantities(facility_config):
+    sessions = SessionCache(max_entries=1)
+    first = session_result(facility_config, cache=None, sessions=sessions)
+    scaled = {**facility_config, 'inventories': [2 * q for q in facility_config['inventories']]}
+    assert session_key(scaled) == session_key(facility_config)
+    second = session_result(scaled, cache=None, sessions=sessions)
+    assert len(sessions) == 1
+    np.testing.assert_array_equal(second.tq_hc2_curie, first.tq_hc2_curie)
+    np.testing.assert_array_equal(second.tq_hc3_curie, first.tq_hc3_curie)
+    assert second.sor_hazcat[:2] == pytest.approx([2 * sor for sor in first.sor_hazcat[:2]])
+
+
+def test_sum_of_ratios_matches_the_classification_of_each_scenario(facility_session, facility_config):
+    rng = np.random.default_rng(18)
+    inventory_matrix = np.asarray(facility_config['inventories']) * 10 ** rng.uniform(-4, 1, (12, 1))
+    frame = facility_session.sum_of_ratios(inventory_matrix)
+    assert list(frame.columns) == ['SOR HC-2 (DOE)', 'SOR HC-3 (DOE)', 'Category (DOE)',
+                                   'SOR HC-2 (HazCat)', 'SOR HC-3 (HazCat)', 'Category (HazCat)']
+    assert set(frame['Category (HazCat)']) == {'HC-2', 'HC-3', 'BELOW HC-3'}
+    for inventories, (_, row) in zip(inventory_matrix, frame.iterrows()):
+        result = facility_session.apply(inventories.tolist())
+        for label, sor in (('DOE', result.sor_doe), ('HazCat', result.sor_hazcat)):
+            assert row[f'SOR HC-2 ({label})'] == pytest.approx(sor[0], rel=1e-12)
+            assert row[f'SOR HC-3 ({label})'] == pytest.approx(sor[1], rel=1e-12)
+            category = row[f'Category ({label})']
+            assert f"categorized as {category}" in sor[2] if category != 'BELOW HC-3' else "BELOW HC-3" in sor[2]
+
+
+def test_sum_of_ratios_rejects_a_wrong_number_of_radionuclides(facility_session):
+    with pytest.raises(ValueError, match="inventory matrix"):
+        facility_session.sum_of_ratios(np.ones((3, len(facility_session.rads_list) + 1)))
+
+
+@pytest.fixture(scope="module")
+def co60_session():
+    return HazcatSession.from_config({'inventories': [1.0], 'rads_list': ['Co-60'], 'output_filename': None},
+                                     cache=None)
+
+
+def test_decay_timeline_without_progeny(co60_session):
+    (tq_hc3,) = co60_session.result.tq_hc3_curie
+    inventory = 100 * tq_hc3
+    lam = np.log(2) / co60_session.result.half_lives[0]
+    times = np.linspace(0, 10 / lam, 21)
+    timeline = co60_session.decay_timeline([inventory], times, t0="2024-01-01")
+    np.testing.assert_allclose(timeline.inventories[:, 0], inventory * np.exp(-lam * times), rtol=1e-12)
+    assert timeline.nuclides == ['Co-60']
+    assert list(timeline.frame['Time (s)']) == list(times)
+    assert timeline.frame['Date'].iloc[0] == pd.Timestamp("2024-01-01")
+    # A single exponential is linear in log(SOR): the interpolated crossing is exact
+    crossing = np.log(100) / lam
+    assert timeline.below_hc3['HazCat'] == pytest.approx(crossing, rel=1e-9)
+    assert timeline.below_hc3_date() == pd.Timestamp("2024-01-01") + pd.Timedelta(seconds=timeline.below_hc3['HazCat'])
+    before = timeline.frame['Time (s)'] < crossing
+    assert (timeline.frame.loc[before, 'Category (HazCat)'] != 'BELOW HC-3').all()
+    assert (timeline.frame.loc[~before, 'Category (HazCat)'] == 'BELOW HC-3').all()
+
+
+def test_decay_timeline_below_hc3_bounds(co60_session):
+    (tq_hc3,) = co60_session.result.tq_hc3_curie
+    times = [0.0, 86400.0]
+    assert co60_session.decay_timeline([0.5 * tq_hc3], times).below_hc3['HazCat'] == 0.0
+    assert co60_session.decay_timeline([1e6 * tq_hc3], times).below_hc3['HazCat'] is None
+    with pytest.raises(ValueError, match="increasing order"):
+        co60_session.decay_timeline([tq_hc3], [1.0, 0.0])
+
+
+def test_decay_timeline_with_progeny_ingrowth():
+    session = HazcatSession.from_config({'inventories': [1.0], 'rads_list': ['Sr-90'], 'output_filename': None},
+                                        cache=None)
+    times = np.array([0.0, 1e6, 1e7])
+    timeline = session.decay_timeline([1.0], times, progeny=True)
+    assert timeline.nuclides[:2] == ['Sr-90', 'Y-90']
+    strontium, yttrium = timeline.inventories[:, 0], timeline.inventories[:, 1]
+    assert yttrium[0] == 0.0 and strontium[0] == 1.0
+    # Y-90 (64 h) is in secular equilibrium with Sr-90 (28.8 y) after a few months
+    assert yttrium[-1] == pytest.approx(strontium[-1], rel=1e-3)
+    # The ingrown Y-90 counts towards the sum with its own threshold quantity
+    y90 = HazcatSession.from_config({'inventories': [1.0], 'rads_list': ['Y-90'], 'output_filename': None},
+                                    cache=None)
+    expected = strontium / session.result.tq_hc3_curie[0] + yttrium / y90.result.tq_hc3_curie[0]
+    np.testing.assert_allclose(timeline.frame['SOR HC-3 (HazCat)'], expected, rtol=1e-12)
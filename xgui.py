@@ -8,15 +8,21 @@ import tkinter as tk
 
 import numpy as np
 from hazcat_class import *
+from hazcat_report import nuclide_report_text, write_report_file, write_csv
+from hazcat_cache import result_cache
+from hazcat_library import DOE_TQ_WORKBOOK
+from hazcat_session import session_result
+from hazcat_logging import configure_logging, get_logger
 from tkinter import ttk
 from tkinter import *
 
 import json
 from tkinter import filedialog, messagebox
 
-# Copyright and Acknowledgment
-COPYRIGHT = "Copyright (c) 2024 Bhabha Atomic Research Centre, Mumbai, India"
-ACKNOWLEDGMENT = "This code is developed by Dr. Biswajit Sadhu, RS & ESS, HPD and supervised by Dr. S. Anand, Head, RS & ESS, HPD."
+# Pipeline messages go to the console, at the level of HAZCAT_LOG_LEVEL (INFO by default)
+configure_logging()
+library_log = get_logger('library')
+
 calculate_button = None  # ✅ Declare it globally before using it
 
 # Custom AutocompleteCombobox class
@@ -70,53 +76,6 @@ def get_float_list(RF_HC2_list_text):
             pass  # Ignore invalid elements
     return float_list
 
-def print_hazcat_output(rads_list, half_lives, dcfs_dicts_rads_list, aws, Rs_HC2,
-                        Rs_HC3, BVs, E1s, tq_hc2s, TQ_HC2s_gram,
-                                                  tq_hc3, TQ_HC3s_gram, dominant_pathway_text_list_hc3):
-    """
-    Calculates and displays radioisotope-specific output for all entries.
-
-    Args:
-      rads_list (list): List of radioisotope names (strings).
-      half_lives (list): List of corresponding half-life values (numbers).
-      inh_dcfs (list): List of inhalation dose conversion factors (numbers).
-      sub_dcfs (list): List of submersion dose conversion factors (numbers).
-      dcfs_ingestion (list): List of ingestion dose conversion factors (numbers).
-      aws (list): List of airborne release fractions (numbers).
-      Rs (list): List of release fractions (numbers).
-      BVs (list): List of breathing volumes (numbers).
-      E1s (list): List of gamma energy per disintegration values (numbers).
-      tq_hc2s (list): List of threshold quantities for HC2 (numbers).
-      tq_hc3 (list): List of threshold quantities for HC3 (numbers).
-
-    Raises:
-      ValueError: If the lengths of any lists don't match.
-    """
-    output_text = ""
-    # print('half_lives::::', half_lives)
-    for i in range(len(rads_list)):
-        isotope = rads_list[i]
-        output_text += f"Radionuclide: {isotope}\n"
-        output_text += f"  Half life (second): {half_lives[i]}\n"
-        output_text += f"  HC2: Inhalation dose conversion factor (Public) (Sv/Bq): {dcfs_dicts_rads_list[isotope]['max_dcf_inh_hc2']}\n"
-        output_text += f"  HC3: Inhalation dose conversion factor (Worker) (Sv/Bq): {dcfs_dicts_rads_list[isotope]['max_dcf_inh_hc3']}\n"
-        output_text += f"  HC2: Air Submersion Dose Coefficient (Sv/sec per Bq/m3): {dcfs_dicts_rads_list[isotope]['max_dcf_sub_hc2']}\n"
-        output_text += f"  HC3: Ingestion dose coefficient [Sv/Bq]: {dcfs_dicts_rads_list[isotope]['max_dcf_ing_hc3']}\n"
-        output_text += f"  Atomic Weight: {aws[i]}\n"
-        output_text += f"  Release fraction for computing Threshold for HC2: {Rs_HC2[i]}\n"
-        output_text += f"  Release fraction for computing Threshold for HC3: {Rs_HC3[i]}\n"
-        output_text += f"  Soil to Plant Concentration Factor: {BVs[i]}\n"
-        output_text += f"  Sum of the products of the photon energies and the photon fraction or intensities [MeV]: {E1s[i]}\n"
-        output_text += f"  Threshold quantity for HC2 (Curie): {tq_hc2s[i]}\n"
-        output_text += f"  Threshold quantity for HC2 (Gram): {TQ_HC2s_gram[i]}\n"
-        output_text += f"  Threshold quantity across all pathways for HC3 (Curie): {dominant_pathway_text_list_hc3[i]}\n"
-        output_text += f"  Threshold quantity for HC3 (Curie): {tq_hc3[i]}\n"
-        output_text += f"  Threshold quantity for HC3 (Gram): {TQ_HC3s_gram[i]}\n\n"
-
-    print(output_text)  # Or display the output text using your preferred method
-    return output_text
-
-
 def display_results(window, rads_list, tq_hc2s, tq_hc3, short_notes, doe_tqhc2_curies, doe_tqhc3_curies, sortext=None, sortext_hz = None):
     """
     Displays TQ (HC2) and TQ (HC3) information using Tkinter widgets.
@@ -291,60 +250,10 @@ def get_RVs_for_GUI():
     Rs_HC3 = hazcat.get_R_HC3()
     return Rs_HC2, Rs_HC3
 
-def write_hazcat_logo(f):
-    
-    letters = {
-                'A': [' *** ', '*   *', '*****', '*   *', '*   *'],
-                'B': ['**** ', '*   *', '**** ', '*   *', '**** '],
-                'C': [' ****', '*    ', '*    ', '*    ', ' ****'],
-                'D': ['**** ', '*   *', '*   *', '*   *', '**** '],
-                'E': ['*****', '*    ', '*****', '*    ', '*****'],
-                'F': ['*****', '*    ', '***  ', '*    ', '*    '],
-                'G': [' ****', '*    ', '*  **', '*   *', ' ****'],
-                'H': ['*   *', '*   *', '*****', '*   *', '*   *'],
-                'I': ['*****', '  *  ', '  *  ', '  *  ', '*****'],
-                'J': ['*****', '    *', '    *', '*   *', ' *** '],
-                'K': ['*   *', '*  * ', '**   ', '*  * ', '*   *'],
-                'L': ['*    ', '*    ', '*    ', '*    ', '*****'],
-                'M': ['*   *', '** **', '* * *', '*   *', '*   *'],
-                'N': ['*   *', '**  *', '* * *', '*  **', '*   *'],
-                'O': [' *** ', '*   *', '*   *', '*   *', ' *** '],
-                'P': ['**** ', '*   *', '**** ', '*    ', '*    '],
-                'Q': [' *** ', '*   *', '*   *', '*  **', ' ** *'],
-                'R': ['**** ', '*   *', '**** ', '*  * ', '*   *'],
-                'S': [' ****', '*    ', '**** ', '    *', '**** '],
-                'T': ['*****', '  *  ', '  *  ', '  *  ', '  *  '],
-                'U': ['*   *', '*   *', '*   *', '*   *', ' *** '],
-                'V': ['*   *', '*   *', '*   *', ' * * ', '  *  '],
-                'W': ['*   *', '*   *', '* * *', '** **', '*   *'],
-                'X': ['*   *', ' * * ', '  *  ', ' * * ', '*   *'],
-                'Y': ['*   *', ' * * ', '  *  ', '  *  ', '  *  '],
-                'Z': ['*****', '   * ', '  *  ', ' *   ', '*****'],
-            }
-
-    string = "HazCat"
-    f.write('\n')
-    f.write(
-        '###############################################################################################################################\n')
-    # f.write('\n')
-    for i in range(5):
-        for word in range(len(string)):
-            current_word = string[word].upper()
-            if word == len(string) - 1:
-                print(letters[current_word][i], file=f)
-
-            else:
-                print(letters[current_word][i], end='  ', file=f)
-    f.write(
-        '###############################################################################################################################\n')
-
 def calculate_hazcat():
     """Placeholder function for HAZCAT calculations. Replace with actual logic
     and display results using Tkinter widgets or other methods."""
     
-    # Prepare output string
-    ack_text = f"{COPYRIGHT}\n\n{ACKNOWLEDGMENT}\n\n"
-
     user_config = get_user_input()
     print('Configuration:', user_config)
 
@@ -369,180 +278,31 @@ def calculate_hazcat():
     if not filename:  # Check if the entry is empty
         filename = "hazcat_out.txt"
         
-    Rs_HC2 = user_config['Rs_HC2']
-    
-    Rs_HC3 = user_config['Rs_HC3']
     # Integrate HAZCAT calculations
-    hazcat = HAZCAT(user_config)
-    # NOW USES ICRP 103 RADIONUCLIDE DATA
-    half_lives = hazcat.halflives_lambda_rads_from_rads_list()[0]
-    # print('half_lives:', half_lives)
-
-    #####################
-    dcfs_dicts_rads_list = hazcat.get_dcfs_for_radionuclides()
-
-    # print(dcfs_dicts_rads_list)
-
-    ####################
-    # half_lives = hazcat.find_half_life_and_decay_const_radionuclides()[0]
-    # half_lives = np.array(half_lives)
-    #inh_dcfs_public_hc2 = hazcat.inhalation_dcf_list()
-    # inh_dcfs_worker_hc3 = hazcat.inhalation_dcf_list_worker()
-    # THIS IS FOR HC2 only (FGR 15), in HC3, submersion is only for inert gas.
-    # sub_dcfs = hazcat.dcf_list_ecerman_submersion_include_progeny()
-    aws = hazcat.find_aws()
-
-    if Rs_HC2 is None:
-        tq_hc2_revise = False
-        Rs_HC2 = hazcat.get_R_HC2()
-    else:
-        tq_hc2_revise = True
-        Rs_HC2_ini = hazcat.get_R_HC2()
-        r_factor_hc2 = np.array(Rs_HC2_ini)/np.array(Rs_HC2)
-        
-    if Rs_HC3 is None:
-        tq_hc3_revise = False
-        r_factor_hc3 = None
-        Rs_HC3 = hazcat.get_R_HC3()
-    else:
-        tq_hc3_revise = True
-        Rs_HC3_ini = hazcat.get_R_HC3()
-        r_factor_hc3 = np.array(Rs_HC3_ini)/np.array(Rs_HC3)
-        # print('rfactor:', np.array(Rs_HC3_ini), np.array(Rs_HC3), r_factor_hc3)
-
-    BVs = hazcat.get_bv()
-    # dcfs_ingestion = hazcat.dcf_list_ingestion()
-    # dcfs_ingestion = hazcat.ingestion_dcf_list_worker()
-    # gamma = hazcat.gamma_energy_abundaces()
-    # E1s = hazcat.get_E1(gamma)
-    E1s = hazcat.get_E1_from_TableA1_ICRP_107()
-    # inha_dcfs = hazcat.inhalation_dcf_list()
-    
-    ###### HAZCAT COMPUTED VALUES ##########################
-    # print('half_lives:::', half_lives)
-    
-    # COMPUTE TQ-HC2 with HazCat code
-    tq_hc2s, TQ_HC2s_gram = hazcat.compute_threshold_quantity_HC2_in_gram_and_curie(Rs_HC2, aws,
-                                                                                    half_lives,
-                                                                                    dcfs_dicts_rads_list)
-    # COMPUTE TQ-HC3 with HazCat code
-    tq_hc3, TQ_HC3s_gram, dominant_pathway_text_list_hc3 = hazcat.compute_inhalation_threshold_quantity_HC3_in_gram_and_curie(Rs_HC3, aws, 
-                                                                       BVs, half_lives, 
-                                                                       E1s, dcfs_dicts_rads_list, r_factor_hc3 = r_factor_hc3,
-                                                                       CHI_BY_Q = 7.2e-02)
-
-    ######## US-DOE-TABLE BASED CLASSIFICATION ############
-    with open(filename, "w") as output_file:      
-        write_hazcat_logo(output_file)
-        # acknowledgement
-        output_file.write(ack_text)
-        # table check
-        short_notes = []
-        doe_tqhc2_curies = []
-        doe_tqhc3_curies = []
-        doe_pathway = []
-        doe_tqhc2_gms = []
-        doe_tqhc3_gms = []
-        for odx, (inv, rad) in enumerate(zip(inventories, rads_list)):
-            df_tq = hazcat.read_us_doe_std_1027_2018(rad)
-            best_pathway = df_tq.Limiting_Pathway.item()
-            doe_pathway.append(best_pathway)
-            doe_tqhc2_curie, doe_tqhc2_gm, doe_tqhc3_curie, doe_tqhc3_gm = df_tq.HC2_Curies.item(), df_tq.HC2_Grams.item(), df_tq.HC3_Curies.item(),  df_tq.HC3_Grams.item()  
-            doe_tqhc2_curies.append(doe_tqhc2_curie)
-            doe_tqhc2_gms.append(doe_tqhc2_gm)
-            doe_tqhc3_curies.append(doe_tqhc3_curie)
-            doe_tqhc3_gms.append(doe_tqhc3_gm)
-            # Perform hazard classification based on inventory and precomputed values
-            notes, short_note = hazcat.write_hazcat_classification_and_dose(df_tq, inv, rad)
-            output_file.write(notes)
-            short_notes.append(short_note)
-        
-        #######################################################
-        out_all = print_hazcat_output(rads_list, half_lives, dcfs_dicts_rads_list, aws, Rs_HC2, Rs_HC3, BVs, E1s, tq_hc2s, TQ_HC2s_gram,
-                                                  tq_hc3, TQ_HC3s_gram, dominant_pathway_text_list_hc3)
-    
-        output_file.write(out_all)
-        # US-DOE-TABLE based Sum of Ratio output
-        ## SUM OF RATIO ###
-        if len(rads_list) > 1:
-            sorhc2, sorhc3, sortext = hazcat.sum_of_ratio()
-            # print('DOE_SOR:', sorhc2, sorhc3, sortext)
-            output_file.write(sortext)
-            sorhc2_hz, sorhc3_hz, sortext_hz = hazcat.sum_of_ratio_hazcat(tq_hc2s, tq_hc3)
-            # print('HazCat_SOR:', sorhc2_hz, sorhc3_hz, sortext_hz)
-            output_file.write(sortext_hz)
-        print(f"Results saved to: {filename}")
-    
-    # Example usage (assuming window is a Tk() instance):
+    # the thresholds of a previous run with the same radionuclides are reused; only the inventory is re-applied
+    result = session_result(user_config)
+
+    write_report_file(result, filename)
+    print(nuclide_report_text(result))
+    print(f"Results saved to: {filename}")
+
     ### SAVE AS CSV ############################################
-    # Function to format values with DOE reference in parentheses
-    def format_with_doe(value, doe_value):
-        return f"{value:.4e} ({doe_value:.4e})"
-
-    # Function to extract pathway values
-    def extract_values(text):
-        pathways = {
-            "Inhalation": np.nan,
-            "Food ingestion": np.nan,
-            "Water ingestion": np.nan,
-            "Direct exposure": np.nan,
-            "Submersion": np.nan,
-            "Dominant Pathway": np.nan
-        }
-
-        matches = re.findall(r"(\w+(?: \w+)*): ([\d.e+-]+|inf) Ci", text)
-        for key, value in matches:
-            pathways[key] = np.nan if value == "inf" else float(value)
-
-        # Extract dominant pathway
-        dom_match = re.search(r"Dominant Pathway.*?:\s*(\w+)", text)
-        if dom_match:
-            pathways["Dominant Pathway"] = dom_match.group(1)
-
-        return pathways
-
-    # Extract values for all radionuclides
-    pathway_data = [extract_values(text) for text in dominant_pathway_text_list_hc3]
-
-    # Convert pathway data to DataFrame
-    df_pathways = pd.DataFrame(pathway_data)
-
-    # Add DOE pathway in parentheses
-    df_pathways["Dominant Pathway"] = [
-        f"{dom} ({doe})" for dom, doe in zip(df_pathways["Dominant Pathway"], doe_pathway)
-    ]
-
-    # Create main DataFrame with TQ values and Radionuclide column
-    df_main = pd.DataFrame({
-        "Radionuclide": rads_list,
-        "TQ HC-3 (Ci)": [format_with_doe(tq, doe) for tq, doe in zip(tq_hc3, doe_tqhc3_curies)],
-        "TQ HC-3 (Gram)": [format_with_doe(tq, doe) for tq, doe in zip(TQ_HC3s_gram, doe_tqhc3_gms)],
-        "TQ HC-2 (Ci)": [format_with_doe(tq, doe) for tq, doe in zip(tq_hc2s, doe_tqhc2_curies)],
-        "TQ HC-2 (Gram)": [format_with_doe(tq, doe) for tq, doe in zip(TQ_HC2s_gram, doe_tqhc2_gms)]
-    })
-
-    # Combine both DataFrames, ensuring Radionuclide and TQ values come first
-    df_final = pd.concat([df_main, df_pathways], axis=1)
-
-    # Save to CSV
     output_filename = "hazcat_output.csv"
-    df_final.to_csv(output_filename, index=False)
+    write_csv(result, output_filename)
 
     print(f"Results saved to {output_filename}")
-
+    library_log.debug("Library cache: %s", library_cache)
+    library_log.debug("Result cache: %s", result_cache)
 
     ############################################################
-    if len(rads_list) > 1:
-        display_results_with_scrollbar(window, rads_list, tq_hc2s, tq_hc3, short_notes, doe_tqhc2_curies, doe_tqhc3_curies, sortext=sortext, sortext_hz = sortext_hz)
-        #display_results(window, rads_list, tq_hc2s, tq_hc3, short_notes, doe_tqhc2_curies, doe_tqhc3_curies, sortext=sortext, sortext_hz = sortext_hz)
-    else:
-        display_results_with_scrollbar(window, rads_list, tq_hc2s, tq_hc3, short_notes, doe_tqhc2_curies, doe_tqhc3_curies, sortext=None, sortext_hz = None)    
-        #display_results(window, rads_list, tq_hc2s, tq_hc3, short_notes, doe_tqhc2_curies, doe_tqhc3_curies, sortext=None, sortext_hz = None)    
+    sortext = result.sor_doe[2] if result.sor_doe else None
+    sortext_hz = result.sor_hazcat[2] if result.sor_hazcat else None
+    display_results_with_scrollbar(window, rads_list, result.tq_hc2_curie, result.tq_hc3_curie, result.classification,
+                                   result.doe_hc2_curie, result.doe_hc3_curie, sortext=sortext, sortext_hz=sortext_hz)
     
 # Radionuclide list
 def get_rads_list_from_doe():
-    xls = pd.ExcelFile("library/doe_haz_cat_excel.xlsx")
-    df_tq = pd.read_excel(xls, sheet_name='thresholds')
+    df_tq = library_cache.read_excel(DOE_TQ_WORKBOOK, sheet_name='thresholds')
     df_tq.dropna(axis=0, how='all', inplace=True)
     list_of_rads = df_tq['Radionuclide'].to_list()
     return list_of_rads